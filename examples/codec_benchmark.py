@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+
+import os
+import sys
+import struct
+import timeit
+
+# In case 'scom' package is not installed, try to work with local source files.
+# You may need to build extension modules 'baseframe' and 'property' using the
+# 'scripts/build-scomlib.sh' script.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(sys.argv[0]), '../src')))
+
+from sino.scom import codec
+from sino.scom import pybaseframe, pyproperty
+from sino.scom.simulator import DeviceSimulator
+
+"""
+Example comparing the encode and decode rates of the extension modules
+(baseframe, property) with the pure Python codec (pybaseframe, pyproperty).
+
+Ex.:
+    python codec_benchmark.py --number 10000
+"""
+
+
+def measure(baseframe, property, data, number):
+    """Returns the number of read requests encoded and read responses decoded per second.
+    """
+    frame = baseframe.BaseFrame(32)
+    prop = property.Property(frame)
+
+    def encode():
+        frame.initialize(src_addr=1, dest_addr=101)
+        prop.set_object_read(1, 3000, 1)
+
+    def decode():
+        frame.initialize_using_bytearray(data, len(data))
+        property.decode_read_response(frame, 'float')
+
+    return [number / timeit.timeit(function, number=number) for function in (encode, decode)]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmarks the SCOM frame and property codecs')
+    parser.add_argument('--number', type=int, default=2000, help='Number of frames to encode and decode')
+    args = parser.parse_args()
+
+    service_header = struct.pack('<HIH', 1, 3000, 1)
+    data = DeviceSimulator.encode_response(101, 1, 1, service_header, struct.pack('<f', -12.25))
+
+    codecs = [('Python', pybaseframe, pyproperty)]
+    if codec.extension_modules_present:
+        from sino.scom import baseframe, property
+        codecs.insert(0, ('C', baseframe, property))
+    else:
+        print('Extension modules not built. Measuring the pure Python codec only')
+
+    for name, baseframe, property in codecs:
+        encode_rate, decode_rate = measure(baseframe, property, data, args.number)
+        print('%s: Encode %.0f/s, Decode %.0f/s' % (name, encode_rate, decode_rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+
+import time
+import sys
+import os
+import logging
+import threading
+
+# In case 'scom' package is not installed, try to work with local source files.
+# You may need to build extension modules 'baseframe' and 'property' using the
+# 'scripts/build-scomlib.sh' script.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(sys.argv[0]), '../src')))
+
+from sino import scom
+from sino.scom.simulator import DeviceSimulator
+
+# Enable logging
+logging.basicConfig(format='%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s',
+                    datefmt='%Y-%m-%d %H:%M:%S', level=logging.WARNING)
+
+"""
+Example showing how to benchmark the DeviceManager and the device read
+paths without hardware using the DeviceSimulator.
+
+The simulator provides a few virtual Xtenders and a BSP. Bus conditions
+are given on the command line. Ex.:
+    python simulator_benchmark.py --latency 0.02 --jitter 0.01 --drop-rate 0.01
+"""
+
+# Bus conditions
+conditions = {'latency': 0.005, 'jitter': 0.0, 'drop_rate': 0.0, 'corruption_rate': 0.0}
+
+address_scan_info = {'xtender': [101, 109], 'bsp': [601, 601]}
+
+
+class ScomDevicesObserver(scom.dman.DeviceSubscriber):
+    """Receives device notifications if DeviceManager finds Studer devices.
+    """
+    def __init__(self, expected_devices):
+        super(ScomDevicesObserver, self).__init__()
+        self.devices = []
+        self._expected_devices = expected_devices
+        self.all_found = threading.Event()
+
+        scom.dman.DeviceManager.instance().subscribe(self)
+
+    def on_device_connected(self, device):
+        self.devices.append(device)
+        if len(self.devices) == self._expected_devices:
+            self.all_found.set()
+
+    def on_device_disconnected(self, device):
+        pass
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmarks the SCOM library using simulated devices')
+    for name, value in conditions.items():
+        parser.add_argument('--' + name.replace('_', '-'), type=float, default=value)
+    parser.add_argument('--reads', type=int, default=200, help='Number of user infos to read')
+    args = parser.parse_args()
+
+    simulator, transport = DeviceSimulator.create_loopback(latency=args.latency, jitter=args.jitter,
+                                                           drop_rate=args.drop_rate,
+                                                           corruption_rate=args.corruption_rate)
+    for address in (101, 102, 103):
+        simulator.add_device('xtender', address).set_user_info('batteryVoltage', 48.0 + address - 100)
+    simulator.add_device('bsp', 601)
+    simulator.start()
+
+    studer_com = scom.Scom()
+    studer_com.initialize(transport)
+
+    # Device search
+    start_time = time.monotonic()
+    scom.dman.DeviceManager(scom=studer_com, address_scan_info=address_scan_info,
+                            control_interval_in_seconds=60.0)
+    devices_observer = ScomDevicesObserver(expected_devices=len(simulator.devices))
+    if devices_observer.all_found.wait(60):
+        print('Search: %d devices found in %.3f s' % (len(devices_observer.devices),
+                                                      time.monotonic() - start_time))
+    else:
+        print('Search: Only %d devices found' % len(devices_observer.devices))
+
+    # Read path
+    xtenders = [device for device in devices_observer.devices if device.device_type == scom.Device.SD_XTENDER]
+    failures = 0
+    start_time = time.monotonic()
+    for index in range(args.reads):
+        try:
+            xtenders[index % len(xtenders)].get_battery_voltage()
+        except Exception:
+            failures += 1
+    elapsed = time.monotonic() - start_time
+    print('Reads: %d in %.3f s (%.1f reads/s, %d failed)' % (args.reads, elapsed, args.reads / elapsed, failures))
+    print('Simulator: %d requests, %d dropped, %d corrupted' % (simulator.requests, simulator.dropped,
+                                                               simulator.corrupted))
+    print('Scom: %d RX errors, %d orphan frames' % (studer_com.rxErrors, studer_com.orphanFrames))
+    for address, estimator in sorted(studer_com.rtt_estimates.items()):
+        print('  #%d: %s' % (address, estimator))
+
+    scom.dman.DeviceManager.instance().stop()
+    simulator.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -9,7 +9,8 @@ try:
     cython_present = True
 except ImportError:
     cython_present = False
-    print('Warning: Cython package not available. Extension packages will not be build!')
+    print('Warning: Cython package not available. Extension packages will not be build! '
+          'The pure Python codec (slower) is used instead.')
     from distutils.command.build_ext import build_ext
 import atexit
 import shutil
@@ -37,6 +38,26 @@ def read_version_info():
 sys.path.append(os.path.abspath('./src'))
 __version__ = read_version_info()
 
+is_windows = platform.system() in ('Windows', 'win32', 'win64')
+
+ext_modules = [Extension("baseframe", ["src/sino/scom/baseframe.pyx",
+                                       "src/sino/scom/scomlib/scom_data_link.c"],
+                         include_dirs=['src/sino/scom'],
+                         language="c++",),
+               Extension("property", ["src/sino/scom/property.pyx",
+                                      "src/sino/scom/scomlib/scom_property.c",
+                                      "src/sino/scom/scomlib/scom_data_link.c"],
+                         include_dirs=['src/sino/scom'],
+                         language="c++",)]
+
+if not is_windows:
+    # Optional native read transactions (uses poll() and file descriptors)
+    ext_modules.append(Extension("transaction", ["src/sino/scom/transaction.pyx",
+                                                 "src/sino/scom/scomlib/scom_property.c",
+                                                 "src/sino/scom/scomlib/scom_data_link.c"],
+                                 include_dirs=['src/sino/scom'],
+                                 language="c++",))
+
 current_directory = os.path.abspath(os.path.dirname(__file__))
 with open(os.path.join(current_directory, 'README.md'), encoding='utf-8') as f:
     long_description = f.read()
@@ -81,7 +102,7 @@ class PostInstallCommand(install):
 
             def find_lib_bath(path, lib_name):
                 # Check if we need to copy '.pyd' files (on Windows) or '.so' files (on Linux and macOS)
-                lib_ext = '.pyd' if platform.system() in ('Windows', 'win32', 'win64') else '.so'
+                lib_ext = '.pyd' if is_windows else '.so'
                 for root, dirs, files in os.walk(path):
                     for file in files:
                         if file.startswith(lib_name) and file.endswith(lib_ext):
@@ -132,6 +153,17 @@ class PostInstallCommand(install):
                     shutil.copy(property_lib_path_and_name, lib_move_path + '/')
                 else:
                     print('Error: Could not find \'%s\' extension module!' % ext_module_name)
+
+                if not is_windows:
+                    ext_module_name = 'transaction'
+                    # Searching transaction library (optional, POSIX only) which was build in the build path
+                    success, transaction_lib_path_and_name = find_lib_bath(tmp_build_path, ext_module_name)
+                    if success:
+                        print('Found: %s' % transaction_lib_path_and_name)
+                        print('Copy %s to %s' % (transaction_lib_path_and_name, lib_move_path + '/'))
+                        shutil.copy(transaction_lib_path_and_name, lib_move_path + '/')
+                    else:
+                        print('Warning: Could not find \'%s\' extension module!' % ext_module_name)
             else:
                 print('Error: Site-package path not found!')
 
@@ -151,18 +183,12 @@ setup(
                   },
 
     setup_requires=['setuptools', 'Cython'],
+    extras_require={'numpy': ['numpy']},       # Batch decoding into structured arrays
 
     packages=find_packages('src'),
     package_dir={'sino': 'src/sino'},
 
-    ext_modules=[Extension("baseframe", ["src/sino/scom/baseframe.pyx",
-                                         "src/sino/scom/scomlib/scom_data_link.c"],
-                           include_dirs=['src/sino/scom'],
-                           language="c++",),
-                 Extension("property", ["src/sino/scom/property.pyx",
-                                        "src/sino/scom/scomlib/scom_property.c"],
-                           include_dirs=['src/sino/scom'],
-                           language="c++",)],
+    ext_modules=ext_modules,
 
     include_dirs=['src/sino/scom', ],
 
@@ -172,7 +198,9 @@ setup(
     package_data={'sino': ['scom/scomlib/*.*',
                            'scom/baseframe.pxd',
                            'scom/baseframe.pyx',
-                           'scom/property.pyx'],
+                           'scom/property.pyx',
+                           'scom/decoder.pxd',
+                           'scom/transaction.pyx'],
                   },
 
     license='MIT',
@@ -13,6 +13,8 @@ version = version.__version__
 from .defines import *       # To get defines like OBJECT_TYPE_READ_USER_INFO and PROPERTY_ID_READ into the scom namespace
 from . import frame
 from .scom import Scom
+from .asyncscom import AsyncScom
+from .busdispatcher import BusDispatcher
 from . import dman
 from . import device
 from .device.scomdevice import ScomDevice as Device
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import time
+import logging
+from .defines import PROPERTY_ID_READ
+from .exception import TransportException
+from .codec import BaseFrame
+from .capture import Capture
+from .trace import HexFrame
+from .frame import Frame
+from .scom import Scom
+
+
+class AsyncScom(Scom):
+    """Handles the SCOM connection using an asyncio event loop.
+
+    Same as Scom, but adds the coroutines write_frame_async() and read_property(). The
+    transport is watched by the event loop (see loop.add_reader()), so no
+    thread gets blocked while waiting for a response. The event loop used
+    must support add_reader() (ex. the selector event loop on POSIX systems)
+    and the transport needs to provide a file descriptor.
+
+    The coroutines share the bus with the synchronous methods (write_frame(), etc.) called
+    by other threads: Each request holds the mutex of the Scom and the transport is only
+    watched while a coroutine awaits its response.
+
+    Devices get access to the AsyncScom the same way as for Scom
+    (ex. Xtender.class_initialize(async_scom)) and can then be used with
+    the ScomDevice coroutines (read_user_info_async(), read_parameter_async(), etc.).
+    """
+
+    MUTEX_POLL_INTERVAL = 0.005     # Time in seconds between attempts to lock the mutex of the Scom
+
+    log = logging.getLogger(__name__)
+
+    def __init__(self):
+        super(AsyncScom, self).__init__()
+        self._loop = None           # type: asyncio.AbstractEventLoop or None
+        self._lock = None           # type: asyncio.Lock or None
+        self._rx_event = None       # type: asyncio.Event or None
+
+    def _attach(self):
+        """Binds the AsyncScom to the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._rx_event = asyncio.Event()
+
+    def _detach(self):
+        self._loop = None
+
+    async def _acquire_mutex(self, timeout: float) -> bool:
+        """Locks the mutex shared with the synchronous callers without blocking the event loop.
+        """
+        deadline = time.monotonic() + timeout
+        while not self._mutex.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(self.MUTEX_POLL_INTERVAL)
+        return True
+
+    def _on_readable(self):
+        """Called by the event loop whenever data is available on the transport.
+        """
+        try:
+            # Never block. Reads are done when the event loop tells data is available
+            data = self._transport.read(4096, 0)
+        except TransportException:
+            self.log.error('Error reading from transport!')
+            self.dump_flight_recorder()
+            self._loop.remove_reader(self._transport.fileno())
+            return
+
+        if data:
+            self._parser.feed(data)
+            self._rx_event.set()
+
+    async def write_frame_async(self, frame: BaseFrame, rx_timeout_in_seconds: float = None,
+                                priority: int = None) -> Frame or None:
+        """Writes a frame to the SCOM interface and awaits the response frame.
+
+        Same as write_frame(), which stays blocking for synchronous callers (ex. DeviceManager).
+
+        :param frame Frame to send.
+        :type frame Frame
+        :param rx_timeout_in_seconds Maximum time to wait for the response frame. If not given,
+                                     the timeout is taken from the RTT estimation of the
+                                     destination device or the default rx timeout is used.
+        :type rx_timeout_in_seconds float
+        :param priority Not used. Present for compatibility with Scom.write_frame()
+        """
+        if not self._transport:
+            return None
+
+        self._attach()
+
+        rtt_estimator = self._get_rtt_estimator(frame.dst_addr())
+        rx_timeout_in_seconds = self._response_timeout(frame.dst_addr(), rx_timeout_in_seconds)
+
+        self.log.debug('TX: %s', HexFrame(frame))
+        buffer = frame.copy_buffer()
+
+        deadline = time.monotonic() + self.MUTEX_TIMEOUT
+        try:
+            await asyncio.wait_for(self._lock.acquire(), self.MUTEX_TIMEOUT)        # lock
+        except asyncio.TimeoutError:
+            self.log.error('Could not lock mutex!')
+            return Frame()
+
+        # Synchronous callers (other threads) use the bus too
+        if not await self._acquire_mutex(deadline - time.monotonic()):
+            self._lock.release()
+            self.log.error('Could not lock mutex!')
+            return Frame()
+
+        # Transport is only read by the event loop while the bus is held
+        self._loop.add_reader(self._transport.fileno(), self._on_readable)
+        try:
+            try:
+                self._discard_stale_frames()
+                self._transport.write(buffer)
+                self._capture_frame(Capture.DIRECTION_TX, buffer)
+            except TransportException:
+                self.log.error('Error writing frame!')
+                self.dump_flight_recorder()
+
+            # Time to wait for the response starts after the frame is written
+            start_time = time.monotonic()
+            rx_errors = self.rxErrors
+            response_frame = await self._read_response_async(buffer, wait_time=float(rx_timeout_in_seconds))
+            self._capture_response(response_frame, rx_errors)
+            if response_frame is not None:
+                rtt_estimator.update(time.monotonic() - start_time)
+            else:
+                rtt_estimator.timeout()
+        finally:
+            self._loop.remove_reader(self._transport.fileno())
+            self._mutex.release()
+            self._lock.release()       # unlock
+
+        return response_frame
+
+    async def read_property(self, dst_addr: int, object_type: int, object_id: int,
+                            property_id: int = PROPERTY_ID_READ,
+                            rx_timeout_in_seconds: float = None) -> bytearray or None:
+        """Reads a property of a device and returns its value.
+
+        Ex.: await scom.read_property(101, OBJECT_TYPE_READ_USER_INFO, 3000)
+
+        :return The value as bytearray or None if no valid response was received
+        """
+        request_frame = self._frame_pool.acquire()
+        request_frame.initialize(src_addr=1, dest_addr=dst_addr)
+        request_frame.get_property().set_object_read(object_type, object_id, property_id)
+
+        response_frame = await self.write_frame_async(request_frame, rx_timeout_in_seconds)
+        value = None
+
+        if response_frame and response_frame.is_valid():
+            value_size = response_frame.response_value_size()
+            value = response_frame[24:24 + value_size]
+
+        self._frame_pool.release(request_frame)
+        self._frame_pool.release(response_frame)
+        return value
+
+    async def _read_response_async(self, request: bytearray, wait_time=1.0) -> Frame or None:
+        """Awaits the response to the request. Frames not matching the request are discarded.
+
+        See Scom._read_response()
+        """
+        deadline = time.monotonic() + wait_time
+
+        while True:
+            response_frame = await self._read_frame_async(wait_time=max(deadline - time.monotonic(), 0))
+            if response_frame is None or self._is_response_to(request, response_frame):
+                return response_frame
+
+            self.orphanFrames += 1
+            self._capture_frame(Capture.DIRECTION_RX, response_frame.copy_buffer(), Capture.OUTCOME_ORPHAN)
+            self.log.warning('Discarding frame not matching request: %s', HexFrame(response_frame))
+            self._frame_pool.release(response_frame)
+
+    async def _read_frame_async(self, wait_time=1.0) -> Frame or None:
+        """Awaits a frame from the SCOM interface
+
+        See Scom._read_frame()
+        """
+        deadline = time.monotonic() + wait_time
+        rx_errors = self._parser.errors
+
+        response_frame = self._parser.next_frame()
+        while response_frame is None:
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
+            self._rx_event.clear()
+            try:
+                await asyncio.wait_for(self._rx_event.wait(), remaining_time)
+            except asyncio.TimeoutError:
+                break
+            response_frame = self._parser.next_frame()
+
+        return self._frame_received(response_frame, rx_errors)
+
+    def close(self):
+        self._detach()
+        super(AsyncScom, self).close()
@@ -5,7 +5,7 @@
 
 from libc.stdint cimport uintptr_t
 
-cdef extern from "scomlib/scom_data_link.h":
+cdef extern from "scomlib/scom_data_link.h" nogil:
     cdef int SCOM_FRAME_HEADER_SIZE             # Is in fact a define which cannot be brought into cython!
 
     ctypedef enum scom_error_t:
@@ -80,3 +80,7 @@ cdef extern from "scomlib/scom_data_link.h":
 #
 cdef class BaseFrame:
     cdef scom_frame_t cFrame
+    cdef Py_ssize_t _view_shape[1]      # Shape of the memoryview exported (see __getbuffer__)
+    cdef int _view_count                # Number of memoryviews exported
+
+    cdef Py_ssize_t _view_length(self)
@@ -3,7 +3,9 @@
 # distutils: language = c++
 #
 
-from libc.stdlib cimport malloc, free
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport memcpy
+from cpython.bytearray cimport PyByteArray_FromStringAndSize
 from baseframe cimport *
 
 #
@@ -14,6 +16,9 @@ from baseframe cimport *
 #
 cdef class BaseFrame:
     """Provides low-level functionality for an SCOM Frame
+
+    Implements the buffer protocol: memoryview(frame) gives access to the
+    frame bytes (see frame_length()) without copying them.
     """
 
     def __init__(self, size_t buffer_size):
@@ -33,6 +38,14 @@ cdef class BaseFrame:
         # Write frame attributes into buffer
         self.encode_request()
 
+    def reset(self):
+        """Resets the frame attributes (ex. before reusing the frame). The buffer is kept."""
+        self.cFrame.src_addr = 0
+        self.cFrame.dst_addr = 0
+        self.cFrame.data_length = 0
+        self.cFrame.service_id = SCOM_READ_PROPERTY_SERVICE
+        self.cFrame.last_error = SCOM_ERROR_NO_ERROR
+
     def encode_request(self):
         """Writes the frame attributes into the buffer."""
         # Call c library to do it
@@ -40,11 +53,16 @@ cdef class BaseFrame:
 
     def initialize_using_bytearray(self, byte_array: bytearray or bytes, array_size: int):
         """Initializes the frame using the content of a byte array."""
-        index = 0
+        cdef const unsigned char[::1] source = byte_array
+
+        if array_size < 0 or <size_t>array_size > <size_t>source.shape[0]:
+            raise ValueError('Array size exceeds the byte array given!')
+        if <size_t>array_size > self.cFrame.buffer_size:
+            raise ValueError('Buffer is too small!')
+
         # Copy byte array into c array
-        while index < array_size:
-            self.cFrame.buffer[index] = byte_array[index]
-            index += 1
+        if array_size:
+            memcpy(self.cFrame.buffer, &source[0], array_size)
 
         decode_frame_header(self)
 
@@ -70,36 +88,96 @@ cdef class BaseFrame:
 
     def buffer_as_hex_string(self) -> str:
         """Returns frame buffer as HEX string"""
-        index = 0
-        string = ''
-        while index < self.frame_length():
-            # Convert each byte in buffer to hex
-            string += '{:02X} '.format(self.cFrame.buffer[index])
-            index += 1
-        return string[:-1]   # Omit last space character
-
-    def set_data_length(self, data_length: int):
-        """Sets the data_length field of the frame"""
+        return self.cFrame.buffer[:self._view_length()].hex(' ').upper()
+
+    def set_data_length(self, data_length: int, encode: bool = True):
+        """Sets the data_length field of the frame
+
+        :param encode If False, only the attribute is set. The buffer is left untouched.
+        """
         self.cFrame.data_length = data_length
 
-        assert self.cFrame.buffer_size >= self.frame_length(), 'Buffer is too small!'
+        if encode:
+            assert self.cFrame.buffer_size >= self.frame_length(), 'Buffer is too small!'
 
-        encode_request_frame(self)
+            encode_request_frame(self)
 
     def data_length(self) -> int:
         return self.cFrame.data_length
 
+    def buffer_size(self) -> int:
+        return self.cFrame.buffer_size
+
+    def resize_buffer(self, size_t buffer_size):
+        """Changes the size of the frame buffer. The content is kept (as far as it fits).
+
+        Property objects created before using this frame must not be used anymore.
+        """
+        if self._view_count:
+            raise BufferError('Cannot resize frame buffer while it is exported')
+
+        cdef unsigned char * buffer = <unsigned char *>realloc(self.cFrame.buffer, buffer_size)
+        if buffer == NULL:
+            raise MemoryError()
+        self.cFrame.buffer = buffer
+        self.cFrame.buffer_size = buffer_size
+
+    def src_addr(self) -> int:
+        return self.cFrame.src_addr
+
+    def dst_addr(self) -> int:
+        return self.cFrame.dst_addr
+
     def print_cframe(self):
         print(self.cFrame)
 
     def copy_buffer(self) -> bytearray:
         """Copies the frame buffer into a python byte array"""
-        index = 0
-        buffer = bytearray()
-        while index < self.frame_length():
-            buffer.append(self.cFrame.buffer[index])
-            index += 1
-        return buffer
+        return PyByteArray_FromStringAndSize(<char *>self.cFrame.buffer, self._view_length())
+
+    cdef Py_ssize_t _view_length(self):
+        """Returns the number of bytes of the frame (limited to the buffer size)."""
+        frame_length = SCOM_FRAME_HEADER_SIZE + self.cFrame.data_length + 2
+        return min(frame_length, self.cFrame.buffer_size)
+
+    def __getitem__(self, item):
+        """Returns a byte (or a bytearray for slices) of the frame."""
+        cdef Py_ssize_t length = self._view_length()
+        cdef Py_ssize_t index, start, stop, step
+
+        if isinstance(item, slice):
+            start, stop, step = item.indices(length)
+            if step == 1:
+                return PyByteArray_FromStringAndSize(<char *>&self.cFrame.buffer[start], max(stop - start, 0))
+            return PyByteArray_FromStringAndSize(<char *>self.cFrame.buffer, length)[item]
+
+        index = item
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError('Frame index out of range')
+        return self.cFrame.buffer[index]
+
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        if self.cFrame.buffer == NULL:
+            raise BufferError('Frame has no buffer')
+
+        self._view_shape[0] = self._view_length()
+        view.buf = self.cFrame.buffer
+        view.obj = self
+        view.len = self._view_shape[0]
+        view.readonly = 0
+        view.itemsize = 1
+        view.format = 'B'
+        view.ndim = 1
+        view.shape = self._view_shape
+        view.strides = NULL
+        view.suboffsets = NULL
+        view.internal = NULL
+        self._view_count += 1
+
+    def __releasebuffer__(self, Py_buffer *view):
+        self._view_count -= 1
 
     def is_valid(self) -> bool:
         if self.last_error() == SCOM_ERROR_NO_ERROR:
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+#
+
+import itertools
+import logging
+import queue
+import time
+from concurrent.futures import Future
+from threading import Thread, Lock, get_ident
+
+
+class BusDispatcher(object):
+    """Executes all transactions of a SCOM interface in a single thread.
+
+    Requests are queued in priority classes. Requests with a higher priority
+    (lower value) are always executed first. Requests of the same priority are
+    executed in the order they were submitted. This way, a control write does
+    not need to wait until all queued telemetry reads are done.
+
+    Every request submitted returns a Future giving access to the response frame.
+    Functions executing many transactions back-to-back (ex. Scom.read_property_values())
+    are queued as one request using submit_call().
+    """
+
+    PRIORITY_CONTROL = 0            # Writes to control the devices
+    PRIORITY_TELEMETRY = 1          # Reading measurements and parameters
+    PRIORITY_DISCOVERY = 2          # Searching for devices
+
+    priority_names = {PRIORITY_CONTROL: 'control',
+                      PRIORITY_TELEMETRY: 'telemetry',
+                      PRIORITY_DISCOVERY: 'discovery'}
+
+    _STOP_PRIORITY = -1             # Priority of the request telling the thread to stop
+
+    log = logging.getLogger(__name__)
+
+    def __init__(self, scom):
+        """
+        :param scom The SCOM interface on which to execute the transactions
+        :type scom Scom
+        """
+        super(BusDispatcher, self).__init__()
+        self._scom = scom
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()      # Keeps FIFO order within a priority class
+        self._thread = None                     # type: Thread or None
+        self._thread_id = None
+        self._stopping = False
+        self._submit_lock = Lock()              # Keeps requests from being queued behind the stop request
+        self._stats_lock = Lock()
+        self._stats = {priority: {'queued': 0, 'completed': 0, 'total_wait_time': 0.0, 'max_wait_time': 0.0}
+                       for priority in self.priority_names}
+
+    def start(self) -> bool:
+        """Starts the dispatcher thread.
+
+        :return False if the thread is still executing a request after stop() (not started again)
+        """
+        if self.is_running():
+            if self._stopping:
+                self.log.error('Dispatcher thread still stopping. Not started!')
+                return False
+            return True
+        self._stopping = False
+        self._thread = Thread(target=self._run, name=self.__class__.__name__)
+        self._thread.daemon = True
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        """Stops the dispatcher thread. Requests still queued or submitted afterwards get cancelled.
+
+        The thread is kept (see is_running()) if the request it executes does not return within 'timeout'.
+        """
+        if not self.is_running():
+            return
+        with self._submit_lock:
+            if not self._stopping:
+                self._stopping = True
+                self._queue.put((self._STOP_PRIORITY, next(self._sequence), None, None, None, None))
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            self.log.warning('Dispatcher thread did not stop within %.1f s!' % timeout)
+        else:
+            self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def in_dispatcher_thread(self) -> bool:
+        """Returns True if called from within the dispatcher thread.
+        """
+        return self._thread_id == get_ident()
+
+    def submit(self, frame, rx_timeout_in_seconds: float = None, priority: int = PRIORITY_TELEMETRY) -> Future:
+        """Queues a frame to be written on the SCOM interface.
+
+        :param frame The request frame
+        :type frame BaseFrame
+        :param rx_timeout_in_seconds Maximum time to wait for the response frame
+        :type rx_timeout_in_seconds float
+        :param priority The priority class (PRIORITY_CONTROL, PRIORITY_TELEMETRY or PRIORITY_DISCOVERY)
+        :type priority int
+        :return A future giving the response frame (or None) as result. The future is
+                cancelled if the dispatcher is stopping
+        """
+        return self.submit_call(self._scom.write_frame, frame, rx_timeout_in_seconds, priority, priority=priority)
+
+    def submit_call(self, function, *args, priority: int = PRIORITY_TELEMETRY) -> Future:
+        """Queues a function to be called in the dispatcher thread.
+
+        :param function The function to call. Ex. a function executing many transactions
+        :param args The arguments given to the function
+        :param priority The priority class (PRIORITY_CONTROL, PRIORITY_TELEMETRY or PRIORITY_DISCOVERY)
+        :type priority int
+        :return A future giving the value returned by the function as result. The future is
+                cancelled if the dispatcher is stopping
+        """
+        assert priority in self.priority_names, 'Unknown priority!'
+        future = Future()
+
+        with self._submit_lock:
+            if self._stopping:
+                future.cancel()
+                return future
+
+            with self._stats_lock:
+                self._stats[priority]['queued'] += 1
+
+            self._queue.put((priority, next(self._sequence), time.monotonic(), function, args, future))
+        return future
+
+    def queue_depth(self, priority: int = None) -> int:
+        """Returns the number of requests waiting to be executed.
+
+        :param priority The priority class of interest. All classes if not given.
+        """
+        with self._stats_lock:
+            if priority is None:
+                return sum(stats['queued'] for stats in self._stats.values())
+            return self._stats[priority]['queued']
+
+    def statistics(self) -> dict:
+        """Returns queue depth and wait times (in seconds) per priority class.
+
+        Ex.: {'control': {'queued': 0, 'completed': 12, 'average_wait_time': 0.012, 'max_wait_time': 0.05}, ...}
+        """
+        statistics = {}
+        with self._stats_lock:
+            for priority, stats in self._stats.items():
+                completed = stats['completed']
+                statistics[self.priority_names[priority]] = {
+                    'queued': stats['queued'],
+                    'completed': completed,
+                    'average_wait_time': stats['total_wait_time'] / completed if completed else 0.0,
+                    'max_wait_time': stats['max_wait_time']}
+        return statistics
+
+    def _run(self):
+        self._thread_id = get_ident()
+        self.log.info(type(self).__name__ + ' thread running...')
+
+        while True:
+            priority, _, submit_time, function, args, future = self._queue.get()
+            if priority == self._STOP_PRIORITY:
+                break
+
+            wait_time = time.monotonic() - submit_time
+            with self._stats_lock:
+                self._stats[priority]['queued'] -= 1
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            result, exception = None, None
+            try:
+                result = function(*args)
+            except Exception as e:
+                exception = e
+
+            # Counted once the request is done (before the waiting thread gets the result)
+            with self._stats_lock:
+                stats = self._stats[priority]
+                stats['completed'] += 1
+                stats['total_wait_time'] += wait_time
+                stats['max_wait_time'] = max(stats['max_wait_time'], wait_time)
+
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+        self._cancel_pending()
+        self._thread_id = None
+
+    def _cancel_pending(self):
+        """Cancels all requests still in the queue.
+        """
+        while True:
+            try:
+                priority, _, _, _, _, future = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future:
+                with self._stats_lock:
+                    self._stats[priority]['queued'] -= 1
+                future.cancel()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+
+import struct
+import time
+from collections import namedtuple
+from threading import Lock
+
+CaptureRecord = namedtuple('CaptureRecord', ['timestamp', 'direction', 'outcome', 'data'])
+
+
+class Capture(object):
+    """Binary capture format of the SCOM bus traffic.
+
+    A capture file starts with MAGIC followed by the records. Each record has a
+    fixed size header (see RECORD_HEADER) followed by the frame bytes:
+    - timestamp: Monotonic time in seconds since the capture was started (double)
+    - direction: DIRECTION_TX or DIRECTION_RX
+    - outcome: OUTCOME_OK, OUTCOME_TIMEOUT, OUTCOME_ORPHAN or OUTCOME_RX_ERROR
+    - length: Number of frame bytes following (0 for timeouts and RX errors)
+
+    Captures are append-only. A capture appended to an existing file starts
+    with a new MAGIC marker. Its timestamps restart at 0.
+    """
+
+    MAGIC = b'SCOMCAP1'
+    RECORD_HEADER = struct.Struct('<dBBH')
+
+    DIRECTION_TX = 0
+    DIRECTION_RX = 1
+
+    OUTCOME_OK = 0              # Frame written or expected response received
+    OUTCOME_TIMEOUT = 1         # No response received
+    OUTCOME_ORPHAN = 2          # Frame received not matching the outstanding request
+    OUTCOME_RX_ERROR = 3        # Corrupt data received instead of a response
+
+    direction_names = {DIRECTION_TX: 'TX', DIRECTION_RX: 'RX'}
+    outcome_names = {OUTCOME_OK: 'ok', OUTCOME_TIMEOUT: 'timeout',
+                     OUTCOME_ORPHAN: 'orphan', OUTCOME_RX_ERROR: 'rx-error'}
+
+
+class CaptureWriter(Capture):
+    """Appends records to a capture file. Thread-safe.
+    """
+
+    def __init__(self, file_name: str):
+        super(CaptureWriter, self).__init__()
+        self._file = open(file_name, 'ab')
+        self._file.write(self.MAGIC)
+        self._lock = Lock()
+        self._start_time = time.monotonic()
+        self.records = 0        # Number of records written
+
+    def write_record(self, direction: int, data: bytes or bytearray = b'', outcome: int = Capture.OUTCOME_OK,
+                     timestamp: float = None):
+        """Appends a record.
+
+        :param timestamp Time in seconds since the capture was started. Defaults to now
+        """
+        if timestamp is None:
+            timestamp = time.monotonic() - self._start_time
+        header = self.RECORD_HEADER.pack(timestamp, direction, outcome, len(data))
+        with self._lock:
+            if self._file:
+                self._file.write(header + bytes(data))
+                self.records += 1
+
+    def flush(self):
+        with self._lock:
+            if self._file:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+class CaptureReader(Capture):
+    """Reads the records of a capture file.
+
+    Ex.:
+        for record in CaptureReader('bus.cap'):
+            print(record.timestamp, record.direction, record.outcome, record.data.hex())
+    """
+
+    def __init__(self, file_name: str):
+        super(CaptureReader, self).__init__()
+        self._file_name = file_name
+
+    def __iter__(self):
+        with open(self._file_name, 'rb') as file:
+            content = file.read()
+
+        offset = 0
+        while offset < len(content):
+            if content.startswith(self.MAGIC, offset):
+                offset += len(self.MAGIC)
+                continue
+            if offset + self.RECORD_HEADER.size > len(content):
+                break       # Truncated record (ex. capture not closed properly)
+
+            timestamp, direction, outcome, length = self.RECORD_HEADER.unpack_from(content, offset)
+            offset += self.RECORD_HEADER.size
+            if offset + length > len(content):
+                break
+            yield CaptureRecord(timestamp, direction, outcome, content[offset:offset + length])
+            offset += length
+
+    def records(self) -> [CaptureRecord]:
+        return list(self)
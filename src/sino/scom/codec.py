@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+#
+# Selects the frame and property codec.
+#
+# The extension modules 'baseframe' and 'property' (built on the scomlib) are
+# used if present. Otherwise the pure Python implementation in 'pybaseframe'
+# and 'pyproperty' is used (ex. Cython or a compiler was missing at install time).
+#
+
+try:
+    from .baseframe import BaseFrame
+    from .property import Property, PropertyResponse, decode_read_response
+    from .property import encode_read_requests, decode_read_responses, READ_REQUEST_SIZE
+    extension_modules_present = True
+except ImportError:
+    from .pybaseframe import BaseFrame
+    from .pyproperty import Property, PropertyResponse, decode_read_response
+    from .pyproperty import encode_read_requests, decode_read_responses, READ_REQUEST_SIZE
+    extension_modules_present = False
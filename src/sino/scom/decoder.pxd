@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# distutils: language = c++
+#
+# Decoding of property read responses shared by the extension modules
+# (see property.pyx and transaction.pyx). Only declarations of the scomlib
+# (linked into both modules) and inline functions, so that no runtime import
+# is needed.
+#
+
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int32_t
+from libc.string cimport memcpy
+from baseframe cimport scom_frame_t, scom_service_t, scom_error_t
+from baseframe cimport scom_decode_frame_header, scom_decode_frame_data
+from baseframe cimport SCOM_READ_PROPERTY_SERVICE
+from baseframe cimport SCOM_ERROR_NO_ERROR, SCOM_ERROR_INVALID_FRAME
+
+cdef extern from "scomlib/scom_property.h" nogil:
+    ctypedef enum scom_object_type_t:
+        SCOM_USER_INFO_OBJECT_TYPE
+        SCOM_PARAMETER_OBJECT_TYPE
+
+    ctypedef struct scom_property_t:
+        scom_frame_t* frame
+        scom_object_type_t object_type
+        uint32_t object_id
+        uint16_t property_id
+        size_t value_length
+        char* value_buffer
+        size_t value_buffer_size
+
+    # C-functions to be used in python code
+    void scom_initialize_property(scom_property_t* cproperty, scom_frame_t* frame)
+    void scom_encode_read_property(scom_property_t* cproperty)
+    void scom_encode_write_property(scom_property_t* cproperty)
+    void scom_decode_read_property(scom_property_t* cproperty)
+    void scom_decode_write_property(scom_property_t* cproperty)
+
+cdef enum:
+    FRAME_HEADER_SIZE = 14
+    FRAME_TRAILER_SIZE = 2
+    PROPERTY_HEADER_OFFSET = 16         # Frame header + service header
+    PROPERTY_VALUE_OFFSET = 24          # Frame header + service header + property header
+
+# Fixed size value formats decoded natively. Same sizes as the codecs in valuecodec.py
+cdef enum value_format_t:
+    FORMAT_FLOAT
+    FORMAT_INT32
+    FORMAT_SIGNED
+    FORMAT_ENUM
+    FORMAT_SHORT_ENUM
+    FORMAT_LONG_ENUM
+    FORMAT_BYTE
+
+cdef inline int _value_format_from_name(str property_format):
+    """Returns the value format of the given property format name or -1 if not decoded natively."""
+    if property_format == 'float':
+        return FORMAT_FLOAT
+    if property_format in ('int32', 'signal'):
+        return FORMAT_INT32
+    if property_format in ('signed', 'int32 signed'):
+        return FORMAT_SIGNED
+    if property_format == 'enum':
+        return FORMAT_ENUM
+    if property_format in ('short enum', 'short-enum'):
+        return FORMAT_SHORT_ENUM
+    if property_format in ('long enum', 'long-enum'):
+        return FORMAT_LONG_ENUM
+    if property_format in ('byte', 'bool'):
+        return FORMAT_BYTE
+    return -1
+
+cdef inline uint16_t _read_le16(const unsigned char* data) noexcept nogil:
+    return data[0] | (<uint16_t>data[1] << 8)
+
+cdef inline uint32_t _read_le32(const unsigned char* data) noexcept nogil:
+    return data[0] | (<uint32_t>data[1] << 8) | (<uint32_t>data[2] << 16) | (<uint32_t>data[3] << 24)
+
+cdef inline bint _checksum_ok(const unsigned char* data, size_t length) noexcept nogil:
+    """Checks the SCOM checksum (2 bytes) following the given bytes.
+
+    Native counterpart of pybaseframe.calc_checksum() for the GIL-free decoders
+    (scom_calc_checksum() is static in scom_data_link.c).
+    """
+    cdef uint8_t a = 0xFF
+    cdef uint8_t b = 0
+    cdef size_t i
+    for i in range(length):
+        a = <uint8_t>(a + data[i])
+        b = <uint8_t>(b + a)
+    return data[length] == a and data[length + 1] == b
+
+cdef inline scom_error_t _decode_read_response(scom_frame_t* frame, size_t* value_length) noexcept nogil:
+    """Validates the frame and decodes it using the scomlib.
+
+    scom_decode_frame_header(), scom_decode_frame_data() and scom_decode_read_property() update
+    the frame attributes (service flags, service id, etc.) and give the error code sent by the device.
+    The frame buffer is written to (service flags), so it must not be a read-only buffer.
+
+    :return SCOM_ERROR_INVALID_FRAME if the frame is not a valid read response, otherwise the error
+            code sent by the device (SCOM_ERROR_NO_ERROR if the value was read)
+    """
+    cdef scom_property_t cproperty
+
+    value_length[0] = 0
+
+    if frame.buffer_size < PROPERTY_VALUE_OFFSET + FRAME_TRAILER_SIZE:
+        return SCOM_ERROR_INVALID_FRAME
+
+    frame.last_error = SCOM_ERROR_NO_ERROR
+    scom_decode_frame_header(frame)
+    scom_decode_frame_data(frame)       # Does nothing if the header is invalid
+
+    if frame.last_error != SCOM_ERROR_NO_ERROR or frame.service_id != SCOM_READ_PROPERTY_SERVICE or \
+            frame.data_length < PROPERTY_VALUE_OFFSET - FRAME_HEADER_SIZE:
+        return SCOM_ERROR_INVALID_FRAME
+
+    scom_initialize_property(&cproperty, frame)
+    scom_decode_read_property(&cproperty)
+    value_length[0] = cproperty.value_length
+    return frame.last_error
+
+cdef inline bint _decode_value(value_format_t value_format, const unsigned char* value_buffer, size_t value_length,
+                               uint32_t* int_value, float* float_value) noexcept nogil:
+    """Converts the value of a response according to the value format.
+
+    Floats are written to 'float_value', all other formats to 'int_value'.
+
+    :return False if the size of the value does not match the value format
+    """
+    if value_format == FORMAT_FLOAT:
+        if value_length != 4:
+            return False
+        memcpy(float_value, value_buffer, 4)       # SCOM floats are little-endian IEEE 754
+    elif value_format == FORMAT_INT32 or value_format == FORMAT_SIGNED or value_format == FORMAT_LONG_ENUM:
+        if value_length != 4:
+            return False
+        int_value[0] = _read_le32(value_buffer)
+    elif value_format == FORMAT_ENUM:
+        if value_length != 2 and value_length != 4:
+            return False
+        int_value[0] = _read_le16(value_buffer)
+    elif value_format == FORMAT_SHORT_ENUM:
+        if value_length == 1:
+            int_value[0] = value_buffer[0]
+        elif value_length == 2:
+            int_value[0] = _read_le16(value_buffer)
+        elif value_length == 4:
+            int_value[0] = _read_le32(value_buffer)
+        else:
+            return False
+    else:
+        if value_length != 1:
+            return False
+        int_value[0] = value_buffer[0]
+    return True
+
+cdef inline object _value_object(value_format_t value_format, uint32_t int_value, float float_value):
+    """Returns the value decoded by _decode_value() as Python object."""
+    if value_format == FORMAT_FLOAT:
+        return float_value
+    if value_format == FORMAT_SIGNED:
+        return <int32_t>int_value
+    return int_value
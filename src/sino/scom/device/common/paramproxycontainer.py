@@ -26,6 +26,32 @@ class ParamProxyContainer(object):
         # Container holding parameters
         self.params = {}                            # type: {str, _Param}
         self._readParameterMethod = read_parameter_method
+        self._store = None                          # type: SqliteParamStore or None
+        self._deviceAddress = None                  # type: int or None
+
+    def attach_store(self, store, device_address):
+        """Saves the values to the given store (write-through) and loads the values saved before.
+
+        :param store Store keeping the values (ex. SqliteParamStore). None detaches the store
+        :param device_address Address of the device the parameters belong to
+        :return The parameter infos of the values loaded
+        """
+        self._store = store
+        self._deviceAddress = device_address
+        if store is None:
+            return []
+
+        param_infos = {param_info['number']: param_info for param_info in self.paramInfoTable.values()}
+        loaded = []
+        for number, value in store.load(device_address).items():
+            param_info = param_infos.get(number)
+            if param_info is None:
+                continue
+            if param_info['propertyFormat'] == 'bool':
+                value = bool(value)
+            self._save(param_info, value)
+            loaded.append(param_info)
+        return loaded
 
     def read(self, param_info, property_id=define.PROPERTY_LAST):
         """Reads the value of a parameter."""
@@ -50,6 +76,15 @@ class ParamProxyContainer(object):
             return False, 0
 
     def save(self, param_info, new_value):
+        self._save(param_info, new_value)
+
+        if self._store is not None:
+            try:
+                self._store.save(self._deviceAddress, param_info['number'], new_value)
+            except Exception as e:
+                self.log.warning(u'Parameter %s not saved to store: %s' % (param_info['name'], e))
+
+    def _save(self, param_info, new_value):
         if self.param_info_in_params(param_info):
             param = self.get_param(param_info)  # Get param from dictionary
         else:
@@ -69,6 +104,11 @@ class ParamProxyContainer(object):
         assert param_info and self.param_info_in_params(param_info)
         return self.params[param_info['name']]
 
+    def discard(self, param_info):
+        """Removes the parameter from the mirror (not from the store). Its value is read from the device again.
+        """
+        self.params.pop(param_info['name'], None)
+
 
 class _Param(object):
     """Holds the name and the actual value of a parameter/user_info of a Studer device
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+
+import logging
+import sqlite3
+from threading import Lock
+
+
+class SqliteParamStore(object):
+    """Keeps the parameter values written to the devices in an SQLite database. Thread-safe.
+
+    Used by the ParamProxyContainer to save the PROPERTY_UNSAVED_VALUE_QSP values written
+    (write-through) and to load them again at startup. Values are kept by device address
+    and parameter number.
+
+    The database uses write-ahead logging: A crash of the process never leaves it corrupt
+    and does not lose values written before.
+    """
+
+    log = logging.getLogger(__name__)
+
+    def __init__(self, file_name: str):
+        """
+        :param file_name Path of the database file. Created if not present (':memory:' for tests)
+        """
+        super(SqliteParamStore, self).__init__()
+        self._lock = Lock()
+        self._connection = sqlite3.connect(file_name, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS param ('
+                                 'device_address INTEGER NOT NULL, '
+                                 'number INTEGER NOT NULL, '
+                                 'value NOT NULL, '
+                                 'PRIMARY KEY (device_address, number)) WITHOUT ROWID')
+        self._connection.commit()
+        self.writes = 0
+
+    def load(self, device_address: int) -> {int, object}:
+        """Returns the values saved for the given device by parameter number."""
+        with self._lock:
+            rows = self._connection.execute('SELECT number, value FROM param WHERE device_address = ?',
+                                            (device_address, )).fetchall()
+        return dict(rows)
+
+    def save(self, device_address: int, number: int, value):
+        """Saves the value written to a parameter of the device."""
+        with self._lock:
+            with self._connection:      # Commits
+                self._connection.execute('INSERT OR REPLACE INTO param (device_address, number, value) '
+                                         'VALUES (?, ?, ?)', (device_address, number, value))
+            self.writes += 1
+
+    def clear(self, device_address: int = None):
+        """Removes the values of the given device or of all devices if no address is given.
+
+        Values written with PROPERTY_UNSAVED_VALUE_QSP are lost when a device restarts.
+        """
+        with self._lock:
+            with self._connection:
+                if device_address is None:
+                    self._connection.execute('DELETE FROM param')
+                else:
+                    self._connection.execute('DELETE FROM param WHERE device_address = ?', (device_address, ))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+
+import logging
+import time
+from collections import namedtuple
+from threading import Lock
+
+UserInfoSample = namedtuple('UserInfoSample', ['value', 'timestamp'])     # timestamp: seconds since the epoch
+
+
+class UserInfoCache(object):
+    """Keeps the last values read from the user infos of a device. Thread-safe.
+
+    A value is returned as long as it is younger than the maximum age of its user
+    info. So, many readers of the same user info within this time cost only one
+    bus transaction.
+
+    User infos are identified by their number (the 'name' in the user info tables
+    is not unique).
+    """
+
+    log = logging.getLogger(__name__)
+
+    DEFAULT_MAX_AGE = 1.0           # Seconds
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE, max_ages: {int, float} = None):
+        """
+        :param max_age Maximum age in seconds of the values. 0 does not cache the values
+        :param max_ages Maximum age by user info number overriding 'max_age' (ex. {3007: 10.0})
+        """
+        super(UserInfoCache, self).__init__()
+        self._maxAge = max_age
+        self._maxAges = dict(max_ages or {})
+        self._samples = {}          # type: {int, (float, UserInfoSample)}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def max_age(self, user_info_number: int) -> float:
+        """Returns the maximum age in seconds of the given user info."""
+        return self._maxAges.get(user_info_number, self._maxAge)
+
+    def set_max_age(self, user_info_number: int, max_age: float):
+        """Sets the maximum age in seconds of the given user info. 0 does not cache its values."""
+        self._maxAges[user_info_number] = max_age
+
+    def get(self, user_info_number: int) -> UserInfoSample or None:
+        """Returns the sample of the given user info if not older than its maximum age."""
+        max_age = self.max_age(user_info_number)
+        with self._lock:
+            entry = self._samples.get(user_info_number)
+            if entry is not None and max_age > 0 and time.monotonic() - entry[0] <= max_age:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return None
+
+    def put(self, user_info_number: int, value) -> UserInfoSample:
+        """Saves the value just read from the given user info.
+
+        :return The sample saved
+        """
+        sample = UserInfoSample(value, time.time())
+        with self._lock:
+            self._samples[user_info_number] = (time.monotonic(), sample)
+        return sample
+
+    def sample(self, user_info_number: int) -> UserInfoSample or None:
+        """Returns the last sample of the given user info regardless of its age."""
+        with self._lock:
+            entry = self._samples.get(user_info_number)
+        return entry[1] if entry is not None else None
+
+    def invalidate(self, user_info_number: int = None):
+        """Removes the sample of the given user info or all samples if no number is given."""
+        with self._lock:
+            if user_info_number is None:
+                self._samples.clear()
+            else:
+                self._samples.pop(user_info_number, None)
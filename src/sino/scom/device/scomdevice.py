@@ -2,15 +2,23 @@
 #
 
 import logging
+import time
+from collections import namedtuple
+from concurrent.futures import Future, TimeoutError
+from threading import Lock, Thread
 from abc import ABCMeta, abstractproperty, abstractmethod
 from weakref import WeakValueDictionary
-import struct
 
-from ..property import Property
+from ..codec import Property, PropertyResponse, decode_read_response
+from ..valuecodec import get_value_codec
 from ..frame import Frame as ScomFrame
 from ..defines import *
 from .common.paramproxycontainer import ParamProxyContainer
+from .common.userinfocache import UserInfoCache, UserInfoSample
 from ..exception import ReadException, WriteException
+from ..busdispatcher import BusDispatcher
+
+ReadResult = namedtuple('ReadResult', ['value', 'error'])     # error: None or the ReadException raised
 
 
 # Links:
@@ -52,9 +60,16 @@ class ScomDevice(object):
 
     log = logging.getLogger(__name__)
 
+    userInfoTable = {}          # User infos of the device. Needs to be provided by the deriving class
+
     def __init__(self, device_address):
         super(ScomDevice, self).__init__()
         self._deviceAddress = device_address
+        self._userInfoCache = None              # type: UserInfoCache or None
+        self._writeDeadbands = {}               # type: {str, float or None}
+        self._pendingWrites = {}                # type: {tuple, _PendingWrite}
+        self._writeLock = Lock()
+        self.savedWrites = 0                    # Writes skipped (deadband) or replaced by a newer value
 
     def _add_instance(self, device_type):
         """Adds the instance to the instance counter.
@@ -148,6 +163,67 @@ class ScomDevice(object):
         """
         return self._deviceAddress
 
+    def enable_user_info_cache(self, enable: bool = True, max_age: float = UserInfoCache.DEFAULT_MAX_AGE,
+                               max_ages: {str, float} = None) -> UserInfoCache or None:
+        """Caches the values read from the user infos of the device.
+
+        User infos read again within their maximum age are not read from the device.
+
+        Ex.: xtender.enable_user_info_cache(max_age=0.5, max_ages={'soc': 10.0})
+
+        :param max_age Maximum age in seconds of the values. 0 does not cache the values
+        :param max_ages Maximum age by user info name overriding 'max_age'
+        :return The cache or None if disabled. The cache identifies the user infos by their number
+        :raise KeyError if a name in 'max_ages' is not in the userInfoTable
+        """
+        if enable:
+            max_ages = {self.userInfoTable[name]['number']: age for name, age in (max_ages or {}).items()}
+            self._userInfoCache = UserInfoCache(max_age, max_ages)
+        else:
+            self._userInfoCache = None
+        return self._userInfoCache
+
+    @property
+    def user_info_cache(self) -> UserInfoCache or None:
+        return self._userInfoCache
+
+    def attach_param_store(self, store, reapply=False, timeout=None) -> int:
+        """Keeps the parameter values written (PROPERTY_UNSAVED_VALUE_QSP) in the given store
+        and loads the values saved before into the parameter mirror.
+
+        So, the values in effect are known after a restart without reading the device.
+
+        Values written with PROPERTY_UNSAVED_VALUE_QSP are kept in the RAM of the device only.
+        A device restarting (ex. power cycle) while the application is not running goes back
+        to the values in its flash, but the store still holds the values written before. Use
+        'reapply' to write the values loaded to the device again, so they are in effect.
+
+        Ex.: xtender.attach_param_store(SqliteParamStore('params.db'), reapply=True)
+
+        :param store Store keeping the values (ex. SqliteParamStore). None detaches the store
+        :param reapply If True, the values loaded are written to the device. Values not written
+                       are removed from the parameter mirror
+        :param timeout Time in seconds to wait for each write response. Uses the SCOM default if not given.
+        :return Number of values loaded (and written if 'reapply' is set)
+        """
+        param_infos = self._paramMirror.attach_store(store, self.device_address)
+        if not reapply:
+            return len(param_infos)
+
+        written = 0
+        for param_info in param_infos:
+            try:
+                self._write_parameter(param_info['number'],
+                                      self._paramMirror.get_param(param_info).value,
+                                      property_format=param_info['propertyFormat'],
+                                      property_id=PROPERTY_UNSAVED_VALUE_QSP,
+                                      timeout=timeout)
+                written += 1
+            except Exception:
+                self.log.warning('Parameter \'%s\' not reapplied!' % param_info['name'])
+                self._paramMirror.discard(param_info)
+        return written
+
     @property
     @abstractmethod
     def software_version(self):
@@ -159,76 +235,267 @@ class ScomDevice(object):
         raise NotImplementedError
 
     @classmethod
-    def _property_format_to_value_size(cls, property_format):
+    def _property_format_to_value_size(cls, property_format, value=None):
         """Returns the size in byte of the expected value according to the property format.
 
-        :param property_format The property format ('float', 'int32', 'enum', 'byte', 'bool')
+        :param property_format The property format (ex. 'float', 'int32', 'enum', 'bool', see valuecodec)
         :type property_format str
+        :param value The value to write. Needed by formats without fixed size (ex. 'string')
         :return The size of the expected value
         :type return int
         """
-        if property_format in ('float', 'int32', 'signal'):
-            value_size = 4
-        elif property_format in ('enum', 'short-enum'):
-            value_size = 2
-        elif property_format in ('byte', 'bool'):
-            value_size = 1
+        codec = get_value_codec(property_format)
+        return codec.size if codec.size is not None else codec.value_size(value)
+
+    def _create_read_request(self, object_type, object_id, property_id) -> ScomFrame:
+        """Creates the request frame to read a property of the device.
+        """
+        return self._get_scom().request_cache.read_request(self.device_address, object_type, object_id, property_id)
+
+    def _create_write_request(self, parameter_id, value, property_format='float',
+                              property_id=PROPERTY_VALUE_QSP) -> ScomFrame:
+        """Creates the request frame to write a parameter of the device.
+        """
+        request_frame = self._get_scom().frame_pool.acquire()
+        request_frame.initialize(src_addr=1, dest_addr=self.device_address)
+
+        value_size = self._property_format_to_value_size(property_format, value)
+
+        request_frame.get_property().set_object_write(OBJECT_TYPE_PARAMETER, parameter_id,
+                                                      property_id, value, value_size,
+                                                      property_format=property_format)
+        return request_frame
+
+    def _release_frames(self, *frames):
+        """Gives request and response frames back to the frame pool of the SCOM interface.
+        """
+        frame_pool = self._get_scom().frame_pool
+        for frame in frames:
+            frame_pool.release(frame)
+
+    def _get_read_response_value(self, response_frame) -> bytearray:
+        """Returns the value contained in the response frame of a read request.
+
+        :raise ReadException if no response frame was received or the error flag is set.
+        """
+        value = bytearray()
+
+        if response_frame:
+            if response_frame.is_valid():
+                value_size = response_frame.response_value_size()
+                value = response_frame[24:24 + value_size]
+            elif response_frame.is_data_error_flag_set():
+                msg = 'Error flag set in response frame!'
+                self.log.warning(msg)
+                raise ReadException(msg)
         else:
-            assert False
+            msg = 'No response frame received!'
+            self.log.warning(msg)
+            raise ReadException(msg)
+
+        return value
+
+    def _get_read_response_typed_value(self, response_frame, property_format):
+        """Validates the response frame of a read request and returns its value converted
+        according to the property format (see property.decode_read_response()).
+
+        :raise ReadException if no valid response frame was received or the device answered with an error.
+        """
+        if not response_frame:
+            msg = 'No response frame received!'
+            self.log.warning(msg)
+            raise ReadException(msg)
 
-        return value_size
+        return self._get_property_response_value(decode_read_response(response_frame, property_format))
 
-    def _write_parameter(self, parameter_id, value, property_format='float', property_id=PROPERTY_VALUE_QSP):
+    def _get_property_response_value(self, response: PropertyResponse or None):
+        """Returns the value of a decoded read response.
+
+        :raise ReadException if no response was received or the device answered with an error.
+        """
+        if response is None:
+            msg = 'No response frame received!'
+            self.log.warning(msg)
+            raise ReadException(msg)
+
+        if response.error:
+            msg = 'Error 0x%04X in response frame!' % response.error
+            self.log.warning(msg)
+            raise ReadException(msg)
+
+        return response.value
+
+    def _get_write_response_value(self, response_frame) -> bytearray:
+        """Returns the value contained in the response frame of a write request.
+
+        :raise WriteException if the response frame is not valid.
+        """
+        if response_frame is not None and response_frame.is_valid():
+            value_size = response_frame.response_value_size()
+            return response_frame[24:24 + value_size]
+
+        msg = 'Response frame not valid!'
+        self.log.warning(msg)
+        raise WriteException(msg)
+
+    def _write_parameter(self, parameter_id, value, property_format='float', property_id=PROPERTY_VALUE_QSP,
+                         timeout=None):
         """Writes a new value to the given parameter id.
 
+        The optional 'timeout' (float, in seconds) overrides the default time
+        the SCOM interface waits for the response.
+
         Ex.:
          - self._writeParameter(14081, 1, propertyFormat='int32')
          - self._writeParameter(1138, current, propertyFormat='float')
          - self._writeParameter(paramInfo['number'], newValue, propertyFormat=paramInfo['propertyFormat'],
                                 propertyId=propertyId)
         """
-        request_frame = ScomFrame()
-        request_frame.initialize(src_addr=1, dest_addr=self.device_address)
-
-        value_size = self._property_format_to_value_size(property_format)
-
-        prop = Property(request_frame)
-        prop.set_object_write(OBJECT_TYPE_PARAMETER, parameter_id,
-                              property_id, value, value_size,
-                              property_format=property_format)
-
-        if request_frame.is_valid():
-            response_frame = self._get_scom().write_frame(request_frame)  # Method call is blocking
+        request_frame = self._create_write_request(parameter_id, value, property_format, property_id)
+        response_frame = None
 
-            if response_frame is not None and response_frame.is_valid():
-                value_size = response_frame.response_value_size()
-                value = response_frame[24:24 + value_size]
+        try:
+            if request_frame.is_valid():
+                response_frame = self._get_scom().write_frame(request_frame, timeout,
+                                                              priority=BusDispatcher.PRIORITY_CONTROL)  # Blocking
+                value = self._get_write_response_value(response_frame)
             else:
-                msg = 'Response frame not valid!'
+                msg = 'Request frame not valid!'
                 self.log.warning(msg)
                 raise WriteException(msg)
-        else:
-            msg = 'Request frame not valid!'
-            self.log.warning(msg)
-            raise WriteException(msg)
+        finally:
+            self._release_frames(request_frame, response_frame)
 
         return value
 
-    def _write_parameter_info(self, param_info_name, value, property_id=PROPERTY_UNSAVED_VALUE_QSP):
+    def set_write_deadband(self, param_info_name, deadband):
+        """Sets the deadband of a parameter written with PROPERTY_UNSAVED_VALUE_QSP.
+
+        Values not differing more than the deadband from the value in the parameter mirror
+        are not written (see savedWrites). Overrides the 'deadband' of the parameter info.
+
+        Ex.: vario_power.set_write_deadband('batteryChargeReferenceCurrent', 0.1)
+
+        :param deadband Maximum difference not written. 0 skips equal values only. None writes all values
+        """
+        self._writeDeadbands[param_info_name] = deadband
+
+    def _get_write_deadband(self, param_info):
+        return self._writeDeadbands.get(param_info['name'], param_info.get('deadband'))
+
+    def _within_write_deadband(self, param_info, value, property_id) -> bool:
+        """Returns True if the value does not need to be written according to the deadband of the parameter.
+        """
+        deadband = self._get_write_deadband(param_info)
+        if deadband is None or property_id != PROPERTY_UNSAVED_VALUE_QSP or \
+                not self._paramMirror.param_info_in_params(param_info):
+            return False
+
+        mirrored_value = self._paramMirror.get_param(param_info).value
+        try:
+            return abs(value - mirrored_value) <= deadband
+        except TypeError:
+            return value == mirrored_value
+
+    def _write_parameter_info(self, param_info_name, value, property_id=PROPERTY_UNSAVED_VALUE_QSP, timeout=None):
         """Writes a new value to the device parameter using the given 'parameter info name'
+
+        Writes of the same parameter queued while it is written are collapsed: Only the newest
+        value is written afterwards (by a separate thread) and all queued callers get its result.
+        Queued callers wait at most until both writes could have timed out (False is returned
+        otherwise). Values within the deadband of the parameter are not written (see
+        set_write_deadband()).
         """
         assert property_id in (PROPERTY_UNSAVED_VALUE_QSP, PROPERTY_VALUE_QSP)
 
+        key = (param_info_name, property_id)
+
+        with self._writeLock:
+            pending_write = self._pendingWrites.get(key)
+            if pending_write is None:
+                self._pendingWrites[key] = pending_write = _PendingWrite()
+                pending_write.written_timeout = timeout
+                queued = None
+            else:
+                # Parameter is being written. Queue value replacing the value queued before
+                if pending_write.queued is None:
+                    pending_write.queued = Future()
+                else:
+                    self.savedWrites += 1
+                pending_write.value = value
+                pending_write.timeout = timeout
+                queued = pending_write.queued
+                wait_time = self._write_wait_time(pending_write.written_timeout) + self._write_wait_time(timeout)
+
+        if queued is not None:
+            try:
+                return queued.result(timeout=wait_time)     # Result of the write of the newest value
+            except TimeoutError:
+                self.log.warning('Parameter \'%s\' not set! Write queued timed out' % param_info_name)
+                return False
+
+        try:
+            return self._write_parameter_info_now(param_info_name, value, property_id, timeout)
+        finally:
+            self._end_parameter_write(key)
+
+    def _end_parameter_write(self, key):
+        """Ends the write in progress of the parameter.
+
+        The newest value queued meanwhile is written by a separate thread, so that the caller
+        of the write ended is not held up by writes queued by other callers.
+        """
+        with self._writeLock:
+            pending_write = self._pendingWrites[key]
+            written = pending_write.queued
+            if written is None:
+                del self._pendingWrites[key]
+                return
+            pending_write.queued = None
+            value, timeout = pending_write.value, pending_write.timeout
+            pending_write.written_timeout = timeout
+
+        Thread(target=self._write_queued_parameter, args=(key, value, timeout, written),
+               name='ScomDeviceQueuedWrite', daemon=True).start()
+
+    def _write_queued_parameter(self, key, value, timeout, written):
+        """Writes a queued parameter value and gives the result to the callers waiting for it.
+        """
+        param_info_name, property_id = key
+        try:
+            success = self._write_parameter_info_now(param_info_name, value, property_id, timeout)
+        except BaseException as e:
+            self._end_parameter_write(key)
+            written.set_exception(e)
+        else:
+            self._end_parameter_write(key)
+            written.set_result(success)
+
+    def _write_wait_time(self, timeout=None) -> float:
+        """Returns the longest time a parameter write takes (waiting for the bus and for the response).
+        """
+        scom = self._get_scom()
+        return (timeout if timeout is not None else scom.rx_timeout) + scom.MUTEX_TIMEOUT
+
+    def _write_parameter_info_now(self, param_info_name, value, property_id, timeout=None):
+        """Writes the value unless it is within the deadband of the parameter.
+        """
         # Get the parameter info needed from the table
         param_info = self._param_info_table[param_info_name]
         assert param_info is not None, 'Parameter info name not found!'
 
+        if self._within_write_deadband(param_info, value, property_id):
+            with self._writeLock:
+                self.savedWrites += 1
+            return True
+
         try:
             # Write parameter using the parameter info
             self._write_parameter(param_info['number'],
                                   value,
                                   property_format=param_info['propertyFormat'],
-                                  property_id=property_id)
+                                  property_id=property_id,
+                                  timeout=timeout)
         except Exception as e:
             self.log.warning('Parameter \'%s\' not set!' % param_info_name)
             return False
@@ -239,7 +506,7 @@ class ScomDevice(object):
 
         return True
 
-    def _read_parameter_info(self, param_info_name, property_id=PROPERTY_LAST):
+    def _read_parameter_info(self, param_info_name, property_id=PROPERTY_LAST, timeout=None):
         """ Reads and returns the device parameter identified using the 'parameter info name'
         """
         param_info = self._param_info_table[param_info_name]
@@ -253,7 +520,7 @@ class ScomDevice(object):
             (success, value) = self._paramMirror.read(param_info, property_id=property_id)
 
         if property_id == PROPERTY_VALUE_QSP or not success:
-            value = self._read_attribute(param_info, property_id=property_id)
+            value = self._read_attribute(param_info, property_id=property_id, timeout=timeout)
             success = True
 
         if success and value is not None:
@@ -265,134 +532,310 @@ class ScomDevice(object):
 
         return returned_value
 
-    def _read_parameter(self, parameter_id, property_id=PROPERTY_VALUE_QSP):
-        """Reads a parameter on the device.
-        Return:
-            value : bytearray
-                Parameter read.
+    def _read_property(self, object_type, object_id, property_id, timeout=None) -> bytearray:
+        """Reads a property on the device and returns its value as bytearray.
         """
         value = bytearray()
-        request_frame = ScomFrame()
+        request_frame = self._create_read_request(object_type, object_id, property_id)
+        response_frame = None
 
-        request_frame.initialize(src_addr=1, dest_addr=self.device_address, data_length=99)
-
-        prop = Property(request_frame)
-        prop.set_object_read(OBJECT_TYPE_PARAMETER, parameter_id, property_id)
-
-        if request_frame.is_valid():
-            response_frame = self._get_scom().write_frame(request_frame)  # Method call is blocking
-
-            if response_frame:
-                if response_frame.is_valid():
-                    value_size = response_frame.response_value_size()
-                    value = response_frame[24:24 + value_size]
-                elif response_frame.is_data_error_flag_set():
-                    msg = 'Error flag set in response frame!'
-                    self.log.warning(msg)
-                    raise ReadException(msg)
+        try:
+            if request_frame.is_valid():
+                response_frame = self._get_scom().write_frame(request_frame, timeout)  # Method call is blocking
+                value = self._get_read_response_value(response_frame)
             else:
-                msg = 'No response frame received!'
+                msg = 'Request frame not valid'
                 self.log.warning(msg)
-                raise ReadException(msg)
-        else:
-            msg = 'Request frame not valid'
-            self.log.warning(msg)
-            ReadException(msg)
+                ReadException(msg)
+        finally:
+            self._release_frames(request_frame, response_frame)
 
         return value
 
-    def _read_attribute(self, param_info, property_id=PROPERTY_UNSAVED_VALUE_QSP):
-        value = param_info['default']
-        byte_array = self._read_parameter(param_info['number'], property_id=property_id)
-
-        if byte_array:
-            if param_info['propertyFormat'] == 'float':
-                assert len(byte_array) == 4
-                value = struct.unpack('f', byte_array[0:4])[0]
-            elif param_info['propertyFormat'] == 'int32':
-                assert len(byte_array) == 4
-                value = struct.unpack('I', byte_array[0:4])[0]
-            elif param_info['propertyFormat'] == 'enum':
-                assert len(byte_array) == 4
-                value = struct.unpack('H', byte_array[0:2])[0]
-            elif param_info['propertyFormat'] == 'byte':
-                assert len(byte_array) == 1
-                value = struct.unpack('B', byte_array[0:1])[0]
-            elif param_info['propertyFormat'] == 'bool':
-                assert len(byte_array) == 1
-                value = struct.unpack('B', byte_array[0:1])[0]
-            else:
-                assert False
+    def _read_property_value(self, object_type, object_id, property_id, property_format, timeout=None):
+        """Reads a property on the device and returns its value according to the property format.
 
-        return value
+        :raise ReadException if the value could not be read.
+        """
+        response = self._get_scom().read_property_value(self.device_address, object_type, object_id, property_id,
+                                                        property_format, timeout)  # Method call is blocking
+        return self._get_property_response_value(response)
+
+    def _read_parameter(self, parameter_id, property_id=PROPERTY_VALUE_QSP, timeout=None):
+        """Reads a parameter on the device.
+
+        The optional 'timeout' (float, in seconds) overrides the default time
+        the SCOM interface waits for the response.
 
-    def _read_user_info_by_parameter_id(self, parameter_id):
+        Return:
+            value : bytearray
+                Parameter read.
+        """
+        return self._read_property(OBJECT_TYPE_PARAMETER, parameter_id, property_id, timeout=timeout)
+
+    def _read_attribute(self, param_info, property_id=PROPERTY_UNSAVED_VALUE_QSP, timeout=None):
+        return self._read_property_value(OBJECT_TYPE_PARAMETER, param_info['number'], property_id,
+                                         param_info['propertyFormat'], timeout=timeout)
+
+    @classmethod
+    def _decode_attribute(cls, param_info, byte_array):
+        """Converts the bytes read from a parameter into its value according to the parameter info.
+        """
+        if not byte_array:
+            return param_info['default']
+        return get_value_codec(param_info['propertyFormat']).unpack(byte_array)
+
+    def _read_user_info_by_parameter_id(self, parameter_id, timeout=None):
         """Reads a user info on the device.
 
         :param parameter_id
         :type parameter_id int
+        :param timeout Time in seconds to wait for the response. Uses the SCOM default if not given.
+        :type timeout float
         :return The parameter read
         :type return bytearray
         """
-        value = bytearray()
-        request_frame = ScomFrame()
+        return self._read_property(OBJECT_TYPE_READ_USER_INFO, parameter_id, PROPERTY_ID_READ, timeout=timeout)
 
-        request_frame.initialize(src_addr=1, dest_addr=self.device_address, data_length=99)
+    def _read_user_info_ex(self, user_info, timeout=None):
+        """Uses the userInfoTable to access the needed user info.
 
-        prop = Property(request_frame)
-        prop.set_object_read(OBJECT_TYPE_READ_USER_INFO, parameter_id, PROPERTY_ID_READ)
+        :param timeout Time in seconds to wait for the response. Uses the SCOM default if not given.
+        :type timeout float
+        :return The value received from the device
+        :type return float, int, enum, etc.
+        """
+        return self._read_user_info_sample(user_info, timeout).value
 
-        if request_frame.is_valid():
-            response_frame = self._get_scom().write_frame(request_frame)  # Method call is blocking
+    def _read_user_info_sample(self, user_info, timeout=None) -> UserInfoSample:
+        """Same as _read_user_info_ex() but returns the value together with the time it was read.
 
-            if response_frame:
-                if response_frame.is_valid():
-                    value_size = response_frame.response_value_size()
-                    value = response_frame[24:24 + value_size]
-                elif response_frame.is_data_error_flag_set():
-                    msg = 'Error flag set in response frame!'
-                    self.log.warning(msg)
-                    raise ReadException(msg)
-            else:
-                msg = 'No response frame received!'
-                self.log.warning(msg)
-                raise ReadException(msg)
-        else:
-            msg = 'Request frame not valid'
-            self.log.warning(msg)
-            ReadException(msg)
+        Takes the value from the user info cache if fresh enough (see enable_user_info_cache()).
+        """
+        cache = self._userInfoCache
+        if cache is not None:
+            sample = cache.get(user_info['number'])
+            if sample is not None:
+                return sample
 
-        return value
+        value = self._read_property_value(OBJECT_TYPE_READ_USER_INFO, user_info['number'], PROPERTY_ID_READ,
+                                          user_info['propertyFormat'], timeout=timeout)
+        return cache.put(user_info['number'], value) if cache is not None else UserInfoSample(value, time.time())
 
-    def _read_user_info_ex(self, user_info):
-        """Uses the userInfoTable to access the needed user info.
+    def read_user_info_sample(self, user_info_name, timeout=None) -> UserInfoSample:
+        """Reads the user info identified using the 'user info name' and returns its value and
+        the time (seconds since the epoch) it was read from the device.
 
-        :return The value received from the device
-        :type return float, int, enum, etc.
+        Ex.: xtender.read_user_info_sample('batteryVoltage')
+
+        :raise ReadException if the value could not be read.
         """
-        default_value = user_info['default']
-        value = self._read_user_info_by_parameter_id(user_info['number'])
+        return self._read_user_info_sample(self.userInfoTable[user_info_name], timeout)
 
+    def _decode_user_info(self, user_info, value):
+        """Converts the bytes read from a user info into its value according to the user info.
+        """
         if value:
-            if user_info['propertyFormat'] == 'float':
-                assert len(value) == 4
-                value = struct.unpack('f', value[0:4])[0]
-            elif user_info['propertyFormat'] == 'enum':
-                assert len(value) == 2
-                value = struct.unpack('H', value[0:2])[0]  # Read 'ENUM' format as unsigned int (H)
-            elif user_info['propertyFormat'] == 'short enum':
-                length = len(value)
-                assert len(value) == 4, 'Expected 4 got %d' % len(value)
-                if length == 1:
-                    value = struct.unpack('B', value[0:4])[0]
-                elif length == 4:
-                    value = struct.unpack('L', value[0:4])[0]
-            else:
-                assert False    # Support for given type not supported yet!
-
-            return value
+            return get_value_codec(user_info['propertyFormat']).unpack(value)
         else:
             msg = 'Could not read user info \'%s\'' % user_info['name']
             self.log.warning(msg)
             raise ReadException(msg)
-            return default_value
+
+    def read_user_infos(self, user_info_names, timeout=None) -> {str, ReadResult}:
+        """Reads many user infos back-to-back holding the bus lock only once.
+
+        Ex.: xtender.read_user_infos(['batteryVoltage', 'batteryChargeCurrent'])
+
+        Values are taken from the user info cache if fresh enough (see enable_user_info_cache()).
+
+        :param user_info_names Keys in the userInfoTable of the device
+        :type user_info_names list
+        :param timeout Time in seconds to wait for each response. Uses the SCOM default if not given.
+        :type timeout float
+        :return A ReadResult per user info name. Values not read have their error set
+        :raise KeyError if a name is not in the userInfoTable
+        """
+        cache = self._userInfoCache
+        results = {}
+        names = []
+        requests = []
+
+        for name in user_info_names:
+            user_info = self.userInfoTable[name]
+            sample = cache.get(user_info['number']) if cache is not None else None
+            if sample is not None:
+                results[name] = ReadResult(sample.value, None)
+                continue
+
+            names.append(name)
+            requests.append((self.device_address, OBJECT_TYPE_READ_USER_INFO, user_info['number'],
+                             PROPERTY_ID_READ, user_info['propertyFormat']))
+
+        for name, result in self._read_property_values(names, requests, timeout).items():
+            if cache is not None and result.error is None:
+                cache.put(self.userInfoTable[name]['number'], result.value)
+            results[name] = result
+        return {name: results[name] for name in user_info_names}
+
+    def read_parameters(self, param_info_names, property_id=PROPERTY_LAST, timeout=None) -> {str, ReadResult}:
+        """Reads many device parameters back-to-back holding the bus lock only once.
+
+        Same behavior as read_parameter_async(): Values with PROPERTY_LAST and PROPERTY_UNSAVED_VALUE_QSP
+        are taken from the parameter mirror if present.
+
+        :param param_info_names Keys in the paramInfoTable of the device
+        :type param_info_names list
+        :return A ReadResult per parameter info name. Values not read have their error set
+        :raise KeyError if a name is not in the paramInfoTable
+        """
+        results = {}
+        names = []
+        requests = []
+
+        for name in param_info_names:
+            param_info = self._param_info_table[name]
+            read_property_id = property_id
+
+            if property_id in (PROPERTY_LAST, PROPERTY_UNSAVED_VALUE_QSP):
+                if self._paramMirror.param_info_in_params(param_info):
+                    results[name] = ReadResult(self._paramMirror.get_param(param_info).value, None)
+                    continue
+                read_property_id = PROPERTY_VALUE_QSP
+
+            names.append(name)
+            requests.append((self.device_address, OBJECT_TYPE_PARAMETER, param_info['number'], read_property_id,
+                             param_info['propertyFormat']))
+
+        results.update(self._read_property_values(names, requests, timeout))
+        return {name: results[name] for name in param_info_names}
+
+    def _read_property_values(self, names, requests, timeout=None) -> {str, ReadResult}:
+        """Executes the read requests using Scom.read_property_values() and returns the results by name.
+        """
+        if not requests:
+            return {}
+
+        responses = self._get_scom().read_property_values(requests, timeout)   # Method call is blocking
+        results = {}
+
+        for name, response in zip(names, responses):
+            try:
+                results[name] = ReadResult(self._get_property_response_value(response), None)
+            except ReadException as e:
+                results[name] = ReadResult(None, e)
+        return results
+
+    #
+    # Coroutines to be used with an AsyncScom interface (see class_initialize())
+    #
+    async def _read_property_async(self, object_type, object_id, property_id, timeout=None) -> bytearray:
+        """Same as _read_property() but awaits the response using an AsyncScom interface.
+        """
+        value = bytearray()
+        request_frame = self._create_read_request(object_type, object_id, property_id)
+        response_frame = None
+
+        try:
+            if request_frame.is_valid():
+                response_frame = await self._get_scom().write_frame_async(request_frame, timeout)
+                value = self._get_read_response_value(response_frame)
+            else:
+                msg = 'Request frame not valid'
+                self.log.warning(msg)
+                raise ReadException(msg)
+        finally:
+            self._release_frames(request_frame, response_frame)
+
+        return value
+
+    async def _read_property_value_async(self, object_type, object_id, property_id, property_format,
+                                         timeout=None):
+        """Same as _read_property_value() but awaits the response using an AsyncScom interface.
+        """
+        request_frame = self._create_read_request(object_type, object_id, property_id)
+        response_frame = None
+
+        try:
+            response_frame = await self._get_scom().write_frame_async(request_frame, timeout)
+            return self._get_read_response_typed_value(response_frame, property_format)
+        finally:
+            self._release_frames(request_frame, response_frame)
+
+    async def read_user_info_async(self, user_info_name, timeout=None):
+        """Reads and returns the user info identified using the 'user info name'.
+
+        Ex.: await xtender.read_user_info_async('batteryVoltage')
+
+        :param user_info_name Key in the userInfoTable of the device
+        :type user_info_name str
+        :param timeout Time in seconds to wait for the response. Uses the SCOM default if not given.
+        :type timeout float
+        """
+        user_info = self.userInfoTable[user_info_name]
+        cache = self._userInfoCache
+        sample = cache.get(user_info['number']) if cache is not None else None
+        if sample is not None:
+            return sample.value
+
+        value = await self._read_property_value_async(OBJECT_TYPE_READ_USER_INFO, user_info['number'],
+                                                      PROPERTY_ID_READ, user_info['propertyFormat'], timeout=timeout)
+        if cache is not None:
+            cache.put(user_info['number'], value)
+        return value
+
+    async def read_parameter_async(self, param_info_name, property_id=PROPERTY_LAST, timeout=None):
+        """Reads and returns the device parameter identified using the 'parameter info name'.
+
+        Same behavior as _read_parameter_info(): Values with PROPERTY_LAST and PROPERTY_UNSAVED_VALUE_QSP
+        are taken from the parameter mirror if present.
+        """
+        param_info = self._param_info_table[param_info_name]
+
+        if property_id in (PROPERTY_LAST, PROPERTY_UNSAVED_VALUE_QSP):
+            if self._paramMirror.param_info_in_params(param_info):
+                return self._paramMirror.get_param(param_info).value
+            property_id = PROPERTY_VALUE_QSP
+
+        return await self._read_property_value_async(OBJECT_TYPE_PARAMETER, param_info['number'],
+                                                     property_id, param_info['propertyFormat'], timeout=timeout)
+
+    async def write_parameter_async(self, param_info_name, value, property_id=PROPERTY_UNSAVED_VALUE_QSP,
+                                    timeout=None):
+        """Writes a new value to the device parameter using the given 'parameter info name'.
+
+        :return True if the value could be written, otherwise False
+        """
+        assert property_id in (PROPERTY_UNSAVED_VALUE_QSP, PROPERTY_VALUE_QSP)
+
+        param_info = self._param_info_table[param_info_name]
+        request_frame = self._create_write_request(param_info['number'], value,
+                                                   param_info['propertyFormat'], property_id)
+        response_frame = None
+
+        try:
+            if not request_frame.is_valid():
+                raise WriteException('Request frame not valid!')
+            response_frame = await self._get_scom().write_frame_async(request_frame, timeout)
+            self._get_write_response_value(response_frame)
+        except Exception as e:
+            self.log.warning('Parameter \'%s\' not set!' % param_info_name)
+            return False
+        finally:
+            self._release_frames(request_frame, response_frame)
+
+        # Save written value to mirror
+        if property_id == PROPERTY_UNSAVED_VALUE_QSP:
+            self._paramMirror.save(param_info, value)
+
+        return True
+
+
+class _PendingWrite(object):
+    """Parameter write in progress and the newest value queued while it is written.
+    """
+    def __init__(self):
+        self.value = None
+        self.timeout = None
+        self.written_timeout = None         # Timeout of the write in progress
+        self.queued = None      # type: Future or None  # Result of the write of the value queued
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 #
 
-import struct
 import logging
-from ..property import Property
+from ..codec import Property
 from ..frame import BaseFrame
+from ..valuecodec import get_value_codec
 from ..device.scomdevice import ScomDevice
 
 
@@ -278,7 +278,7 @@ class VarioPower(ScomDevice):
         value = self._read_parameter(1138, property_id)   # 1138
 
         if value:
-            current = struct.unpack('f', value[0:4])[0]
+            current = get_value_codec('float').unpack(value)
 
         return current
 
@@ -4,7 +4,7 @@
 import struct
 import logging
 from ..defines import *
-from ..property import Property
+from ..codec import Property
 from ..frame import Frame as ScomFrame
 from .scomdevice import ScomDevice
 from .common.paramproxycontainer import ParamProxyContainer
@@ -10,8 +10,7 @@ import gc
 from sino.scom import defines as define
 from sino.scom import device
 from ..scom import Scom
-from ..frame import BaseFrame as ScomBaseFrame
-from ..property import Property
+from ..busdispatcher import BusDispatcher
 from ..device.scomdevice import ScomDevice
 from .devicenotifier import DeviceNotifier
 
@@ -36,10 +35,16 @@ class DeviceManager(DeviceNotifier):
 
     _device_address_category = ('xtender', 'vario_power', 'rcc', 'bsp')
     DEFAULT_RX_BUFFER_SIZE = 1024
+    DEFAULT_SEARCH_TIMEOUT = 0.5        # Time in seconds to wait for a device to respond during search
 
     def __init__(self, scom=None, config=None, address_scan_info=None,
-                 control_interval_in_seconds=5.0, thread_monitor=None):
-        """"""
+                 control_interval_in_seconds=5.0, thread_monitor=None,
+                 search_timeout_in_seconds=DEFAULT_SEARCH_TIMEOUT, param_store=None):
+        """
+        :param param_store Store keeping the parameter values written (ex. SqliteParamStore).
+                           Attached to the devices found. The values saved are written to the
+                           devices again (see ScomDevice.attach_param_store())
+        """
         if self._instance:
             assert False, 'Only one instance of this class is allowed'
         else:
@@ -49,9 +54,11 @@ class DeviceManager(DeviceNotifier):
         self._thread_should_run = True
         self._thread_left_run_loop = False          # Set to true when _thread is leaving run loop
         self._control_interval_in_seconds = control_interval_in_seconds
+        self._search_timeout_in_seconds = float(search_timeout_in_seconds)
         self._subscribers = []                      # type: [dict]
         self._device = {}                           # type: {int, scom.Device}
         self._scom_rx_error_message_send = False    # type: bool
+        self._param_store = param_store
 
         if scom:
             self._scom = scom
@@ -226,14 +233,13 @@ class DeviceManager(DeviceNotifier):
     def _thread_sleep_interval(self, sleep_interval_in_seconds, decr_value=0.2):
         """Tells the executing thread how long to sleep while being still reactive on _threadShouldRun attribute.
         """
-        wait_time = sleep_interval_in_seconds
+        deadline = time.monotonic() + sleep_interval_in_seconds
 
-        while wait_time > 0:
-            time.sleep(decr_value)
-            wait_time -= decr_value
-            # Check if thread should leave run loop
-            if not self._thread_should_run:
+        while self._thread_should_run:
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
                 break
+            time.sleep(min(decr_value, remaining_time))
 
     def _get_device_by_address(self, device_address):
         """Returns the studer device instance based on the device address.
@@ -275,6 +281,10 @@ class DeviceManager(DeviceNotifier):
                                                  device_category=device_category,
                                                  connected=False)
 
+                    # Device may restart with its saved values. Values written before are lost
+                    if self._param_store is not None:
+                        self._param_store.clear(missingDeviceAddress)
+
                     # Remove studer device from list
                     if missingDeviceAddress in self._device:
                         self._device.pop(missingDeviceAddress)
@@ -289,6 +299,8 @@ class DeviceManager(DeviceNotifier):
         # Let the factory create a new SCOM device representation
         self._device[device_address] = device.DeviceFactory.create(device_category, device_address)
         self._device[device_address].class_initialize(self._scom)
+        if self._param_store is not None:
+            self._device[device_address].attach_param_store(self._param_store, reapply=True)
 
         self.log.info('Found new studer device: %s #%d' % (device_category, device_address))
 
@@ -308,26 +320,28 @@ class DeviceManager(DeviceNotifier):
 
         self.log.info('Searching devices in group \'%s\'...' % device_category)
 
-        request_frame = ScomBaseFrame(self.DEFAULT_RX_BUFFER_SIZE)
+        request_cache = self._scom.request_cache
+        frame_pool = self._scom.frame_pool
 
         device_index = device_start_address
         while device_index <= device_stop_address:
-            request_frame.initialize(src_addr=1, dest_addr=device_index)
-
-            prop = Property(request_frame)
             # TODO For some devices 'parameter' value must be read instead of 'user info' (ex. RCC device)
-            prop.set_object_read(define.OBJECT_TYPE_READ_USER_INFO,
-                                 self._get_search_object_id(device_category),
-                                 define.PROPERTY_ID_READ)
+            request_frame = request_cache.read_request(device_index, define.OBJECT_TYPE_READ_USER_INFO,
+                                                       self._get_search_object_id(device_category),
+                                                       define.PROPERTY_ID_READ)
 
             if request_frame.is_valid():
-                response_frame = self._scom.write_frame(request_frame, 0.5)    # Set a short timeout during search
+                # Set a short timeout during search
+                response_frame = self._scom.write_frame(request_frame, self._search_timeout_in_seconds,
+                                                        priority=BusDispatcher.PRIORITY_DISCOVERY)
 
                 if response_frame and response_frame.is_valid():
                     self.log.info('Found device on address: ' + str(device_index))
                     device_list.append(device_index)
+                frame_pool.release(response_frame)
             else:
-                self.log.warning('Frame with error: ' + request_frame.last_error())
+                self.log.warning('Frame with error: ' + str(request_frame.last_error()))
+            frame_pool.release(request_frame)
 
             device_index += 1
 
@@ -7,3 +7,4 @@ __path__ = pkgutil.extend_path(__path__, __name__)
 
 from .readexception import ReadException
 from .writeexception import WriteException
+from .transportexception import TransportException
@@ -0,0 +1,7 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+class TransportException(Exception):
+
+    def __init__(self, message):
+        super(TransportException, self).__init__(message)
@@ -4,40 +4,67 @@
 import logging
 import struct
 from .exeptions import ResponseFrameException
-from .baseframe import *
+from .codec import BaseFrame, Property
 
 
 class Frame(BaseFrame):
     """High Level SCOM frame providing a better python like style.
+
+    All attributes are read from the frame buffer of the BaseFrame. There is
+    no further copy of the frame bytes.
     """
 
     HEADER_SIZE = 14
     TRAILER_SIZE = 2
+    DEFAULT_BUFFER_SIZE = 32        # Enough for property read and write requests (values up to 4 bytes)
 
     log = logging.getLogger(__name__)
 
-    def __init__(self, buffer_size: int = 1024):
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE):
         super(Frame, self).__init__(buffer_size=buffer_size)
+        self._property = None       # type: Property or None
+
+    def get_property(self) -> Property:
+        """Returns the Property used to encode a property request into this frame.
+
+        The Property is created once and then reused.
+        """
+        if self._property is None:
+            self._property = Property(self)
+        return self._property
+
+    def resize_buffer(self, buffer_size: int):
+        super(Frame, self).resize_buffer(buffer_size)
+        self._property = None       # Points to the old buffer
 
-        self._buffer = bytearray()
-        self.dataLength = 0
+    @property
+    def dataLength(self) -> int:
+        return self.data_length()
+
+    @dataLength.setter
+    def dataLength(self, data_length: int):
+        self.set_data_length(data_length, encode=False)
 
     def parse_frame_from_string(self, rx_buffer):
+        """Initializes the frame using the first frame found in the given bytes.
+
+        Only the bytes of the frame are copied. The frame buffer is enlarged if needed.
+
+        :return A tuple (success, frame_length)
+        """
         frame_length = 0
 
         if len(rx_buffer) < 12:
             return False, frame_length
 
         # Extract the 'data_length' field
-        data_length = struct.unpack('<H', rx_buffer[10:10 + 2])[0]
-        self.dataLength = data_length
+        data_length = struct.unpack_from('<H', rx_buffer, 10)[0]
 
         if len(rx_buffer) >= self.HEADER_SIZE + data_length + self.TRAILER_SIZE:
             frame_length = self.HEADER_SIZE + data_length + self.TRAILER_SIZE
-            self.initialize_using_bytearray(rx_buffer, len(rx_buffer))
-
-            # Copy frame buffer into own buffer
-            self._buffer = rx_buffer[0:frame_length]
+            if frame_length > self.buffer_size():
+                self.resize_buffer(frame_length)
+            self.initialize_using_bytearray(rx_buffer, frame_length)
 
             return True, frame_length
         else:
@@ -51,26 +78,19 @@ class Frame(BaseFrame):
         return not self.is_response()
 
     def is_response(self):
-        self._sync_attributes()
-
-        if self.dataLength < 1:
-            raise ValueError('DataLength is to small')
-
-        if len(self._buffer) < 14:
-            raise ValueError('Buffer size is to small')
-
-        is_a_response = True if self._buffer[14] & 0b10 else False
-        return is_a_response
+        return True if self._service_flags() & 0b10 else False
 
     def is_data_error_flag_set(self):
-        if self.dataLength < 1:
+        return True if self._service_flags() & 0b01 else False
+
+    def _service_flags(self) -> int:
+        if self.data_length() < 1:
             raise ValueError('DataLength is to small')
 
-        if len(self._buffer) < 14:
+        if self.buffer_size() <= self.HEADER_SIZE:
             raise ValueError('Buffer size is to small')
 
-        err = True if self._buffer[14] & 0b01 else False
-        return err
+        return self[self.HEADER_SIZE]
 
     def is_valid(self):
         if not super(Frame, self).is_valid():
@@ -87,18 +107,7 @@ class Frame(BaseFrame):
 
         return True
 
-    def __getitem__(self, item): return self._buffer[item]
-
-    def _sync_attributes(self):
-        """Syncs scom.Frame attributes using the cFrame attributes if necessary
-        """
-        # Check if data length size of cFrame differs from dataLength
-        if self.dataLength != super(Frame, self).data_length():
-            # OK. Need to update attributes
-            self._buffer = super(Frame, self).copy_buffer()
-            self.dataLength = super(Frame, self).data_length()
-
     def response_value_size(self):
         if not self.is_response():
             raise ResponseFrameException('Not a response frame')
-        return self.dataLength - 10
+        return self.data_length() - 10
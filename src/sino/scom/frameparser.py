@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#
+
+import logging
+import struct
+from .frame import Frame
+from .pybaseframe import calc_checksum
+
+
+class FrameParser(object):
+    """Incremental parser extracting SCOM frames from a stream of received bytes.
+
+    Bytes received are given to the parser using feed(). The parser then:
+    - Hunts for the start byte (0xAA). Bytes in front of it are discarded.
+    - Validates the header checksum before trusting the 'data_length' field.
+      On error, the start byte is dropped and the parser hunts for the next one.
+    - Validates the data checksum of a complete frame. On error, the whole
+      frame is dropped.
+
+    Overflow policy: The buffer never holds more than 'max_buffer_size' bytes.
+    If more bytes are fed, the oldest bytes get discarded and the parser
+    resynchronizes on the next start byte.
+    """
+
+    START_BYTE = 0xAA
+    DEFAULT_MAX_BUFFER_SIZE = 4096
+
+    log = logging.getLogger(__name__)
+
+    def __init__(self, max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE, frame_pool=None):
+        """
+        :param max_buffer_size Maximum number of bytes buffered
+        :param frame_pool Pool from which the frames returned are taken. New frames are created if not given
+        :type frame_pool FramePool
+        """
+        super(FrameParser, self).__init__()
+        assert max_buffer_size >= Frame.HEADER_SIZE + Frame.TRAILER_SIZE, 'Buffer size too small!'
+        self._buffer = bytearray()
+        self._max_buffer_size = max_buffer_size
+        self._frame_length = 0          # Length of the frame at the beginning of the buffer (0: unknown)
+        self._frame_pool = frame_pool
+
+        # Statistics
+        self.discarded_bytes = 0        # Bytes discarded while hunting for a start byte
+        self.header_errors = 0          # Headers with invalid checksum or length
+        self.data_errors = 0            # Frames with invalid data checksum
+        self.overflows = 0              # Number of times the buffer was truncated
+
+    def __len__(self):
+        return len(self._buffer)
+
+    @property
+    def errors(self) -> int:
+        """Returns the number of corrupt frames detected."""
+        return self.header_errors + self.data_errors
+
+    def feed(self, data: bytes or bytearray):
+        """Adds received bytes to the parser.
+        """
+        self._buffer += data
+
+        if len(self._buffer) > self._max_buffer_size:
+            overflow = len(self._buffer) - self._max_buffer_size
+            self.log.warning('RX buffer overflow. Discarding %d bytes' % overflow)
+            del self._buffer[:overflow]
+            self.discarded_bytes += overflow
+            self.overflows += 1
+            self._frame_length = 0
+
+    def clear(self):
+        """Discards all bytes in the parser.
+        """
+        self._buffer.clear()
+        self._frame_length = 0
+
+    def bytes_needed(self) -> int:
+        """Returns the number of bytes at least needed to complete the next frame.
+
+        Returns 0 if a complete frame is available.
+        """
+        self._synchronize()
+        if self._frame_length:
+            return max(self._frame_length - len(self._buffer), 0)
+        return Frame.HEADER_SIZE - len(self._buffer)
+
+    def next_frame(self) -> Frame or None:
+        """Returns the next complete frame or None if no frame is available.
+        """
+        while self.bytes_needed() == 0:
+            frame_length = self._frame_length
+            self._frame_length = 0
+            frame = None
+
+            # Frame gets copied directly out of the RX buffer
+            with memoryview(self._buffer) as frame_bytes:
+                data = frame_bytes[Frame.HEADER_SIZE:frame_length - Frame.TRAILER_SIZE]
+                if calc_checksum(data) == struct.unpack_from('<H', frame_bytes, frame_length - Frame.TRAILER_SIZE)[0]:
+                    frame = self._frame_pool.acquire(frame_length) if self._frame_pool is not None \
+                        else Frame(buffer_size=frame_length)
+                    frame.parse_frame_from_string(frame_bytes[:frame_length])
+                data.release()
+            del self._buffer[:frame_length]
+
+            if frame is None:
+                self.data_errors += 1
+                self.log.warning('RX frame with invalid data checksum discarded')
+                continue
+            return frame
+        return None
+
+    def frames(self):
+        """Yields every complete frame available.
+        """
+        frame = self.next_frame()
+        while frame is not None:
+            yield frame
+            frame = self.next_frame()
+
+    def _synchronize(self):
+        """Searches for the next valid frame header in the buffer.
+        """
+        while not self._frame_length:
+            # Hunt for start byte
+            start_index = self._buffer.find(self.START_BYTE)
+            if start_index != 0:
+                discarded = start_index if start_index > 0 else len(self._buffer)
+                del self._buffer[:discarded]
+                self.discarded_bytes += discarded
+
+            if len(self._buffer) < Frame.HEADER_SIZE:
+                return
+
+            # Validate header before trusting 'data_length'
+            data_length = struct.unpack_from('<H', self._buffer, 10)[0]
+            frame_length = Frame.HEADER_SIZE + data_length + Frame.TRAILER_SIZE
+            if calc_checksum(self._buffer[1:12]) != struct.unpack_from('<H', self._buffer, 12)[0] or \
+                    data_length < 2 or frame_length > self._max_buffer_size:
+                self.header_errors += 1
+                # Drop start byte and search for the next one
+                del self._buffer[:1]
+                self.discarded_bytes += 1
+                continue
+
+            self._frame_length = frame_length
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+
+from threading import Lock
+from .frame import Frame
+
+
+class FramePool(object):
+    """Thread-safe pool of reusable frames.
+
+    Frames taken using acquire() need to be given back using release() when they
+    are no longer used. Each frame keeps its Property (see Frame.get_property()),
+    so reusing a frame does not allocate anything.
+
+    Frames not given back are simply garbage collected. If more than 'max_size'
+    frames are given back, the surplus frames are dropped.
+    """
+
+    DEFAULT_MAX_SIZE = 64
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, buffer_size: int = Frame.DEFAULT_BUFFER_SIZE):
+        """
+        :param max_size Maximum number of frames kept in the pool
+        :param buffer_size Buffer size of the frames created
+        """
+        super(FramePool, self).__init__()
+        self._frames = []           # type: [Frame]
+        self._max_size = max_size
+        self._buffer_size = buffer_size
+        self._lock = Lock()
+
+        # Statistics
+        self.created = 0            # Frames created because the pool was empty
+        self.reused = 0             # Frames taken from the pool
+
+    def __len__(self):
+        return len(self._frames)
+
+    def acquire(self, buffer_size: int = None) -> Frame:
+        """Returns a frame out of the pool or a new frame if the pool is empty.
+
+        :param buffer_size Minimum buffer size needed. The buffer of a reused frame is enlarged if needed
+        """
+        with self._lock:
+            frame = self._frames.pop() if self._frames else None
+            if frame is None:
+                self.created += 1
+            else:
+                self.reused += 1
+
+        if frame is None:
+            return Frame(buffer_size=max(buffer_size or 0, self._buffer_size))
+
+        if buffer_size and frame.buffer_size() < buffer_size:
+            frame.resize_buffer(buffer_size)
+        return frame
+
+    def release(self, frame: Frame or None):
+        """Gives a frame back to the pool. The frame must not be used anymore by the caller.
+        """
+        if not isinstance(frame, Frame):
+            return
+
+        frame.reset()
+        with self._lock:
+            if len(self._frames) < self._max_size:
+                self._frames.append(frame)
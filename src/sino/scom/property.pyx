@@ -4,9 +4,18 @@
 #
 
 import struct
-from libc.stdint cimport uint16_t, uint32_t
+from collections import namedtuple
+from libc.stdint cimport uint8_t, uint16_t, uint32_t
+from libc.string cimport memcpy
+from libc.math cimport NAN
+from cpython.bytearray cimport PyByteArray_AS_STRING
 from baseframe cimport BaseFrame
-from baseframe cimport scom_frame_t
+from baseframe cimport scom_frame_t, scom_service_t, scom_error_t
+from baseframe cimport scom_initialize_frame, scom_encode_request_frame
+from baseframe cimport SCOM_READ_PROPERTY_SERVICE
+from baseframe cimport SCOM_ERROR_NO_ERROR, SCOM_ERROR_INVALID_FRAME, SCOM_ERROR_INVALID_DATA_LENGTH
+from decoder cimport *
+from sino.scom.valuecodec import get_value_codec
 
 # Include from libc.stdint does not work with recent VS compilers
 #cdef extern from "vc_stdint.h":
@@ -19,27 +28,6 @@ from baseframe cimport scom_frame_t
 #    ctypedef          long      int32_t
 #    ctypedef          long long int64_t
 
-cdef extern from "scomlib/scom_property.h":
-    ctypedef enum scom_object_type_t:
-        SCOM_USER_INFO_OBJECT_TYPE
-        SCOM_PARAMETER_OBJECT_TYPE
-
-    ctypedef struct scom_property_t:
-        scom_frame_t* frame
-        scom_object_type_t object_type
-        uint32_t object_id
-        uint16_t property_id
-        size_t value_length
-        char* value_buffer
-        size_t value_buffer_size
-
-    # C-functions to be used in python code
-    void scom_initialize_property(scom_property_t* cproperty, scom_frame_t* frame);
-    void scom_encode_read_property(scom_property_t* cproperty);
-    void scom_encode_write_property(scom_property_t* cproperty);
-    void scom_decode_read_property(scom_property_t* cproperty);
-    void scom_decode_write_property(scom_property_t* cproperty);
-
 #
 # Python class representing a SCOM property
 #
@@ -73,33 +61,20 @@ cdef class Property:
         self._cProperty.object_id = object_id
         self._cProperty.property_id = property_id
 
+        if property_data_length + 2 > self._cProperty.value_buffer_size:     # Value and checksum
+            raise ValueError('Frame buffer too small for property value!')
+
         # Add property data
         self._cProperty.value_length = property_data_length
 
-        if property_data_length == 4 and property_format in ('int32', 'signal'):
-            byte_array = struct.pack('I', property_data)        # Split uint32_t to byte array (4 bytes)
-            self._cProperty.value_buffer[0] = byte_array[0]     # LSB
-            self._cProperty.value_buffer[1] = byte_array[1]
-            self._cProperty.value_buffer[2] = byte_array[2]
-            self._cProperty.value_buffer[3] = byte_array[3]     # MSG
-        elif property_data_length == 4 and property_format == 'float':
-            byte_array = struct.pack('f', property_data)        # Split float to byte array (4 bytes)
-            self._cProperty.value_buffer[0] = byte_array[0]     # LSB
-            self._cProperty.value_buffer[1] = byte_array[1]
-            self._cProperty.value_buffer[2] = byte_array[2]
-            self._cProperty.value_buffer[3] = byte_array[3]     # MSG
-        elif property_data_length == 2 and property_format in ('enum', 'short-enum'):
-            byte_array = struct.pack('h', property_data)        # Split uin16_t to byte array (2 bytes)
-            self._cProperty.value_buffer[0] = byte_array[0]     # LSB
-            self._cProperty.value_buffer[1] = byte_array[1]     # MSG
-        elif property_data_length == 1 and property_format == 'byte':
-            byte_array = struct.pack('b', property_data)        # Split uint8_t to byte array (1 byte)
-            self._cProperty.value_buffer[0] = byte_array[0]
-        elif property_data_length == 1 and property_format == 'bool':
-            byte_array = struct.pack('b', property_data)        # Split uint8_t to byte array (1 byte)
-            self._cProperty.value_buffer[0] = byte_array[0]
-        else:
-            assert False, 'Not implemented yet!'
+        codec = get_value_codec(property_format)
+        assert codec.value_size(property_data) == property_data_length, \
+            'Value size of property format \'%s\' is not %d!' % (property_format, property_data_length)
+
+        # Pack the value (LSB first) directly into the frame buffer
+        if property_data_length:
+            codec.pack_into(<unsigned char[:property_data_length]><unsigned char *>self._cProperty.value_buffer, 0,
+                            property_data)
 
         # Write property into frame buffer (write command)
         encode_write_property(self)
@@ -135,3 +110,219 @@ def decode_read_property(Property cproperty):
 
 def decode_write_property(Property cproperty):
     scom_decode_write_property(&cproperty._cProperty)
+
+#
+# Single-pass decoder for property read responses
+#
+PropertyResponse = namedtuple('PropertyResponse', ['error', 'object_type', 'object_id', 'property_id', 'value'])
+PropertyResponse.__doc__ = """Result of decode_read_response().
+
+'error' is SCOM_ERROR_NO_ERROR (0) if 'value' holds the value read. Otherwise 'value' is None
+and 'error' tells the SCOM error code (ex. 0x22: object id not found).
+"""
+
+cdef value_format_t _get_value_format(str property_format) except *:
+    cdef int value_format = _value_format_from_name(property_format)
+    if value_format < 0:
+        get_value_codec(property_format)        # Raises ValueError if unknown
+        raise ValueError('Property format \'%s\' has no fixed size' % property_format)
+    return <value_format_t>value_format
+
+def decode_read_response(BaseFrame frame, str property_format):
+    """Validates a response to a property read request and returns the value read in one pass.
+
+    Checks the start byte, both checksums and the service flags of the frame, decodes the
+    property header and converts the value according to the property format (see valuecodec).
+    Fixed size formats are converted natively, others (ex. 'string') using their ValueCodec.
+
+    :return A PropertyResponse. Its 'error' field is not 0 if the frame is invalid, if the device
+            answered with an error or if the size of the value does not match the property format.
+    """
+    cdef int value_format = _value_format_from_name(property_format)
+    cdef size_t value_length
+    cdef const unsigned char* value_buffer
+    cdef scom_error_t error
+    cdef uint32_t int_value = 0
+    cdef float float_value = 0
+
+    codec = get_value_codec(property_format) if value_format < 0 else None      # Raises ValueError if unknown
+
+    error = _decode_read_response(&frame.cFrame, &value_length)
+    frame.cFrame.last_error = error
+
+    if error == SCOM_ERROR_INVALID_FRAME:
+        return PropertyResponse(error, None, None, None, None)
+
+    value_buffer = &frame.cFrame.buffer[PROPERTY_HEADER_OFFSET]
+    object_type = _read_le16(&value_buffer[0])
+    object_id = _read_le32(&value_buffer[2])
+    property_id = _read_le16(&value_buffer[6])
+
+    if error != SCOM_ERROR_NO_ERROR:
+        return PropertyResponse(error, object_type, object_id, property_id, None)
+
+    if codec is not None:
+        try:
+            value = codec.unpack((<char *>&frame.cFrame.buffer[PROPERTY_VALUE_OFFSET])[:value_length])
+        except ValueError:
+            frame.cFrame.last_error = SCOM_ERROR_INVALID_DATA_LENGTH
+            return PropertyResponse(SCOM_ERROR_INVALID_DATA_LENGTH, object_type, object_id, property_id, None)
+        return PropertyResponse(SCOM_ERROR_NO_ERROR, object_type, object_id, property_id, value)
+
+    if not _decode_value(<value_format_t>value_format, &frame.cFrame.buffer[PROPERTY_VALUE_OFFSET], value_length,
+                         &int_value, &float_value):
+        frame.cFrame.last_error = SCOM_ERROR_INVALID_DATA_LENGTH
+        return PropertyResponse(SCOM_ERROR_INVALID_DATA_LENGTH, object_type, object_id, property_id, None)
+
+    value = _value_object(<value_format_t>value_format, int_value, float_value)
+    return PropertyResponse(SCOM_ERROR_NO_ERROR, object_type, object_id, property_id, value)
+
+#
+# Batch codec for many property read requests and responses
+#
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+cdef packed struct response_record_t:
+    uint32_t src_addr
+    uint32_t object_id
+    uint16_t error
+    double value
+
+READ_REQUEST_SIZE = PROPERTY_VALUE_OFFSET + FRAME_TRAILER_SIZE      # Size of an encoded read request
+
+ResponseRecord = namedtuple('ResponseRecord', ['src_addr', 'object_id', 'error', 'value'])
+
+RESPONSE_RECORD = struct.Struct('=IIHd')        # Layout of response_record_t
+RESPONSE_DTYPE = numpy.dtype([('src_addr', '=u4'), ('object_id', '=u4'), ('error', '=u2'), ('value', '=f8')]) \
+    if numpy is not None else None
+
+def encode_read_requests(requests, unsigned int src_addr=1):
+    """Encodes many property read requests into one contiguous buffer.
+
+    Ex.: buffer, offsets = encode_read_requests([(101, 1, 3000, 1), (101, 1, 3005, 1)])
+
+    :param requests Iterable of (dst_addr, object_type, object_id, property_id) tuples
+    :param src_addr Source address of the requests
+    :return A tuple (buffer, offsets). 'buffer' is a bytearray holding all requests
+            (READ_REQUEST_SIZE bytes each) and 'offsets' the index of each request in it.
+    """
+    cdef list items = list(requests)
+    cdef Py_ssize_t count = len(items)
+    cdef Py_ssize_t index
+    cdef scom_frame_t frame
+    cdef scom_property_t cproperty
+
+    buffer = bytearray(count * READ_REQUEST_SIZE)
+    cdef unsigned char* data = <unsigned char*>PyByteArray_AS_STRING(buffer)
+
+    for index in range(count):
+        dst_addr, object_type, object_id, property_id = items[index]
+
+        scom_initialize_frame(&frame, &data[index * READ_REQUEST_SIZE], READ_REQUEST_SIZE)
+        frame.src_addr = src_addr
+        frame.dst_addr = dst_addr
+        scom_initialize_property(&cproperty, &frame)
+        cproperty.object_type = object_type
+        cproperty.object_id = object_id
+        cproperty.property_id = property_id
+        scom_encode_read_property(&cproperty)
+        scom_encode_request_frame(&frame)
+
+    return buffer, list(range(0, count * READ_REQUEST_SIZE, READ_REQUEST_SIZE))
+
+def decode_read_responses(data, property_format='float'):
+    """Decodes all responses to property read requests found in the given bytes.
+
+    Bytes not belonging to a frame with a valid header are skipped. An incomplete frame
+    at the end of the data is ignored. Frames with an invalid data checksum are returned
+    with error SCOM_ERROR_INVALID_FRAME.
+
+    :param data Concatenated response frames (bytes, bytearray, memoryview, etc.)
+    :param property_format The format of all values (ex. 'float') or a sequence giving the
+                           format of each response frame. Only fixed size formats are supported
+    :return A NumPy structured array with the fields 'src_addr', 'object_id', 'error' and 'value'
+            (see RESPONSE_DTYPE). A list of ResponseRecord is returned if NumPy is not installed.
+            The value is NaN if 'error' is not 0.
+    """
+    cdef const unsigned char[::1] source = data
+    cdef Py_ssize_t length = source.shape[0]
+    cdef Py_ssize_t position = 0
+    cdef Py_ssize_t data_length
+    cdef Py_ssize_t frame_length
+    cdef Py_ssize_t count = 0
+    cdef value_format_t value_format = FORMAT_FLOAT
+    cdef list value_formats = None
+    cdef scom_frame_t frame
+    cdef size_t value_length
+    cdef scom_error_t error
+    cdef uint32_t int_value
+    cdef float float_value
+    cdef response_record_t* record
+
+    if isinstance(property_format, str):
+        value_format = _get_value_format(property_format)
+    else:
+        value_formats = [_get_value_format(value) for value in property_format]
+
+    # Smallest frame accepted: Header, service flags and id, trailer
+    records = bytearray((length // (FRAME_HEADER_SIZE + 2 + FRAME_TRAILER_SIZE) + 1) * sizeof(response_record_t))
+    cdef response_record_t* records_buffer = <response_record_t*>PyByteArray_AS_STRING(records)
+    # The scomlib decodes frames in place (ex. the service flags). Decode a copy of each frame
+    # as the given data may be read-only
+    cdef bytearray scratch = bytearray(PROPERTY_VALUE_OFFSET + 4 + FRAME_TRAILER_SIZE)
+    cdef unsigned char* scratch_buffer = <unsigned char*>PyByteArray_AS_STRING(scratch)
+
+    while position + FRAME_HEADER_SIZE <= length:
+        # Hunt for a valid header
+        if source[position] != 0xAA or not _checksum_ok(&source[position + 1], 11):
+            position += 1
+            continue
+
+        data_length = _read_le16(&source[position + 10])
+        if data_length < 2:             # No service flags and id. Not a frame (same as scomlib and FrameParser)
+            position += 1
+            continue
+
+        frame_length = FRAME_HEADER_SIZE + data_length + FRAME_TRAILER_SIZE
+        if position + frame_length > length:
+            break
+
+        if value_formats is not None:
+            if count >= len(value_formats):
+                raise ValueError('More response frames than property formats given!')
+            value_format = value_formats[count]
+
+        if frame_length > len(scratch):
+            scratch = bytearray(frame_length)
+            scratch_buffer = <unsigned char*>PyByteArray_AS_STRING(scratch)
+        memcpy(scratch_buffer, &source[position], frame_length)
+        scom_initialize_frame(&frame, scratch_buffer, frame_length)
+        error = _decode_read_response(&frame, &value_length)
+
+        record = &records_buffer[count]
+        record.src_addr = _read_le32(&source[position + 2])
+        record.object_id = _read_le32(&source[position + PROPERTY_HEADER_OFFSET + 2]) \
+            if frame_length >= PROPERTY_VALUE_OFFSET + FRAME_TRAILER_SIZE else 0
+        record.value = NAN
+
+        if error == SCOM_ERROR_NO_ERROR:
+            int_value = 0
+            float_value = 0
+            if not _decode_value(value_format, &source[position + PROPERTY_VALUE_OFFSET], value_length,
+                                 &int_value, &float_value):
+                error = SCOM_ERROR_INVALID_DATA_LENGTH
+            else:
+                record.value = _value_object(value_format, int_value, float_value)
+        record.error = error
+
+        count += 1
+        position += frame_length
+
+    del records[count * sizeof(response_record_t):]
+
+    if numpy is not None:
+        return numpy.frombuffer(records, dtype=RESPONSE_DTYPE)
+    return [ResponseRecord._make(values) for values in RESPONSE_RECORD.iter_unpack(records)]
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+#
+# Pure Python implementation of the 'baseframe' extension module.
+#
+# Used if the extension modules could not be built (ex. no compiler or Cython
+# not installed). Behaves like the scomlib (see scomlib/scom_data_link.c).
+#
+
+import struct
+from itertools import accumulate
+
+SCOM_FRAME_HEADER_SIZE = 14
+SCOM_FRAME_TRAILER_SIZE = 2
+SCOM_START_BYTE = 0xAA
+
+SCOM_READ_PROPERTY_SERVICE = 0x01
+SCOM_WRITE_PROPERTY_SERVICE = 0x02
+
+SCOM_ERROR_NO_ERROR = 0x0000
+SCOM_ERROR_INVALID_FRAME = 0x0001
+SCOM_ERROR_INVALID_DATA_LENGTH = 0x0024
+SCOM_ERROR_STACK_BUFFER_TOO_SMALL = 0x0086
+
+_HEADER = struct.Struct('<BBIIH')           # Start byte, frame flags, src_addr, dst_addr, data_length
+_UINT16 = struct.Struct('<H')
+
+
+def calc_checksum(data) -> int:
+    """Calculates the SCOM checksum of the given bytes.
+
+    :return The checksum as 16 bit value (A in the lower byte, B in the upper byte)
+    """
+    # Same as the byte by byte algorithm of scom_data_link.c, but the loops run in C
+    a = (0xFF + sum(data)) & 0xFF
+    b = (len(data) * 0xFF + sum(accumulate(data))) & 0xFF
+    return a | (b << 8)
+
+
+class BaseFrame(object):
+    """Provides low-level functionality for an SCOM Frame
+
+    Pure Python counterpart of the BaseFrame extension type. The frame bytes are
+    kept in a bytearray of 'buffer_size' bytes.
+    """
+
+    def __init__(self, buffer_size: int):
+        self._buffer = bytearray(buffer_size)
+        self._src_addr = 0
+        self._dst_addr = 0
+        self._data_length = 0
+        self._service_id = SCOM_READ_PROPERTY_SERVICE
+        self._last_error = SCOM_ERROR_NO_ERROR
+
+    def initialize(self, src_addr: int, dest_addr: int, data_length: int = 0):
+        self._src_addr = src_addr
+        self._dst_addr = dest_addr
+        self._data_length = data_length
+
+        assert len(self._buffer) >= self.frame_length(), 'Buffer is too small!'
+
+        # Write frame attributes into buffer
+        self.encode_request()
+
+    def reset(self):
+        """Resets the frame attributes (ex. before reusing the frame). The buffer is kept."""
+        self._src_addr = 0
+        self._dst_addr = 0
+        self._data_length = 0
+        self._service_id = SCOM_READ_PROPERTY_SERVICE
+        self._last_error = SCOM_ERROR_NO_ERROR
+
+    def encode_request(self):
+        """Writes the frame attributes into the buffer."""
+        encode_request_frame(self)
+
+    def initialize_using_bytearray(self, byte_array: bytearray or bytes, array_size: int):
+        """Initializes the frame using the content of a byte array."""
+        if array_size < 0 or array_size > len(byte_array):
+            raise ValueError('Array size exceeds the byte array given!')
+        if array_size > len(self._buffer):
+            raise ValueError('Buffer is too small!')
+
+        self._buffer[:array_size] = byte_array[:array_size]
+
+        decode_frame_header(self)
+
+    def __str__(self):
+        return 'src_addr: ' + str(self._src_addr) + ',' + \
+               'dst_addr: ' + str(self._dst_addr) + ',' + \
+               'service_id: ' + str(self._service_id) + ',' + \
+               'data_length: ' + str(self._data_length) + ',' \
+               'buff:' + self.buffer_as_hex_string() + ', ' + str(len(self._buffer))
+
+    def frame_length(self) -> int:
+        return SCOM_FRAME_HEADER_SIZE + self._data_length + SCOM_FRAME_TRAILER_SIZE
+
+    def buffer_as_hex_string(self) -> str:
+        """Returns frame buffer as HEX string"""
+        return self._buffer[:self._view_length()].hex(' ').upper()
+
+    def set_data_length(self, data_length: int, encode: bool = True):
+        """Sets the data_length field of the frame
+
+        :param encode If False, only the attribute is set. The buffer is left untouched.
+        """
+        self._data_length = data_length
+
+        if encode:
+            assert len(self._buffer) >= self.frame_length(), 'Buffer is too small!'
+
+            encode_request_frame(self)
+
+    def data_length(self) -> int:
+        return self._data_length
+
+    def buffer_size(self) -> int:
+        return len(self._buffer)
+
+    def resize_buffer(self, buffer_size: int):
+        """Changes the size of the frame buffer. The content is kept (as far as it fits)."""
+        if buffer_size < len(self._buffer):
+            del self._buffer[buffer_size:]
+        else:
+            self._buffer.extend(bytes(buffer_size - len(self._buffer)))
+
+    def src_addr(self) -> int:
+        return self._src_addr
+
+    def dst_addr(self) -> int:
+        return self._dst_addr
+
+    def print_cframe(self):
+        print(self)
+
+    def copy_buffer(self) -> bytearray:
+        """Copies the frame buffer into a python byte array"""
+        return self._buffer[:self._view_length()]
+
+    def _view_length(self) -> int:
+        """Returns the number of bytes of the frame (limited to the buffer size)."""
+        return min(self.frame_length(), len(self._buffer))
+
+    def __getitem__(self, item):
+        """Returns a byte (or a bytearray for slices) of the frame."""
+        length = self._view_length()
+
+        if isinstance(item, slice):
+            return self._buffer[:length][item]
+
+        index = item + length if item < 0 else item
+        if index < 0 or index >= length:
+            raise IndexError('Frame index out of range')
+        return self._buffer[index]
+
+    def __buffer__(self, flags):
+        """Gives access to the frame bytes using memoryview(frame) (Python 3.12 and above)."""
+        return memoryview(self._buffer)[:self._view_length()]
+
+    def is_valid(self) -> bool:
+        return self._last_error == SCOM_ERROR_NO_ERROR
+
+    def last_error(self):
+        return self._last_error
+
+
+#
+# Public/Exported python functions
+#
+def encode_request_frame(frame_obj: BaseFrame):
+    buffer = frame_obj._buffer
+
+    # The frame flags of a request must always be 0
+    _HEADER.pack_into(buffer, 0, SCOM_START_BYTE, 0, frame_obj._src_addr, frame_obj._dst_addr,
+                      frame_obj._data_length & 0xFFFF)
+    _UINT16.pack_into(buffer, 12, calc_checksum(buffer[1:12]))
+
+    # Service flags are always 0 for a request
+    buffer[SCOM_FRAME_HEADER_SIZE] = 0
+    buffer[SCOM_FRAME_HEADER_SIZE + 1] = frame_obj._service_id
+
+    end = SCOM_FRAME_HEADER_SIZE + frame_obj._data_length
+    if end + SCOM_FRAME_TRAILER_SIZE <= len(buffer):
+        _UINT16.pack_into(buffer, end, calc_checksum(buffer[SCOM_FRAME_HEADER_SIZE:end]))
+    else:
+        frame_obj._last_error = SCOM_ERROR_STACK_BUFFER_TOO_SMALL
+
+
+def decode_frame_header(frame_obj: BaseFrame):
+    buffer = frame_obj._buffer
+    if len(buffer) < SCOM_FRAME_HEADER_SIZE:
+        frame_obj._last_error = SCOM_ERROR_INVALID_FRAME
+        return
+
+    start_byte, _, frame_obj._src_addr, frame_obj._dst_addr, frame_obj._data_length = _HEADER.unpack_from(buffer)
+
+    if start_byte != SCOM_START_BYTE or frame_obj._data_length < 2 or \
+            frame_obj.frame_length() > len(buffer) or \
+            _UINT16.unpack_from(buffer, 12)[0] != calc_checksum(buffer[1:12]):
+        frame_obj._last_error = SCOM_ERROR_INVALID_FRAME
+
+
+def decode_frame_data(frame_obj: BaseFrame):
+    if frame_obj._last_error != SCOM_ERROR_NO_ERROR:
+        return
+
+    buffer = frame_obj._buffer
+    end = SCOM_FRAME_HEADER_SIZE + frame_obj._data_length
+
+    if _UINT16.unpack_from(buffer, end)[0] != calc_checksum(buffer[SCOM_FRAME_HEADER_SIZE:end]) or \
+            not buffer[SCOM_FRAME_HEADER_SIZE] & 0b10:
+        frame_obj._last_error = SCOM_ERROR_INVALID_FRAME
+
+    frame_obj._service_id = buffer[SCOM_FRAME_HEADER_SIZE + 1]
+
+
+def frame_length(frame_obj: BaseFrame):
+    return frame_obj.frame_length()
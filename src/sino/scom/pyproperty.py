@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+#
+# Pure Python implementation of the 'property' extension module.
+#
+# Used if the extension modules could not be built (ex. no compiler or Cython
+# not installed). Behaves like the scomlib (see scomlib/scom_property.c).
+#
+
+import struct
+from collections import namedtuple
+from .pybaseframe import BaseFrame, encode_request_frame, calc_checksum
+from .pybaseframe import SCOM_FRAME_HEADER_SIZE, SCOM_FRAME_TRAILER_SIZE, SCOM_START_BYTE
+from .pybaseframe import SCOM_READ_PROPERTY_SERVICE, SCOM_WRITE_PROPERTY_SERVICE
+from .pybaseframe import SCOM_ERROR_NO_ERROR, SCOM_ERROR_INVALID_FRAME, SCOM_ERROR_INVALID_DATA_LENGTH
+from .valuecodec import get_value_codec
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SCOM_SERVICE_HEADER_SIZE = 2
+SCOM_PROPERTY_HEADER_SIZE = 8
+
+PROPERTY_HEADER_OFFSET = SCOM_FRAME_HEADER_SIZE + SCOM_SERVICE_HEADER_SIZE
+PROPERTY_VALUE_OFFSET = PROPERTY_HEADER_OFFSET + SCOM_PROPERTY_HEADER_SIZE
+
+_PROPERTY_HEADER = struct.Struct('<HIH')            # Object type, object id, property id
+_RESPONSE_HEADER = struct.Struct('<BBIIHHBBHIH')    # Frame header, service header and property header
+_UINT16 = struct.Struct('<H')
+
+PropertyResponse = namedtuple('PropertyResponse', ['error', 'object_type', 'object_id', 'property_id', 'value'])
+PropertyResponse.__doc__ = """Result of decode_read_response().
+
+'error' is SCOM_ERROR_NO_ERROR (0) if 'value' holds the value read. Otherwise 'value' is None
+and 'error' tells the SCOM error code (ex. 0x22: object id not found).
+"""
+
+
+class Property(object):
+    """Low-Level SCOM Property
+    """
+
+    def __init__(self, frame: BaseFrame):
+        self._frame = frame
+
+    @property
+    def value_buffer_size(self) -> int:
+        return len(self._frame._buffer) - PROPERTY_VALUE_OFFSET
+
+    def set_object_read(self, object_type, object_id, property_id):
+        frame = self._frame
+        frame._service_id = SCOM_READ_PROPERTY_SERVICE
+        frame._data_length = SCOM_SERVICE_HEADER_SIZE + SCOM_PROPERTY_HEADER_SIZE
+        _PROPERTY_HEADER.pack_into(frame._buffer, PROPERTY_HEADER_OFFSET, object_type, object_id, property_id)
+
+        # Frame fields need to be updated in frame buffer
+        frame.encode_request()
+
+    def set_object_write(self, object_type, object_id, property_id, property_data, property_data_length,
+                         property_format='float'):
+        if property_data_length + 2 > self.value_buffer_size:      # Value and checksum
+            raise ValueError('Frame buffer too small for property value!')
+
+        codec = get_value_codec(property_format)
+        assert codec.value_size(property_data) == property_data_length, \
+            'Value size of property format \'%s\' is not %d!' % (property_format, property_data_length)
+
+        frame = self._frame
+        frame._service_id = SCOM_WRITE_PROPERTY_SERVICE
+        frame._data_length = SCOM_SERVICE_HEADER_SIZE + SCOM_PROPERTY_HEADER_SIZE + property_data_length
+        _PROPERTY_HEADER.pack_into(frame._buffer, PROPERTY_HEADER_OFFSET, object_type, object_id, property_id)
+        codec.pack_into(frame._buffer, PROPERTY_VALUE_OFFSET, property_data)
+
+        # Frame fields need to be updated in frame buffer
+        frame.encode_request()
+
+    def __str__(self):
+        return str(self.value_buffer_size)
+
+
+def _decode_read_response(data, offset: int, length: int):
+    """Validates the response frame found at 'offset' and decodes its headers.
+
+    :return A tuple (error, object_type, object_id, property_id, value_length)
+    """
+    if length < PROPERTY_VALUE_OFFSET + SCOM_FRAME_TRAILER_SIZE:
+        return SCOM_ERROR_INVALID_FRAME, None, None, None, 0
+
+    start_byte, _, _, _, data_length, header_checksum, flags, service_id, \
+        object_type, object_id, property_id = _RESPONSE_HEADER.unpack_from(data, offset)
+
+    end = offset + SCOM_FRAME_HEADER_SIZE + data_length
+    if start_byte != SCOM_START_BYTE or header_checksum != calc_checksum(data[offset + 1:offset + 12]) or \
+            data_length < PROPERTY_VALUE_OFFSET - SCOM_FRAME_HEADER_SIZE or \
+            SCOM_FRAME_HEADER_SIZE + data_length + SCOM_FRAME_TRAILER_SIZE > length or \
+            _UINT16.unpack_from(data, end)[0] != calc_checksum(data[offset + SCOM_FRAME_HEADER_SIZE:end]) or \
+            not flags & 0b10 or service_id != SCOM_READ_PROPERTY_SERVICE:
+        return SCOM_ERROR_INVALID_FRAME, None, None, None, 0
+
+    value_length = data_length - (PROPERTY_VALUE_OFFSET - SCOM_FRAME_HEADER_SIZE)
+
+    if flags & 0b01:
+        # Error responses carry the error code as value
+        if value_length != 2:
+            return SCOM_ERROR_INVALID_FRAME, None, None, None, 0
+        return _UINT16.unpack_from(data, offset + PROPERTY_VALUE_OFFSET)[0], \
+            object_type, object_id, property_id, value_length
+    return SCOM_ERROR_NO_ERROR, object_type, object_id, property_id, value_length
+
+
+def _get_fixed_size_codec(property_format: str):
+    codec = get_value_codec(property_format)
+    if codec.size is None:
+        raise ValueError('Property format \'%s\' has no fixed size' % property_format)
+    return codec
+
+
+def decode_read_response(frame: BaseFrame, property_format: str) -> PropertyResponse:
+    """Validates a response to a property read request and returns the value read in one pass.
+
+    See decode_read_response() of the 'property' extension module.
+    """
+    codec = get_value_codec(property_format)
+    buffer = frame._buffer
+
+    error, object_type, object_id, property_id, value_length = _decode_read_response(buffer, 0, len(buffer))
+    if object_type is not None:
+        _, _, frame._src_addr, frame._dst_addr, frame._data_length = \
+            struct.unpack_from('<BBIIH', buffer)
+        frame._service_id = buffer[SCOM_FRAME_HEADER_SIZE + 1]
+    frame._last_error = error
+
+    if error != SCOM_ERROR_NO_ERROR:
+        return PropertyResponse(error, object_type, object_id, property_id, None)
+
+    try:
+        value = codec.unpack(buffer[PROPERTY_VALUE_OFFSET:PROPERTY_VALUE_OFFSET + value_length])
+    except ValueError:
+        frame._last_error = SCOM_ERROR_INVALID_DATA_LENGTH
+        return PropertyResponse(SCOM_ERROR_INVALID_DATA_LENGTH, object_type, object_id, property_id, None)
+    return PropertyResponse(SCOM_ERROR_NO_ERROR, object_type, object_id, property_id, value)
+
+
+#
+# Batch codec for many property read requests and responses
+#
+READ_REQUEST_SIZE = PROPERTY_VALUE_OFFSET + SCOM_FRAME_TRAILER_SIZE     # Size of an encoded read request
+
+ResponseRecord = namedtuple('ResponseRecord', ['src_addr', 'object_id', 'error', 'value'])
+
+RESPONSE_RECORD = struct.Struct('=IIHd')
+RESPONSE_DTYPE = numpy.dtype([('src_addr', '=u4'), ('object_id', '=u4'), ('error', '=u2'), ('value', '=f8')]) \
+    if numpy is not None else None
+
+
+def encode_read_requests(requests, src_addr: int = 1):
+    """Encodes many property read requests into one contiguous buffer.
+
+    See encode_read_requests() of the 'property' extension module.
+    """
+    items = list(requests)
+    buffer = bytearray(len(items) * READ_REQUEST_SIZE)
+    frame = BaseFrame(READ_REQUEST_SIZE)
+    prop = Property(frame)
+
+    for index, (dst_addr, object_type, object_id, property_id) in enumerate(items):
+        frame.initialize(src_addr=src_addr, dest_addr=dst_addr)
+        prop.set_object_read(object_type, object_id, property_id)
+        buffer[index * READ_REQUEST_SIZE:(index + 1) * READ_REQUEST_SIZE] = frame._buffer
+
+    return buffer, list(range(0, len(buffer), READ_REQUEST_SIZE))
+
+
+def decode_read_responses(data, property_format='float'):
+    """Decodes all responses to property read requests found in the given bytes.
+
+    See decode_read_responses() of the 'property' extension module.
+    """
+    data = memoryview(data).cast('B')
+    length = len(data)
+    position = 0
+    records = []
+
+    if isinstance(property_format, str):
+        codec = _get_fixed_size_codec(property_format)
+        frame_codecs = None
+    else:
+        codec = None
+        frame_codecs = [_get_fixed_size_codec(value) for value in property_format]
+
+    while position + SCOM_FRAME_HEADER_SIZE <= length:
+        # Hunt for a valid header
+        if data[position] != SCOM_START_BYTE or \
+                _UINT16.unpack_from(data, position + 12)[0] != calc_checksum(data[position + 1:position + 12]):
+            position += 1
+            continue
+
+        data_length = _UINT16.unpack_from(data, position + 10)[0]
+        if data_length < 2:             # No service flags and id
+            position += 1
+            continue
+
+        frame_length = SCOM_FRAME_HEADER_SIZE + data_length + SCOM_FRAME_TRAILER_SIZE
+        if position + frame_length > length:
+            break
+
+        if frame_codecs is not None:
+            if len(records) >= len(frame_codecs):
+                raise ValueError('More response frames than property formats given!')
+            codec = frame_codecs[len(records)]
+
+        src_addr = struct.unpack_from('<I', data, position + 2)[0]
+        object_id = struct.unpack_from('<I', data, position + PROPERTY_HEADER_OFFSET + 2)[0] \
+            if frame_length >= PROPERTY_VALUE_OFFSET + SCOM_FRAME_TRAILER_SIZE else 0
+        value = float('nan')
+
+        error, _, _, _, value_length = _decode_read_response(data, position, frame_length)
+        if error == SCOM_ERROR_NO_ERROR:
+            start = position + PROPERTY_VALUE_OFFSET
+            try:
+                value = float(codec.unpack(data[start:start + value_length]))
+            except ValueError:
+                error = SCOM_ERROR_INVALID_DATA_LENGTH
+
+        records.append(ResponseRecord(src_addr, object_id, error, value))
+        position += frame_length
+
+    if numpy is not None:
+        return numpy.array(records, dtype=RESPONSE_DTYPE)
+    return records
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+
+from collections import OrderedDict
+from threading import Lock
+from .frame import Frame
+from .framepool import FramePool
+
+
+class RequestCache(object):
+    """Thread-safe LRU cache of encoded property read requests.
+
+    Read requests are identified by (destination address, object type, object id, property id).
+    A request is encoded (and checksummed) only the first time. Afterwards, the frame
+    returned by read_request() is initialized by copying the cached bytes.
+
+    If more than 'max_size' requests are cached, the least recently used one is dropped.
+    """
+
+    DEFAULT_MAX_SIZE = 256
+    SRC_ADDR = 1                    # Source address used in the requests
+
+    def __init__(self, frame_pool: FramePool = None, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        :param frame_pool Pool from which the request frames are taken. New frames are created if not given
+        :param max_size Maximum number of requests cached
+        """
+        super(RequestCache, self).__init__()
+        assert max_size > 0, 'Cache size too small!'
+        self._frame_pool = frame_pool
+        self._max_size = max_size
+        self._requests = OrderedDict()      # type: {tuple, bytes}
+        self._lock = Lock()
+
+        # Statistics
+        self.hits = 0               # Requests taken from the cache
+        self.misses = 0             # Requests encoded
+
+    def __len__(self):
+        return len(self._requests)
+
+    def clear(self):
+        with self._lock:
+            self._requests.clear()
+
+    def read_request(self, dst_addr: int, object_type: int, object_id: int, property_id: int) -> Frame:
+        """Returns a frame holding the request to read the given property.
+
+        The frame is taken from the frame pool (if any) and may be given back after use.
+        """
+        key = (dst_addr, object_type, object_id, property_id)
+
+        with self._lock:
+            data = self._requests.get(key)
+            if data is None:
+                self.misses += 1
+            else:
+                self._requests.move_to_end(key)
+                self.hits += 1
+
+        frame = self._frame_pool.acquire() if self._frame_pool is not None else Frame()
+
+        if data is None:
+            frame.initialize(src_addr=self.SRC_ADDR, dest_addr=dst_addr)
+            frame.get_property().set_object_read(object_type, object_id, property_id)
+            data = bytes(frame.copy_buffer())
+
+            with self._lock:
+                self._requests[key] = data
+                if len(self._requests) > self._max_size:
+                    self._requests.popitem(last=False)
+        else:
+            frame.initialize_using_bytearray(data, len(data))
+        return frame
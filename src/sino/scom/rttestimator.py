@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+
+
+class RttEstimator(object):
+    """Estimates the round trip time (RTT) of a device on the SCOM bus.
+
+    Uses the smoothed RTT (SRTT) and RTT variance (RTTVAR) algorithm known
+    from TCP (RFC 6298) to calculate the response timeout (RTO).
+
+    Every response received gives a new RTT sample. In case of a response
+    timeout the RTO is doubled (backoff) but limited to MAX_BACKOFF times the
+    calculated RTO, so that a device which went silent blocks the bus only
+    for a few RTTs.
+    """
+
+    ALPHA = 1.0 / 8         # Gain for SRTT
+    BETA = 1.0 / 4          # Gain for RTTVAR
+    K = 4                   # RTTVAR factor
+
+    MIN_RTO = 0.1           # Minimum response timeout in seconds
+    MAX_BACKOFF = 4         # Maximum backoff factor applied after timeouts
+
+    def __init__(self, initial_rto: float, min_rto: float = MIN_RTO, max_rto: float = None):
+        """
+        :param initial_rto Timeout in seconds to use as long as no RTT sample is available
+        :type initial_rto float
+        :param min_rto Lower limit of the calculated timeout
+        :type min_rto float
+        :param max_rto Upper limit of the calculated timeout. Defaults to 'initial_rto'
+        :type max_rto float
+        """
+        super(RttEstimator, self).__init__()
+        self._initial_rto = float(initial_rto)
+        self._min_rto = float(min_rto)
+        self._max_rto = float(max_rto) if max_rto is not None else self._initial_rto
+        self._srtt = None           # type: float or None
+        self._rttvar = None         # type: float or None
+        self._backoff = 1
+        self.samples = 0            # Number of RTT samples taken
+        self.timeouts = 0           # Number of response timeouts
+
+    def set_initial_rto(self, initial_rto: float, max_rto: float = None):
+        """Changes the timeout used as long as no RTT sample is available and the upper limit.
+
+        :param max_rto Upper limit of the calculated timeout. Defaults to 'initial_rto'
+        """
+        self._initial_rto = float(initial_rto)
+        self._max_rto = float(max_rto) if max_rto is not None else self._initial_rto
+
+    @property
+    def srtt(self) -> float or None:
+        """Returns the smoothed round trip time in seconds (None if no sample was taken yet)."""
+        return self._srtt
+
+    @property
+    def rttvar(self) -> float or None:
+        """Returns the round trip time variance in seconds (None if no sample was taken yet)."""
+        return self._rttvar
+
+    @property
+    def rto(self) -> float:
+        """Returns the time in seconds to wait for a response."""
+        if self._srtt is None:
+            return self._initial_rto
+
+        rto = max(self._min_rto, self._srtt + self.K * self._rttvar) * self._backoff
+        return min(rto, self._max_rto)
+
+    def update(self, rtt: float):
+        """Adds a new RTT sample (in seconds) to the estimation."""
+        if self._srtt is None:
+            self._srtt = rtt
+            self._rttvar = rtt / 2
+        else:
+            self._rttvar = (1 - self.BETA) * self._rttvar + self.BETA * abs(self._srtt - rtt)
+            self._srtt = (1 - self.ALPHA) * self._srtt + self.ALPHA * rtt
+
+        self._backoff = 1
+        self.samples += 1
+
+    def timeout(self):
+        """Tells the estimator that no response was received in time."""
+        self._backoff = min(self._backoff * 2, self.MAX_BACKOFF)
+        self.timeouts += 1
+
+    def __str__(self):
+        if self._srtt is None:
+            return 'srtt: -, rttvar: -, rto: %.3f' % self.rto
+        return 'srtt: %.3f, rttvar: %.3f, rto: %.3f' % (self._srtt, self._rttvar, self.rto)
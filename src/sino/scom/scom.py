@@ -2,135 +2,593 @@
 # -*- coding: utf-8 -*-
 
 from threading import Lock
+from concurrent.futures import CancelledError, Future, TimeoutError
 import time
-import serial
-from serial.serialutil import SerialException, SerialTimeoutException
 import logging
-from .baseframe import BaseFrame
+from .codec import BaseFrame, PropertyResponse, decode_read_response
 from .frame import Frame
+from .frameparser import FrameParser
+from .framepool import FramePool
+from .requestcache import RequestCache
+from .valuecodec import get_value_codec
+from .rttestimator import RttEstimator
+from .busdispatcher import BusDispatcher
+from .capture import Capture, CaptureWriter
+from .trace import HexFrame, FlightRecorder
+from .exception import TransportException
+from .transport import Transport, TransportFactory
+
+try:
+    from . import transaction       # Optional extension module (POSIX only)
+except ImportError:
+    transaction = None
 
 
 class Scom(object):
-    """Handles the SCOM serial connection.
+    """Handles the SCOM connection.
+
+    The bytes are sent and received using a Transport (serial port, TCP socket, etc.).
     """
 
     log = logging.getLogger(__name__)
 
     rxErrors = 0
+    orphanFrames = 0                # Frames received not matching the outstanding request
+    coalescedReads = 0              # Reads answered by the transaction of an identical concurrent read
+
+    DEFAULT_RX_TIMEOUT = 3.0        # Default time in seconds to wait for a response frame
+    MUTEX_TIMEOUT = 10              # Maximum time in seconds to wait for the bus
 
     def __init__(self):
         super(Scom, self).__init__()
-        self._ser = None  # type: serial.Serial or None
+        self._transport = None          # type: Transport or None
         self._mutex = Lock()
-        self._rxBuffer = bytearray()     # All bytes received go in here
+        self._frame_pool = FramePool()  # Frames reused for requests and responses
+        self._request_cache = RequestCache(self._frame_pool)        # Encoded read requests
+        self._parser = FrameParser(frame_pool=self._frame_pool)     # All bytes received go in here
+        self._rx_timeout = self.DEFAULT_RX_TIMEOUT
+        self._adaptive_rx_timeout = False
+        self._rtt_estimators = {}       # type: {int, RttEstimator}
+        self._dispatcher = None         # type: BusDispatcher or None
+        self._capture = None            # type: CaptureWriter or None
+        self._native_transactions = False
+        self._flight_recorder = FlightRecorder()        # type: FlightRecorder or None
+        self._in_flight_reads = {}      # type: {tuple, Future}
+        self._in_flight_lock = Lock()
 
-    def initialize(self, com_port: str, baudrate: str or int = '38400'):
+    def initialize(self, com_port: str or Transport, baudrate: str or int = '38400'):
         """Initializes the instance and connects to the given COM port.
 
-        :param com_port Name of the COM port. Ex. '/dev/ttyUSB0', 'COM1', etc.
+        :param com_port Name of the COM port. Ex. '/dev/ttyUSB0', 'COM1', etc. A URL
+                        like 'socket://192.168.1.20:4001' or a Transport instance
+                        are accepted too.
         :param baudrate Baud rate of the COM port. Default value is '38400'
+        :raises TransportException If the COM port could not be opened or its name is invalid
         """
         try:
-            self._ser = serial.Serial(port=com_port,
-                                      baudrate=baudrate,
-                                      parity=serial.PARITY_EVEN)
-            # Set RX timeout
-            self._ser.timeout = 1    # second
-        except Exception as msg:
-            self.log.info(msg)
-            exit()
-
-    def set_rx_timeout(self, seconds: int) -> bool:
-        """Sets the time to wait for a message to be received."""
-        if self._ser:
-            self._ser.timeout = seconds
+            if isinstance(com_port, Transport):
+                transport = com_port
+            else:
+                transport = TransportFactory.create(com_port, baudrate)
+
+            if not transport.is_open:
+                transport.open()
+            self._transport = transport
+        except TransportException as e:
+            self.log.error(e)
+            raise
+        except ValueError as e:
+            self.log.error(e)
+            raise TransportException(str(e)) from e
+
+    @property
+    def frame_pool(self) -> FramePool:
+        """Returns the pool of frames used by the SCOM interface.
+
+        Frames returned by write_frame() may be given back to this pool once they are not used anymore.
+        """
+        return self._frame_pool
+
+    @property
+    def request_cache(self) -> RequestCache:
+        """Returns the cache of encoded read requests.
+
+        Frames returned by RequestCache.read_request() are taken from the frame pool.
+        """
+        return self._request_cache
+
+    @property
+    def transport(self) -> Transport or None:
+        """Returns the transport used to access the SCOM interface."""
+        return self._transport
+
+    def set_rx_timeout(self, seconds: float) -> bool:
+        """Sets the default time to wait for a response frame.
+
+        Fractions of a second are allowed. The value is used by write_frame()
+        if no timeout is given explicitly. It is also the upper limit of the
+        adaptive response timeout (see enable_adaptive_rx_timeout()).
+        """
+        if self._transport:
+            self._rx_timeout = float(seconds)
+            for estimator in self._rtt_estimators.values():
+                estimator.set_initial_rto(self._rx_timeout)
             return True
         return False
 
-    def write_frame(self, frame: BaseFrame, rx_timeout_in_seconds=3.0) -> Frame or None:
+    @property
+    def rx_timeout(self) -> float:
+        """Returns the default time in seconds to wait for a response frame."""
+        return self._rx_timeout
+
+    def enable_adaptive_rx_timeout(self, enable: bool = True):
+        """Enables/disables the response timeout calculated using the RTT estimation.
+
+        If enabled, write_frame() waits for a response as long as the RTT estimator of
+        the destination address tells (see RttEstimator.rto) if no timeout is given
+        explicitly. Otherwise the default rx timeout is used (default).
+
+        Slow responses (ex. writes to flash using PROPERTY_VALUE_QSP) may then time out.
+        Give an explicit timeout for these requests.
+        """
+        self._adaptive_rx_timeout = enable
+
+    def rtt_estimate(self, device_address: int) -> RttEstimator or None:
+        """Returns the RTT estimator of the given device address or None if the
+        device was never addressed.
+        """
+        return self._rtt_estimators.get(device_address)
+
+    @property
+    def rtt_estimates(self) -> {int, RttEstimator}:
+        """Returns the RTT estimators of all device addresses addressed so far."""
+        return dict(self._rtt_estimators)
+
+    def _get_rtt_estimator(self, device_address: int) -> RttEstimator:
+        estimator = self._rtt_estimators.get(device_address)
+        if estimator is None:
+            estimator = RttEstimator(initial_rto=self._rx_timeout)
+            self._rtt_estimators[device_address] = estimator
+        return estimator
+
+    def _response_timeout(self, device_address: int, rx_timeout_in_seconds: float = None) -> float:
+        """Returns the time to wait for a response of the device if no rx timeout is given."""
+        if rx_timeout_in_seconds is not None:
+            return rx_timeout_in_seconds
+        return self._get_rtt_estimator(device_address).rto if self._adaptive_rx_timeout else self._rx_timeout
+
+    def enable_native_transactions(self, enable: bool = True) -> bool:
+        """Enables/disables read transactions executed by the 'transaction' extension module.
+
+        If enabled, read_property_value() encodes the request, writes it, reads the response
+        and decodes its value in C without holding the GIL. Needs the 'transaction' extension
+        module and a transport providing a file descriptor. Not used while the BusDispatcher
+        is running.
+
+        :return True if native transactions are enabled
+        """
+        if enable:
+            if transaction is None or not self._transport:
+                return False
+            try:
+                self._transport.fileno()
+            except (TransportException, NotImplementedError):
+                return False
+        self._native_transactions = enable
+        return enable
+
+    @property
+    def native_transactions(self) -> bool:
+        """Returns True if read transactions are executed by the 'transaction' extension module."""
+        return self._native_transactions
+
+    def start_dispatcher(self) -> BusDispatcher:
+        """Starts a BusDispatcher executing all transactions in priority order.
+
+        Once started, write_frame() queues the frame into the dispatcher and waits
+        for the response.
+        """
+        if not self._dispatcher:
+            self._dispatcher = BusDispatcher(self)
+        self._dispatcher.start()
+        return self._dispatcher
+
+    def stop_dispatcher(self):
+        """Stops the BusDispatcher. Transactions are then executed by the calling threads.
+
+        The BusDispatcher is kept until its thread ended, so that no transaction gets
+        executed while the thread still uses the bus.
+        """
+        if self._dispatcher:
+            self._dispatcher.stop()
+            if not self._dispatcher.is_running():
+                self._dispatcher = None
+
+    @property
+    def dispatcher(self) -> BusDispatcher or None:
+        """Returns the BusDispatcher or None if not started."""
+        return self._dispatcher
+
+    def start_capture(self, file_name: str) -> CaptureWriter:
+        """Records all frames written and received into the given capture file.
+
+        The capture can be replayed later using a ReplayTransport.
+        """
+        self.stop_capture()
+        self._capture = CaptureWriter(file_name)
+        return self._capture
+
+    def stop_capture(self):
+        if self._capture:
+            self._capture.close()
+            self._capture = None
+
+    @property
+    def flight_recorder(self) -> FlightRecorder or None:
+        """Returns the recorder keeping the last frames written and received (None if disabled)."""
+        return self._flight_recorder
+
+    def enable_flight_recorder(self, size: int = FlightRecorder.DEFAULT_SIZE):
+        """Enables/disables the flight recorder.
+
+        :param size Number of frames to keep. 0 disables the flight recorder
+        """
+        self._flight_recorder = FlightRecorder(size) if size > 0 else None
+
+    def dump_flight_recorder(self, reason: str = '', level: int = logging.ERROR):
+        """Logs the last frames written and received (ex. after a scan failed)."""
+        if self._flight_recorder is not None:
+            self._flight_recorder.dump(self.log, level, reason)
+
+    def _capture_frame(self, direction: int, data: bytes or bytearray = b'', outcome: int = Capture.OUTCOME_OK):
+        if self._flight_recorder is not None:
+            self._flight_recorder.record(direction, data, outcome)
+        if self._capture:
+            self._capture.write_record(direction, data, outcome)
+
+    def _capture_response(self, response_frame: Frame or None, rx_errors: int):
+        """Records the outcome of a transaction.
+
+        :param rx_errors RX errors counted before the response was read
+        """
+        if not self._capture and self._flight_recorder is None:
+            return
+        if response_frame is not None:
+            self._capture_frame(Capture.DIRECTION_RX, response_frame.copy_buffer())
+        elif self.rxErrors != rx_errors:
+            self._capture_frame(Capture.DIRECTION_RX, outcome=Capture.OUTCOME_RX_ERROR)
+        else:
+            self._capture_frame(Capture.DIRECTION_RX, outcome=Capture.OUTCOME_TIMEOUT)
+
+    def write_frame(self, frame: BaseFrame, rx_timeout_in_seconds: float = None,
+                    priority: int = BusDispatcher.PRIORITY_TELEMETRY) -> Frame or None:
         """Writes a frame to the SCOM interface
 
         :param frame Frame to send.
         :type frame Frame
-        :param rx_timeout_in_seconds Maximum time to wait for the response frame.
+        :param rx_timeout_in_seconds Maximum time to wait for the response frame. If not given,
+                                     the timeout is taken from the RTT estimation of the
+                                     destination device or the default rx timeout is used.
         :type rx_timeout_in_seconds float
+        :param priority Priority class used when the BusDispatcher is running
+                        (ex. BusDispatcher.PRIORITY_CONTROL)
+        :type priority int
         """
-        if not self._ser:
+        if not self._transport:
             return None
 
-        self.log.debug('TX: ' + frame.buffer_as_hex_string())
+        if self._dispatcher and not self._dispatcher.in_dispatcher_thread():
+            future = self._dispatcher.submit(frame, rx_timeout_in_seconds, priority)
+            try:
+                return future.result(timeout=self.MUTEX_TIMEOUT +
+                                     self._response_timeout(frame.dst_addr(), rx_timeout_in_seconds))
+            except CancelledError:
+                self.log.error('Frame not written. Dispatcher stopped!')
+                return None
+            except TimeoutError:
+                future.cancel()
+                self.log.error('No response from dispatcher!')
+                return None
+
         buffer = frame.copy_buffer()
 
-        lock_acquired = self._mutex.acquire(blocking=True, timeout=10)        # lock
+        lock_acquired = self._mutex.acquire(blocking=True, timeout=self.MUTEX_TIMEOUT)        # lock
         response_frame = Frame()
         if lock_acquired:
             try:
-                self.set_rx_timeout(int(rx_timeout_in_seconds))  # Set time to wait for the response
-                self._ser.write(buffer)
-            except SerialTimeoutException:
-                self.log.error('Error writing frame!')
+                response_frame = self._execute(buffer, frame.dst_addr(), rx_timeout_in_seconds)
             finally:
-                response_frame = self._read_frame()
                 self._mutex.release()       # unlock
         else:
             self.log.error('Could not lock mutex!')
         return response_frame
 
+    def _execute(self, buffer: bytearray, dst_addr: int, rx_timeout_in_seconds: float = None) -> Frame or None:
+        """Writes the request and reads its response. The caller needs to hold the bus lock.
+        """
+        rtt_estimator = self._get_rtt_estimator(dst_addr)
+        rx_timeout_in_seconds = self._response_timeout(dst_addr, rx_timeout_in_seconds)
+
+        self.log.debug('TX: %s', HexFrame(buffer))
+
+        try:
+            self._discard_stale_frames()
+            self._transport.write(buffer)
+            self._capture_frame(Capture.DIRECTION_TX, buffer)
+        except TransportException:
+            self.log.error('Error writing frame!')
+            self.dump_flight_recorder()
+
+        # Time to wait for the response starts after the frame is written
+        start_time = time.monotonic()
+        rx_errors = self.rxErrors
+        response_frame = self._read_response(buffer, wait_time=float(rx_timeout_in_seconds))
+        self._capture_response(response_frame, rx_errors)
+        if response_frame is not None:
+            rtt_estimator.update(time.monotonic() - start_time)
+        else:
+            rtt_estimator.timeout()
+        return response_frame
+
+    def read_property_value(self, dst_addr: int, object_type: int, object_id: int, property_id: int,
+                            property_format: str, rx_timeout_in_seconds: float = None,
+                            priority: int = BusDispatcher.PRIORITY_TELEMETRY) -> PropertyResponse or None:
+        """Reads a property of a device and decodes its value according to the property format.
+
+        Uses native transactions if enabled (see enable_native_transactions()).
+
+        Identical reads called concurrently by other threads share the transaction of the
+        first one and all get its response (see coalescedReads). They wait at most as long
+        as a read of their own (MUTEX_TIMEOUT plus their rx timeout).
+
+        :param property_format Format of the value (see property.decode_read_response())
+        :return The decoded response or None if no response was received
+        """
+        request = (dst_addr, object_type, object_id, property_id, property_format)
+
+        with self._in_flight_lock:
+            in_flight_read = self._in_flight_reads.get(request)
+            if in_flight_read is None:
+                self._in_flight_reads[request] = future = Future()
+            else:
+                self.coalescedReads += 1
+
+        if in_flight_read is not None:
+            try:
+                return in_flight_read.result(timeout=self.MUTEX_TIMEOUT +
+                                             self._response_timeout(dst_addr, rx_timeout_in_seconds))
+            except TimeoutError:
+                self.log.warning('No response to coalesced read!')
+                return None
+
+        try:
+            response = self.read_property_values([request], rx_timeout_in_seconds, priority)[0]
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight_reads[request]
+
+    def read_property_values(self, requests, rx_timeout_in_seconds: float = None,
+                             priority: int = BusDispatcher.PRIORITY_TELEMETRY) -> [PropertyResponse or None]:
+        """Reads many properties back-to-back holding the bus lock only once.
+
+        Ex.: scom.read_property_values([(101, 1, 3000, 1, 'float'), (101, 1, 3005, 1, 'float')])
+
+        While the BusDispatcher is running, all reads are submitted to the dispatcher as one request.
+
+        :param requests Sequence of (dst_addr, object_type, object_id, property_id, property_format) tuples
+        :param rx_timeout_in_seconds Maximum time to wait for each response (see write_frame())
+        :return The decoded responses in the order of the requests. None for requests without response
+        """
+        requests = list(requests)
+        if not self._transport:
+            return [None] * len(requests)
+
+        if self._dispatcher and not self._dispatcher.in_dispatcher_thread():
+            future = self._dispatcher.submit_call(self.read_property_values, requests, rx_timeout_in_seconds,
+                                                  priority, priority=priority)
+            try:
+                return future.result(timeout=self.MUTEX_TIMEOUT +
+                                     sum(self._response_timeout(request[0], rx_timeout_in_seconds)
+                                         for request in requests))
+            except CancelledError:
+                self.log.error('Properties not read. Dispatcher stopped!')
+                return [None] * len(requests)
+            except TimeoutError:
+                future.cancel()
+                self.log.error('No response from dispatcher!')
+                return [None] * len(requests)
+
+        if not self._mutex.acquire(blocking=True, timeout=self.MUTEX_TIMEOUT):       # lock
+            self.log.error('Could not lock mutex!')
+            return [None] * len(requests)
+
+        try:
+            return [self._read_property_value_locked(*request, rx_timeout_in_seconds=rx_timeout_in_seconds)
+                    for request in requests]
+        finally:
+            self._mutex.release()       # unlock
+
+    def _read_property_value_locked(self, dst_addr: int, object_type: int, object_id: int, property_id: int,
+                                    property_format: str,
+                                    rx_timeout_in_seconds: float = None) -> PropertyResponse or None:
+        """Reads a property. The caller needs to hold the bus lock."""
+        # Values of variable size (ex. strings) are not decoded natively
+        if self._native_transactions and not self._dispatcher and get_value_codec(property_format).size is not None:
+            return self._read_property_value_native(dst_addr, object_type, object_id, property_id,
+                                                    property_format, rx_timeout_in_seconds)
+
+        request_frame = self._request_cache.read_request(dst_addr, object_type, object_id, property_id)
+        response_frame = None
+        try:
+            response_frame = self._execute(request_frame.copy_buffer(), dst_addr, rx_timeout_in_seconds)
+            if not response_frame:
+                return None
+            return decode_read_response(response_frame, property_format)
+        finally:
+            self._frame_pool.release(request_frame)
+            if response_frame is not None:
+                self._frame_pool.release(response_frame)
+
+    def _read_property_value_native(self, dst_addr: int, object_type: int, object_id: int, property_id: int,
+                                    property_format: str,
+                                    rx_timeout_in_seconds: float = None) -> PropertyResponse or None:
+        """Executes a read transaction using the 'transaction' extension module. The caller
+        needs to hold the bus lock.
+        """
+        rtt_estimator = self._get_rtt_estimator(dst_addr)
+        rx_timeout_in_seconds = self._response_timeout(dst_addr, rx_timeout_in_seconds)
+
+        self._discard_stale_frames()
+        result = transaction.read_property(self._transport.fileno(), dst_addr, object_type, object_id,
+                                           property_id, property_format, float(rx_timeout_in_seconds))
+
+        self.log.debug('TX: %s', HexFrame(result.request))
+        self._capture_frame(Capture.DIRECTION_TX, result.request)
+        self.orphanFrames += result.orphan_frames
+        self.rxErrors += result.rx_errors
+
+        if result.status == transaction.STATUS_OK:
+            self.log.debug('RX: %s', HexFrame(result.response))
+            self._capture_frame(Capture.DIRECTION_RX, result.response)
+            rtt_estimator.update(result.rtt)
+            return PropertyResponse(*result[1:6])
+
+        if result.status == transaction.STATUS_IO_ERROR:
+            self.log.error('Error reading from transport! (errno %d)' % result.os_error)
+            self.dump_flight_recorder()
+        elif not result.rx_errors:
+            self.log.info('Warning: No response from device')
+        self._capture_frame(Capture.DIRECTION_RX,
+                            outcome=Capture.OUTCOME_RX_ERROR if result.rx_errors else Capture.OUTCOME_TIMEOUT)
+        rtt_estimator.timeout()
+        return None
+
+    @classmethod
+    def _is_response_to(cls, request: bytearray, response_frame: Frame) -> bool:
+        """Checks if the response frame answers the given request.
+
+        Source and destination address, service id and (for property services) object
+        type, object id and property id of both frames need to match.
+
+        :param request The request frame as sent on the bus
+        :type request bytearray
+        """
+        if response_frame[2:6] != request[6:10] or response_frame[6:10] != request[2:6]:
+            return False
+
+        if len(request) < Frame.HEADER_SIZE + 2:
+            return True
+        if response_frame[15:16] != request[15:16]:     # Service id
+            return False
+
+        if len(request) < Frame.HEADER_SIZE + 10:
+            return True
+        return response_frame[16:24] == request[16:24]   # Object type, object id and property id
+
+    def _read_response(self, request: bytearray, wait_time=1.0) -> Frame or None:
+        """Reads frames from the SCOM interface until the response to the request is received.
+
+        Frames not matching the request (ex. late responses to previous requests) are
+        discarded and counted in 'orphanFrames'.
+
+        :param request The request frame as sent on the bus
+        :type request bytearray
+        :param wait_time Time in seconds to wait
+        :type wait_time float
+        """
+        deadline = time.monotonic() + wait_time
+
+        while True:
+            response_frame = self._read_frame(wait_time=max(deadline - time.monotonic(), 0))
+            if response_frame is None or self._is_response_to(request, response_frame):
+                return response_frame
+
+            self.orphanFrames += 1
+            self._capture_frame(Capture.DIRECTION_RX, response_frame.copy_buffer(), Capture.OUTCOME_ORPHAN)
+            self.log.warning('Discarding frame not matching request: %s', HexFrame(response_frame))
+            self._frame_pool.release(response_frame)
+
+    def _discard_stale_frames(self):
+        """Discards all data received while no request was outstanding.
+        """
+        try:
+            data = self._transport.read(4096, 0)
+            while data:
+                self._parser.feed(data)
+                data = self._transport.read(4096, 0)
+        except TransportException:
+            self.log.error('Error reading stale bytes!')
+
+        for frame in self._parser.frames():
+            self.orphanFrames += 1
+            self._capture_frame(Capture.DIRECTION_RX, frame.copy_buffer(), Capture.OUTCOME_ORPHAN)
+            self.log.warning('Discarding stale frame: %s', HexFrame(frame))
+            self._frame_pool.release(frame)
+        self._parser.clear()
+
     def _read_frame(self, wait_time=1.0) -> Frame or None:
         """Reads a frame from the SCOM interface
 
+        Blocks on the transport until the bytes needed by the frame parser
+        are received. The parser needs first the frame header to decode the
+        'data_length' field and then exactly the remaining bytes of the frame.
+
         :param wait_time Time in seconds to wait
         :type wait_time float
         """
-        if not self._ser:
+        if not self._transport:
             return None
 
-        response_frame = Frame()
-        rx_data_size_total = 0          # Size of data received in this turn
-
-        while wait_time > 0:
-            fract_wait_time = 0.10
-            time.sleep(fract_wait_time)         # Wait a bit to get data back from SCOM interface
-            rx_data_size = self._ser.in_waiting  # Check how many bytes available
-
-            if rx_data_size:
-                try:
-                    # Read the bytes and put it into rx buffer
-                    self._rxBuffer += bytearray(self._ser.read(rx_data_size))
-                    # Update size counter
-                    rx_data_size_total += rx_data_size
-                except SerialException:
-                    self.log.error('Error reading serial buffer!')
-                    return None
-
-            if rx_data_size_total > Frame.HEADER_SIZE + Frame.TRAILER_SIZE:
-                # Try to parse a frame for the rx buffer
-                success, length = response_frame.parse_frame_from_string(self._rxBuffer)
-
-                if success:
-                    # Remove the size of the received frame for the rx buffer
-                    self._rxBuffer = self._rxBuffer[length:]
-                    self.log.debug('RX: ' + response_frame.as_hex_string())
-                    return response_frame
-                else:
-                    self.rxErrors += 1
-                    return None
-
-            wait_time -= fract_wait_time
-
-        if rx_data_size_total == 0:
-            self.log.info('Warning: No response from device')
+        deadline = time.monotonic() + wait_time
+        rx_errors = self._parser.errors
 
-        return None
+        try:
+            response_frame = self._parser.next_frame()
+            while response_frame is None:
+                remaining_time = deadline - time.monotonic()
+                if remaining_time <= 0:
+                    break
+                self._parser.feed(self._transport.read(self._parser.bytes_needed(), remaining_time))
+                response_frame = self._parser.next_frame()
+        except TransportException:
+            self.log.error('Error reading from transport!')
+            self.dump_flight_recorder()
+            return None
+
+        return self._frame_received(response_frame, rx_errors)
+
+    def _frame_received(self, response_frame: Frame or None, rx_errors: int) -> Frame or None:
+        """Updates the RX error counter after a frame was read.
+
+        :param response_frame The frame read or None on timeout
+        :param rx_errors Parser errors counted before the frame was read
+        """
+        # Corrupt frames discarded by the parser or incomplete frame
+        corrupt = self._parser.errors != rx_errors or (response_frame is None and len(self._parser) > 0)
+        if corrupt:
+            self.rxErrors += 1
+
+        if response_frame is not None:
+            self.log.debug('RX: %s', HexFrame(response_frame))
+        elif not corrupt:
+            self.log.info('Warning: No response from device')
+        return response_frame
 
     def reset(self):
         """Resets/clears the input buffers.
         """
         # Reset RX buffers
-        self._ser.reset_input_buffer()
-        self._rxBuffer.clear()
+        self._transport.reset_input_buffer()
+        self._parser.clear()
 
     def close(self):
-        if self._ser:
-            self._ser.close()
-            self._ser = None
+        self.stop_dispatcher()
+        self.stop_capture()
+        if self._transport:
+            self._transport.close()
+            self._transport = None
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import platform
 from distutils.core import setup
 from distutils.extension import Extension
 from Cython.Distutils import build_ext
@@ -15,17 +16,26 @@ from Cython.Build import cythonize
 # folder (example):
 # mv property.*.so sino/scom/
 # mv baseframe.*.so sino/scom/
+# mv transaction.*.so sino/scom/
 #
+ext_modules = [Extension("baseframe",
+                         ["sino/scom/baseframe.pyx", "sino/scom/scomlib/scom_data_link.c"],
+                         language="c++",),
+               Extension("property",
+                         ["sino/scom/property.pyx", "sino/scom/scomlib/scom_property.c",
+                          "sino/scom/scomlib/scom_data_link.c"],
+                         language="c++",)]
+
+if platform.system() not in ('Windows', 'win32', 'win64'):
+    # Optional native read transactions (uses poll() and file descriptors)
+    ext_modules.append(Extension("transaction",
+                                 ["sino/scom/transaction.pyx", "sino/scom/scomlib/scom_property.c",
+                                  "sino/scom/scomlib/scom_data_link.c"],
+                                 language="c++",))
+
 setup(
     name="scomlib",
-    ext_modules=cythonize(
-                    [Extension("baseframe",
-                               ["sino/scom/baseframe.pyx", "sino/scom/scomlib/scom_data_link.c"],
-                               language="c++",),
-                     Extension("property",
-                               ["sino/scom/property.pyx", "sino/scom/scomlib/scom_property.c"],
-                               language="c++",)]
-                        ),
+    ext_modules=cythonize(ext_modules),
     include_dirs=['sino/scom', ],
     cmdclass={'build_ext': build_ext}
 )
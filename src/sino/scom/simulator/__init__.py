@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+"""
+simulator: Virtual Studer devices answering SCOM requests (no hardware needed)
+"""
+
+from .virtualdevice import VirtualDevice
+from .devicesimulator import DeviceSimulator
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+#
+
+import logging
+import random
+import struct
+import time
+from threading import Thread
+from ..frame import Frame
+from ..frameparser import FrameParser
+from ..pybaseframe import calc_checksum
+from ..exception import TransportException
+from ..transport import Transport, LoopbackTransport, PtyTransport
+from .virtualdevice import VirtualDevice
+
+
+class DeviceSimulator(object):
+    """Simulates an XCom interface with virtual Studer devices connected to it.
+
+    The simulator reads the requests written on its transport and answers
+    'read property' and 'write property' requests the way the devices do.
+    Requests to unknown addresses are answered with a 'device not found' error.
+
+    Bus conditions can be configured:
+    - latency: Time in seconds before a response is sent
+    - jitter: Maximum random time in seconds added to the latency
+    - drop_rate: Probability (0..1) that a request is not answered
+    - corruption_rate: Probability (0..1) that a bit of the response gets flipped
+
+    Ex.:
+        simulator, transport = DeviceSimulator.create_loopback(latency=0.02)
+        simulator.add_device('xtender', 101)
+        simulator.start()
+        scom.initialize(transport)
+    """
+
+    SERVICE_READ_PROPERTY = 0x01
+    SERVICE_WRITE_PROPERTY = 0x02
+
+    ERROR_DEVICE_NOT_FOUND = 0x0002
+    ERROR_SERVICE_NOT_SUPPORTED = 0x0011
+    ERROR_INVALID_SERVICE_ARGUMENT = 0x0012
+
+    RX_POLL_INTERVAL = 0.05     # Time in seconds after which the thread checks if it should stop
+
+    log = logging.getLogger(__name__)
+
+    def __init__(self, transport: Transport, latency: float = 0.0, jitter: float = 0.0,
+                 drop_rate: float = 0.0, corruption_rate: float = 0.0, seed=None):
+        """
+        :param transport The simulator side of the connection
+        :param seed Seed of the random generator used for jitter, drops and corruption
+        """
+        super(DeviceSimulator, self).__init__()
+        self._transport = transport
+        self._parser = FrameParser()
+        self._devices = {}          # type: {int, VirtualDevice}
+        self._random = random.Random(seed)
+        self._thread = None         # type: Thread or None
+        self._thread_should_run = False
+
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.corruption_rate = corruption_rate
+
+        # Statistics
+        self.requests = 0           # Requests received
+        self.responses = 0          # Responses sent
+        self.dropped = 0            # Requests not answered on purpose
+        self.corrupted = 0          # Responses corrupted on purpose
+
+    @classmethod
+    def create_loopback(cls, **kwargs):
+        """Creates a simulator connected to an in-memory transport.
+
+        :param kwargs Bus conditions (see __init__())
+        :return The simulator and the transport to give to Scom.initialize()
+        """
+        simulator_end, scom_end = LoopbackTransport.create_pair()
+        return cls(simulator_end, **kwargs), scom_end
+
+    @classmethod
+    def create_pty(cls, **kwargs):
+        """Creates a simulator listening on a pseudo terminal (POSIX only).
+
+        Open the pseudo terminal using the 'port_name' of the simulator
+        (without parity, see SerialTransport).
+
+        :param kwargs Bus conditions (see __init__())
+        """
+        transport = PtyTransport()
+        transport.open()
+        return cls(transport, **kwargs)
+
+    @property
+    def port_name(self) -> str or None:
+        """Returns the name of the pseudo terminal to connect to (None if not using a pseudo terminal)."""
+        return getattr(self._transport, 'slave_name', None)
+
+    @property
+    def devices(self) -> {int, VirtualDevice}:
+        return dict(self._devices)
+
+    def add_device(self, device_category: str, device_address: int) -> VirtualDevice:
+        """Adds a virtual device of the given category ('xtender', 'vario_power' or 'bsp').
+        """
+        self._devices[device_address] = VirtualDevice.create(device_category, device_address)
+        return self._devices[device_address]
+
+    def remove_device(self, device_address: int):
+        """Removes a device from the bus (ex. to simulate a disappeared device)."""
+        self._devices.pop(device_address, None)
+
+    def start(self):
+        if self.is_running():
+            return
+        self._thread_should_run = True
+        self._thread = Thread(target=self._run, name=self.__class__.__name__)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stops the simulator thread and closes the transport."""
+        self._thread_should_run = False
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self._transport.close()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        self.log.info(type(self).__name__ + ' thread running...')
+
+        while self._thread_should_run:
+            try:
+                self._parser.feed(self._transport.read(4096, self.RX_POLL_INTERVAL))
+            except TransportException as e:
+                self.log.warning('Simulator transport closed: %s' % e)
+                break
+
+            for request_frame in self._parser.frames():
+                self._process(request_frame)
+
+    def _process(self, request_frame: Frame):
+        if request_frame.is_response():
+            return
+
+        self.requests += 1
+        response = self.handle_request(request_frame)
+
+        if self._random.random() < self.drop_rate:
+            self.dropped += 1
+            return
+
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if self._random.random() < self.corruption_rate:
+            self.corrupted += 1
+            response = bytearray(response)
+            response[self._random.randrange(len(response))] ^= 1 << self._random.randrange(8)
+
+        self._transport.write(response)
+        self.responses += 1
+
+    def handle_request(self, request_frame: Frame) -> bytes:
+        """Returns the response to the given request frame.
+        """
+        src_addr, dst_addr = request_frame.src_addr(), request_frame.dst_addr()
+        service_id = request_frame[15]
+        service_header = request_frame[16:24]       # Object type, object id and property id
+
+        device = self._devices.get(dst_addr)
+        if device is None:
+            return self.encode_response(dst_addr, src_addr, service_id, service_header,
+                                        error=self.ERROR_DEVICE_NOT_FOUND)
+
+        if len(service_header) < 8:
+            return self.encode_response(dst_addr, src_addr, service_id, service_header,
+                                        error=self.ERROR_INVALID_SERVICE_ARGUMENT)
+
+        object_type, object_id, property_id = struct.unpack('<HIH', service_header)
+
+        if service_id == self.SERVICE_READ_PROPERTY:
+            value, error = device.read_property(object_type, object_id, property_id)
+        elif service_id == self.SERVICE_WRITE_PROPERTY:
+            value_size = request_frame.data_length() - 10
+            value, error = b'', device.write_property(object_type, object_id, property_id,
+                                                      bytes(request_frame[24:24 + value_size]))
+        else:
+            value, error = b'', self.ERROR_SERVICE_NOT_SUPPORTED
+
+        return self.encode_response(dst_addr, src_addr, service_id, service_header, value, error)
+
+    @classmethod
+    def encode_response(cls, src_addr: int, dst_addr: int, service_id: int, service_header: bytes,
+                        value: bytes = b'', error: int = 0) -> bytes:
+        """Encodes a response frame.
+
+        The frame header is encoded by the codec. The scomlib encodes requests only (service
+        flags 0), so the response flags are set and the data checksum is calculated here.
+
+        :param service_header Object type, object id and property id of the request
+        :param value The property value
+        :param error The error code. If not 0 an error response is encoded
+        """
+        if error:
+            data = struct.pack('<BB', 0x03, service_id) + bytes(service_header) + struct.pack('<H', error)
+        else:
+            data = struct.pack('<BB', 0x02, service_id) + bytes(service_header) + bytes(value)
+
+        frame = Frame(buffer_size=Frame.HEADER_SIZE + len(data) + Frame.TRAILER_SIZE)
+        frame.initialize(src_addr=src_addr, dest_addr=dst_addr, data_length=len(data))
+
+        response = frame.copy_buffer()
+        response[Frame.HEADER_SIZE:-Frame.TRAILER_SIZE] = data
+        struct.pack_into('<H', response, len(response) - Frame.TRAILER_SIZE, calc_checksum(data))
+        return bytes(response)
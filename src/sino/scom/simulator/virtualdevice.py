@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+
+from ..defines import *
+from ..valuecodec import get_value_codec
+from ..device.xtender import Xtender
+from ..device.variopower import VarioPower
+from ..device.bsp import Bsp
+
+
+class VirtualDevice(object):
+    """Simulated Studer device holding the values of its user infos and parameters.
+
+    The objects known by the device are taken from the user info and parameter
+    tables of the according ScomDevice class (ex. Xtender.userInfoTable).
+    """
+
+    # Error codes (see scom_error_t in scomlib/scom_data_link.h)
+    ERROR_TYPE_NOT_SUPPORTED = 0x0021
+    ERROR_OBJECT_ID_NOT_FOUND = 0x0022
+    ERROR_PROPERTY_NOT_SUPPORTED = 0x0023
+    ERROR_INVALID_DATA_LENGTH = 0x0024
+
+    device_classes = {'xtender': Xtender,
+                      'vario_power': VarioPower,
+                      'bsp': Bsp}
+
+    def __init__(self, device_address: int, user_info_table: dict = None, param_info_table: dict = None):
+        """
+        :param device_address The address of the device on the SCOM bus
+        :param user_info_table User infos known by the device (same format as ex. Xtender.userInfoTable)
+        :param param_info_table Parameters known by the device (same format as ex. Xtender.paramInfoTable)
+        """
+        super(VirtualDevice, self).__init__()
+        self.device_address = device_address
+        self._objects = {}          # type: {(int, int), dict}
+        self._names = {}            # type: {(int, str), int}
+
+        for object_type, table in ((OBJECT_TYPE_READ_USER_INFO, user_info_table or {}),
+                                   (OBJECT_TYPE_PARAMETER, param_info_table or {})):
+            for name, info in table.items():
+                self._objects[(object_type, info['number'])] = {'format': info['propertyFormat'],
+                                                                'value': info['default']}
+                self._names[(object_type, name)] = info['number']
+
+    @classmethod
+    def create(cls, device_category: str, device_address: int):
+        """Creates a virtual device of the given category ('xtender', 'vario_power' or 'bsp').
+        """
+        device_class = cls.device_classes[device_category.lower()]
+        return cls(device_address,
+                   getattr(device_class, 'userInfoTable', None),
+                   getattr(device_class, 'paramInfoTable', None))
+
+    def set_user_info(self, name: str, value):
+        """Sets the value of a user info.
+
+        :param value The value or a callable returning the value every time the user info is read
+        """
+        self._set_value(OBJECT_TYPE_READ_USER_INFO, name, value)
+
+    def set_parameter(self, name: str, value):
+        """Sets the value of a parameter."""
+        self._set_value(OBJECT_TYPE_PARAMETER, name, value)
+
+    def get_user_info(self, name: str):
+        return self._get_value(OBJECT_TYPE_READ_USER_INFO, name)
+
+    def get_parameter(self, name: str):
+        return self._get_value(OBJECT_TYPE_PARAMETER, name)
+
+    def _set_value(self, object_type, name, value):
+        self._objects[(object_type, self._names[(object_type, name)])]['value'] = value
+
+    def _get_value(self, object_type, name):
+        value = self._objects[(object_type, self._names[(object_type, name)])]['value']
+        return value() if callable(value) else value
+
+    def read_property(self, object_type: int, object_id: int, property_id: int) -> (bytes, int):
+        """Handles a 'read property' request.
+
+        :return The encoded value and the error code (0 on success)
+        """
+        obj, error = self._get_object(object_type, object_id, property_id)
+        if error:
+            return b'', error
+
+        value = obj['value']
+        if callable(value):
+            value = value()
+        return get_value_codec(obj['format']).pack(value), 0
+
+    def write_property(self, object_type: int, object_id: int, property_id: int, data: bytes) -> int:
+        """Handles a 'write property' request.
+
+        :return The error code (0 on success)
+        """
+        obj, error = self._get_object(object_type, object_id, property_id)
+        if error:
+            return error
+
+        codec = get_value_codec(obj['format'])
+        if codec.size is not None and len(data) != codec.size:
+            return self.ERROR_INVALID_DATA_LENGTH
+        obj['value'] = codec.unpack(data)
+        return 0
+
+    def _get_object(self, object_type, object_id, property_id):
+        if object_type == OBJECT_TYPE_READ_USER_INFO:
+            if property_id != PROPERTY_ID_READ:
+                return None, self.ERROR_PROPERTY_NOT_SUPPORTED
+        elif object_type == OBJECT_TYPE_PARAMETER:
+            if property_id not in (PROPERTY_VALUE_QSP, PROPERTY_UNSAVED_VALUE_QSP):
+                return None, self.ERROR_PROPERTY_NOT_SUPPORTED
+        else:
+            return None, self.ERROR_TYPE_NOT_SUPPORTED
+
+        obj = self._objects.get((object_type, object_id))
+        if obj is None:
+            return None, self.ERROR_OBJECT_ID_NOT_FOUND
+        return obj, 0
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+
+import logging
+import time
+from collections import deque
+from threading import Lock
+from .capture import Capture, CaptureRecord, CaptureWriter
+
+
+class HexFrame(object):
+    """Formats the bytes of a frame as HEX string only when converted to str.
+
+    Pass it as logging argument so that the bytes are only formatted if the
+    log record is emitted:
+
+    Ex.: log.debug('TX: %s', HexFrame(frame))
+    """
+
+    __slots__ = ('_data', )
+
+    def __init__(self, data):
+        """
+        :param data A frame (ex. Frame) or bytes
+        """
+        self._data = data
+
+    def __str__(self):
+        if hasattr(self._data, 'buffer_as_hex_string'):
+            return self._data.buffer_as_hex_string()
+        return bytes(self._data).hex(' ').upper()
+
+
+class FlightRecorder(Capture):
+    """Keeps the last frames written and received in memory. Thread-safe.
+
+    The records hold the time (seconds since the epoch), the direction, the
+    outcome and the bytes of the frame (see Capture). Dump them when an error
+    occurs to see what happened on the bus before.
+    """
+
+    log = logging.getLogger(__name__)
+
+    DEFAULT_SIZE = 64               # Number of records kept
+
+    def __init__(self, size: int = DEFAULT_SIZE):
+        super(FlightRecorder, self).__init__()
+        self._records = deque(maxlen=size)      # type: deque[CaptureRecord]
+        self._lock = Lock()
+
+    @property
+    def size(self) -> int:
+        """Returns the maximum number of records kept."""
+        return self._records.maxlen
+
+    def record(self, direction: int, data: bytes or bytearray = b'', outcome: int = Capture.OUTCOME_OK):
+        record = CaptureRecord(time.time(), direction, outcome, bytes(data))
+        with self._lock:
+            self._records.append(record)
+
+    def records(self) -> [CaptureRecord]:
+        """Returns the records kept (oldest first)."""
+        with self._lock:
+            return list(self._records)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def __len__(self):
+        return len(self._records)
+
+    def format(self) -> [str]:
+        """Returns one line of text per record."""
+        lines = []
+        for record in self.records():
+            lines.append('%s.%03d %s %-8s %s' % (time.strftime('%H:%M:%S', time.localtime(record.timestamp)),
+                                                 int(record.timestamp * 1000) % 1000,
+                                                 self.direction_names.get(record.direction, '?'),
+                                                 self.outcome_names.get(record.outcome, '?'),
+                                                 record.data.hex(' ').upper()))
+        return lines
+
+    def dump(self, logger: logging.Logger = None, level: int = logging.ERROR, reason: str = ''):
+        """Logs the records kept.
+
+        :param logger Logger to use. Defaults to the logger of this class
+        :param reason Text logged before the records (ex. the error that occurred)
+        """
+        logger = logger or self.log
+        if not logger.isEnabledFor(level):
+            return
+
+        lines = self.format()
+        logger.log(level, '%s%d frames recorded:%s', reason + '. ' if reason else '', len(lines),
+                   ''.join('\n  ' + line for line in lines))
+
+    def save(self, file_name: str):
+        """Writes the records kept into a capture file (see CaptureReader and ReplayTransport).
+        """
+        records = self.records()
+        writer = CaptureWriter(file_name)
+        try:
+            for record in records:
+                writer.write_record(record.direction, record.data, record.outcome,
+                                    timestamp=record.timestamp - records[0].timestamp)
+        finally:
+            writer.close()
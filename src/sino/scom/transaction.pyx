@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# distutils: language = c++
+#
+# Runs a whole property read transaction (encode, write, read, resynchronize and
+# decode) on a file descriptor with the GIL released. Optional extension module,
+# only built on POSIX systems.
+#
+
+from collections import namedtuple
+from libc.stdint cimport uint16_t, uint32_t
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcmp, memmove
+from libc.errno cimport errno, EINTR, EAGAIN
+from posix.unistd cimport read, write
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
+from baseframe cimport scom_frame_t, scom_error_t, scom_initialize_frame, scom_encode_request_frame
+from baseframe cimport SCOM_ERROR_NO_ERROR, SCOM_ERROR_INVALID_DATA_LENGTH
+from decoder cimport *
+
+cdef extern from "poll.h" nogil:
+    struct pollfd:
+        int fd
+        short events
+        short revents
+
+    enum:
+        POLLIN
+        POLLOUT
+        POLLERR
+        POLLNVAL
+
+    int poll(pollfd* fds, unsigned long nfds, int timeout)
+
+cdef enum:
+    READ_REQUEST_SIZE = PROPERTY_VALUE_OFFSET + FRAME_TRAILER_SIZE
+
+cdef enum transaction_status_t:
+    TRANSACTION_OK
+    TRANSACTION_TIMEOUT
+    TRANSACTION_IO_ERROR
+
+STATUS_OK = TRANSACTION_OK                  # Response received
+STATUS_TIMEOUT = TRANSACTION_TIMEOUT        # No response received in time
+STATUS_IO_ERROR = TRANSACTION_IO_ERROR      # Reading or writing the file descriptor failed (see 'os_error')
+
+DEFAULT_MAX_FRAME_SIZE = 4096
+
+TransactionResult = namedtuple('TransactionResult', ['status', 'error', 'object_type', 'object_id', 'property_id',
+                                                     'value', 'request', 'response', 'rtt', 'orphan_frames',
+                                                     'rx_errors', 'os_error'])
+TransactionResult.__doc__ = """Result of read_property().
+
+'error', 'object_type', 'object_id', 'property_id' and 'value' are the same as in a PropertyResponse.
+'request' and 'response' are the frames written and received ('response' is None if none was received).
+'rtt' is the time in seconds from the end of the write until the response was received.
+"""
+
+cdef struct transaction_t:
+    int fd
+    const unsigned char* request
+    size_t request_length
+    double timeout
+    unsigned char* rx_buffer
+    size_t rx_buffer_size
+    size_t frame_length             # Length of the response at the beginning of 'rx_buffer'
+    double rtt
+    int orphan_frames               # Valid frames not answering the request
+    int rx_errors                   # Corrupt or incomplete frames
+    int os_error
+
+cdef inline double _now() noexcept nogil:
+    cdef timespec now
+    clock_gettime(CLOCK_MONOTONIC, &now)
+    return now.tv_sec + now.tv_nsec * 1e-9
+
+cdef int _wait(int fd, short events, double deadline) noexcept nogil:
+    """Waits until the file descriptor is ready.
+
+    :return 1 if ready, 0 on timeout and -1 on error
+    """
+    cdef pollfd poll_fd
+    cdef double remaining
+    cdef int result
+
+    poll_fd.fd = fd
+    poll_fd.events = events
+
+    while True:
+        remaining = deadline - _now()
+        if remaining <= 0:
+            return 0
+
+        poll_fd.revents = 0
+        result = poll(&poll_fd, 1, <int>(remaining * 1000) + 1)
+        if result < 0:
+            if errno == EINTR:
+                continue
+            return -1
+        if result > 0:
+            return -1 if poll_fd.revents & (POLLERR | POLLNVAL) else 1
+
+cdef bint _is_response_to(const unsigned char* request, size_t request_length,
+                          const unsigned char* response, size_t response_length) noexcept nogil:
+    """Same as Scom._is_response_to()."""
+    if memcmp(&response[2], &request[6], 4) != 0 or memcmp(&response[6], &request[2], 4) != 0:
+        return False
+    if request_length < FRAME_HEADER_SIZE + 2:
+        return True
+    if response_length < FRAME_HEADER_SIZE + 2 or response[15] != request[15]:       # Service id
+        return False
+    if request_length < FRAME_HEADER_SIZE + 10:
+        return True
+    return response_length >= FRAME_HEADER_SIZE + 10 and memcmp(&response[16], &request[16], 8) == 0
+
+cdef transaction_status_t _transact(transaction_t* transaction) noexcept nogil:
+    """Writes the request and reads frames until the response is received.
+
+    Frames are extracted the same way as the FrameParser does: Bytes in front of a start
+    byte are skipped, headers and data are validated using their checksums.
+    """
+    cdef unsigned char* rx_buffer = transaction.rx_buffer
+    cdef size_t sent = 0
+    cdef size_t fill = 0
+    cdef size_t needed
+    cdef size_t skip
+    cdef size_t data_length
+    cdef size_t frame_length
+    cdef ssize_t count
+    cdef double start_time
+    cdef double deadline = _now() + transaction.timeout
+    cdef int ready
+
+    while sent < transaction.request_length:
+        count = write(transaction.fd, &transaction.request[sent], transaction.request_length - sent)
+        if count >= 0:
+            sent += count
+        elif errno == EINTR:
+            continue
+        elif errno == EAGAIN:
+            ready = _wait(transaction.fd, POLLOUT, deadline)
+            if ready == 0:
+                return TRANSACTION_TIMEOUT
+            if ready < 0:
+                transaction.os_error = errno
+                return TRANSACTION_IO_ERROR
+        else:
+            transaction.os_error = errno
+            return TRANSACTION_IO_ERROR
+
+    # Time to wait for the response starts after the frame is written
+    start_time = _now()
+    deadline = start_time + transaction.timeout
+
+    while True:
+        # Extract the frames received
+        while True:
+            # Hunt for start byte
+            skip = 0
+            while skip < fill and rx_buffer[skip] != 0xAA:
+                skip += 1
+            if skip:
+                fill -= skip
+                memmove(rx_buffer, &rx_buffer[skip], fill)
+
+            if fill < FRAME_HEADER_SIZE:
+                needed = FRAME_HEADER_SIZE - fill
+                break
+
+            # Validate header before trusting 'data_length'
+            data_length = _read_le16(&rx_buffer[10])
+            frame_length = FRAME_HEADER_SIZE + data_length + FRAME_TRAILER_SIZE
+            if not _checksum_ok(&rx_buffer[1], 11) or data_length < 2 or frame_length > transaction.rx_buffer_size:
+                transaction.rx_errors += 1
+                skip = 1            # Drop start byte and search for the next one
+            elif fill < frame_length:
+                needed = frame_length - fill
+                break
+            elif not _checksum_ok(&rx_buffer[FRAME_HEADER_SIZE], data_length):
+                transaction.rx_errors += 1
+                skip = frame_length
+            elif _is_response_to(transaction.request, transaction.request_length, rx_buffer, frame_length):
+                transaction.frame_length = frame_length
+                transaction.rtt = _now() - start_time
+                return TRANSACTION_OK
+            else:
+                transaction.orphan_frames += 1
+                skip = frame_length
+
+            fill -= skip
+            memmove(rx_buffer, &rx_buffer[skip], fill)
+
+        # Read exactly the bytes needed to complete the next frame
+        ready = _wait(transaction.fd, POLLIN, deadline)
+        if ready == 0:
+            if fill:
+                transaction.rx_errors += 1      # Incomplete frame
+            return TRANSACTION_TIMEOUT
+        if ready < 0:
+            transaction.os_error = errno
+            return TRANSACTION_IO_ERROR
+
+        count = read(transaction.fd, &rx_buffer[fill], needed)
+        if count > 0:
+            fill += count
+        elif count == 0:
+            transaction.os_error = 0            # Connection closed
+            return TRANSACTION_IO_ERROR
+        elif errno != EINTR and errno != EAGAIN:
+            transaction.os_error = errno
+            return TRANSACTION_IO_ERROR
+
+def read_property(int fd, unsigned int dst_addr, int object_type, unsigned int object_id, int property_id,
+                  str property_format, double timeout, unsigned int src_addr=1,
+                  size_t max_frame_size=DEFAULT_MAX_FRAME_SIZE):
+    """Reads a property of a device using the given file descriptor (ex. serial port).
+
+    Encoding the request, writing it, reading and resynchronizing on the received bytes and
+    decoding the response is done without holding the GIL. Frames not answering the request
+    are discarded. Bytes received after the response are left in the file descriptor.
+
+    :param fd File descriptor opened for reading and writing
+    :param property_format Format of the value (see property.decode_read_response())
+    :param timeout Time in seconds to wait for the response
+    :param max_frame_size Size of the largest frame accepted
+    :return A TransactionResult
+    """
+    cdef int value_format = _value_format_from_name(property_format)
+    cdef unsigned char request[READ_REQUEST_SIZE]
+    cdef scom_frame_t frame
+    cdef scom_property_t cproperty
+    cdef transaction_t transaction
+    cdef transaction_status_t status
+    cdef scom_error_t error = SCOM_ERROR_NO_ERROR
+    cdef size_t value_length
+    cdef uint32_t int_value = 0
+    cdef float float_value = 0
+
+    if value_format < 0:
+        raise ValueError('Unknown property format \'%s\'' % property_format)
+    if max_frame_size < READ_REQUEST_SIZE:
+        raise ValueError('Maximum frame size too small!')
+
+    transaction.fd = fd
+    transaction.request = request
+    transaction.request_length = READ_REQUEST_SIZE
+    transaction.timeout = timeout
+    transaction.rx_buffer = <unsigned char*>malloc(max_frame_size)
+    transaction.rx_buffer_size = max_frame_size
+    transaction.frame_length = 0
+    transaction.rtt = 0
+    transaction.orphan_frames = 0
+    transaction.rx_errors = 0
+    transaction.os_error = 0
+
+    if transaction.rx_buffer == NULL:
+        raise MemoryError()
+
+    try:
+        with nogil:
+            scom_initialize_frame(&frame, request, READ_REQUEST_SIZE)
+            frame.src_addr = src_addr
+            frame.dst_addr = dst_addr
+            scom_initialize_property(&cproperty, &frame)
+            cproperty.object_type = <scom_object_type_t>object_type
+            cproperty.object_id = object_id
+            cproperty.property_id = property_id
+            scom_encode_read_property(&cproperty)
+            scom_encode_request_frame(&frame)
+
+            status = _transact(&transaction)
+
+            if status == TRANSACTION_OK:
+                scom_initialize_frame(&frame, transaction.rx_buffer, transaction.frame_length)
+                error = _decode_read_response(&frame, &value_length)
+                if error == SCOM_ERROR_NO_ERROR and \
+                        not _decode_value(<value_format_t>value_format, &transaction.rx_buffer[PROPERTY_VALUE_OFFSET],
+                                          value_length, &int_value, &float_value):
+                    error = SCOM_ERROR_INVALID_DATA_LENGTH
+
+        response = None
+        value = None
+        header = (None, None, None)         # Object type, object id and property id of the response
+
+        if status == TRANSACTION_OK:
+            response = transaction.rx_buffer[:transaction.frame_length]
+            if transaction.frame_length >= PROPERTY_VALUE_OFFSET:
+                header = (_read_le16(&transaction.rx_buffer[PROPERTY_HEADER_OFFSET]),
+                          _read_le32(&transaction.rx_buffer[PROPERTY_HEADER_OFFSET + 2]),
+                          _read_le16(&transaction.rx_buffer[PROPERTY_HEADER_OFFSET + 6]))
+            if error == SCOM_ERROR_NO_ERROR:
+                value = _value_object(<value_format_t>value_format, int_value, float_value)
+
+        return TransactionResult(status, error if status == TRANSACTION_OK else None, *header, value,
+                                 request[:READ_REQUEST_SIZE], response,
+                                 transaction.rtt if status == TRANSACTION_OK else None,
+                                 transaction.orphan_frames, transaction.rx_errors, transaction.os_error)
+    finally:
+        free(transaction.rx_buffer)
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+
+# Bring Classes into the 'transport' namespace
+from .transport import Transport
+from .serialtransport import SerialTransport
+from .sockettransport import SocketTransport
+from .loopbacktransport import LoopbackTransport
+from .ptytransport import PtyTransport
+from .replaytransport import ReplayTransport
+from .transportfactory import TransportFactory
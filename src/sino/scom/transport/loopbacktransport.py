@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+
+import socket
+from ..exception import TransportException
+from .sockettransport import SocketTransport
+
+
+class LoopbackTransport(SocketTransport):
+    """In-memory transport connected to another LoopbackTransport.
+
+    Bytes written on one end can be read on the other end. Useful for
+    tests and simulations. Use create_pair() to get two connected ends.
+
+    A transport not connected to a peer reads back the bytes written on it.
+    """
+
+    def __init__(self, sock: socket.socket = None):
+        super(LoopbackTransport, self).__init__('localhost', 0)
+        self._peer_socket = sock
+        self._echo_socket = None        # type: socket.socket or None
+
+    @classmethod
+    def create_pair(cls):
+        """Returns two connected transports (both opened).
+        """
+        sock_a, sock_b = socket.socketpair()
+        end_a, end_b = cls(sock_a), cls(sock_b)
+        end_a.open()
+        end_b.open()
+        return end_a, end_b
+
+    def open(self):
+        if self._sock is None:
+            if self._peer_socket is None:
+                # Not connected to any peer: Write to the other end of the pair and read from this one
+                self._peer_socket, self._echo_socket = socket.socketpair()
+            self._set_socket(self._peer_socket)
+
+    def write(self, data: bytes or bytearray):
+        if self._echo_socket is None:
+            super(LoopbackTransport, self).write(data)
+            return
+        try:
+            self._echo_socket.sendall(data)
+        except OSError as e:
+            raise TransportException(str(e))
+
+    def close(self):
+        super(LoopbackTransport, self).close()
+        if self._echo_socket:
+            self._echo_socket.close()
+            self._echo_socket = None
+        self._peer_socket = None
+
+    def __str__(self):
+        return 'loop://'
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+
+import os
+import select
+from ..exception import TransportException
+from .transport import Transport
+
+
+class PtyTransport(Transport):
+    """Transport using the master side of a pseudo terminal (POSIX only).
+
+    The slave side (see 'slave_name') behaves like a serial port and can be
+    opened by another process or a SerialTransport (without parity).
+    """
+
+    def __init__(self):
+        super(PtyTransport, self).__init__()
+        self._master_fd = None
+        self._slave_fd = None
+        self._slave_name = None
+
+    @property
+    def slave_name(self) -> str or None:
+        """Returns the device name of the slave side. Ex. '/dev/pts/3'"""
+        return self._slave_name
+
+    def open(self):
+        try:
+            import tty          # Not available on Windows
+            self._master_fd, self._slave_fd = os.openpty()
+        except (ImportError, AttributeError, OSError) as e:
+            raise TransportException(str(e))
+
+        # No echo and no line processing. Keep slave side open so that
+        # the master does not get an error while no one uses the slave side
+        tty.setraw(self._slave_fd)
+        self._slave_name = os.ttyname(self._slave_fd)
+
+    def close(self):
+        for fd in (self._master_fd, self._slave_fd):
+            if fd is not None:
+                os.close(fd)
+        self._master_fd = self._slave_fd = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._master_fd is not None
+
+    def write(self, data: bytes or bytearray):
+        view = memoryview(data)
+        try:
+            while view:
+                view = view[os.write(self._master_fd, view):]
+        except OSError as e:
+            raise TransportException(str(e))
+
+    def read(self, size: int, timeout: float or None) -> bytes:
+        try:
+            readable, _, _ = select.select([self._master_fd], [], [], timeout)
+            if not readable:
+                return b''
+            return os.read(self._master_fd, size)
+        except OSError as e:
+            raise TransportException(str(e))
+
+    def fileno(self) -> int:
+        return self._master_fd
+
+    def __str__(self):
+        return 'pty://%s' % self._slave_name
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+
+import time
+from threading import Condition
+from ..capture import Capture, CaptureReader
+from ..exception import TransportException
+from .transport import Transport
+
+
+class ReplayTransport(Transport):
+    """Transport feeding the traffic of a capture file (see CaptureWriter) back to Scom.
+
+    Every frame written is taken as the next request recorded. The frames received
+    after this request in the capture become readable with the same delay as recorded
+    (divided by 'speed'). Recorded timeouts deliver nothing, recorded RX errors deliver
+    a corrupt frame header right away.
+
+    Does not provide a file descriptor, so it cannot be used with AsyncScom.
+    """
+
+    CORRUPT_HEADER = b'\xaa' + bytes(13)        # Frame header with invalid checksum
+
+    def __init__(self, file_name: str, speed: float = 1.0):
+        """
+        :param file_name The capture file to replay
+        :param speed Replay speed. 1.0: Recorded speed, 10.0: Ten times faster, 0: No delays
+        """
+        super(ReplayTransport, self).__init__()
+        self._file_name = file_name
+        self._speed = speed
+        self._transactions = None       # type: list or None
+        self._pending = []              # [(time, bytes)] RX data to deliver
+        self._rx_buffer = bytearray()   # RX data delivered but not read yet
+        self._condition = Condition()
+
+        # Statistics
+        self.transactions_replayed = 0
+        self.mismatches = 0             # Frames written not matching the recorded request
+
+    def open(self):
+        try:
+            records = CaptureReader(self._file_name).records()
+        except OSError as e:
+            raise TransportException(str(e))
+
+        # Group records into transactions: A TX record followed by its RX records
+        self._transactions = []
+        for record in records:
+            if record.direction == Capture.DIRECTION_TX:
+                self._transactions.append((record, []))
+            elif self._transactions:
+                self._transactions[-1][1].append(record)
+        self._transactions.reverse()        # Pop from the end
+
+    def close(self):
+        self._transactions = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._transactions is not None
+
+    @property
+    def remaining_transactions(self) -> int:
+        return len(self._transactions) if self._transactions else 0
+
+    def write(self, data: bytes or bytearray):
+        if self._transactions is None:
+            raise TransportException('Replay transport not open')
+        if not self._transactions:
+            return      # End of capture: Nothing answers anymore
+
+        request, responses = self._transactions.pop()
+        if bytes(data) != request.data:
+            self.mismatches += 1
+
+        now = time.monotonic()
+        with self._condition:
+            for response in responses:
+                if response.outcome == Capture.OUTCOME_RX_ERROR:
+                    # Time of arrival is unknown (record is written at the end of the transaction)
+                    self._pending.append((now, self.CORRUPT_HEADER))
+                elif response.data:
+                    delay = (response.timestamp - request.timestamp) / self._speed if self._speed else 0
+                    self._pending.append((now + max(delay, 0), response.data))
+            self._pending.sort(key=lambda item: item[0])
+            self._condition.notify_all()
+        self.transactions_replayed += 1
+
+    def read(self, size: int, timeout: float or None) -> bytes:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                # Move data due into RX buffer
+                while self._pending and self._pending[0][0] <= now:
+                    self._rx_buffer += self._pending.pop(0)[1]
+
+                if self._rx_buffer:
+                    data = bytes(self._rx_buffer[:size])
+                    del self._rx_buffer[:size]
+                    return data
+
+                wait_time = deadline - now if deadline is not None else None
+                if wait_time is not None and wait_time <= 0:
+                    return b''
+                if self._pending:
+                    next_delivery = self._pending[0][0] - now
+                    wait_time = min(wait_time, next_delivery) if wait_time is not None else next_delivery
+                self._condition.wait(wait_time)
+
+    def reset_input_buffer(self):
+        with self._condition:
+            self._rx_buffer.clear()
+
+    def fileno(self) -> int:
+        raise TransportException('Replay transport has no file descriptor')
+
+    def __str__(self):
+        return 'replay://%s' % self._file_name
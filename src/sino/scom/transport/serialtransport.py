@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+
+import serial
+from serial.serialutil import SerialException
+from ..exception import TransportException
+from .transport import Transport
+
+
+class SerialTransport(Transport):
+    """Transport using a serial port (ex. an XCom-232i connected via USB to RS-232 adapter).
+    """
+
+    def __init__(self, port: str, baudrate: str or int = '38400', parity: str = serial.PARITY_EVEN):
+        """
+        :param port Name of the COM port. Ex. '/dev/ttyUSB0', 'COM1', etc.
+        :param baudrate Baud rate of the COM port. Default value is '38400'
+        :param parity Parity of the COM port. The XCom-232i uses even parity. Pseudo
+                      terminals (ex. DeviceSimulator) need serial.PARITY_NONE
+        """
+        super(SerialTransport, self).__init__()
+        self._port = port
+        self._baudrate = baudrate
+        self._parity = parity
+        self._ser = None        # type: serial.Serial or None
+
+    def open(self):
+        try:
+            self._ser = serial.Serial(port=self._port,
+                                      baudrate=self._baudrate,
+                                      parity=self._parity)
+            # Set RX timeout
+            self._ser.timeout = 1    # second
+        except (SerialException, ValueError) as e:
+            raise TransportException(str(e))
+
+    def close(self):
+        if self._ser:
+            self._ser.close()
+            self._ser = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._ser is not None and self._ser.is_open
+
+    def write(self, data: bytes or bytearray):
+        try:
+            self._ser.write(data)
+        except SerialException as e:
+            raise TransportException(str(e))
+
+    def read(self, size: int, timeout: float or None) -> bytes:
+        try:
+            if self._ser.timeout != timeout:
+                self._ser.timeout = timeout
+            return self._ser.read(size)
+        except SerialException as e:
+            raise TransportException(str(e))
+
+    def reset_input_buffer(self):
+        self._ser.reset_input_buffer()
+
+    def fileno(self) -> int:
+        return self._ser.fileno()
+
+    def __str__(self):
+        return '%s@%s' % (self._port, self._baudrate)
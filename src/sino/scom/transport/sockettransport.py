@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+
+import socket
+from ..exception import TransportException
+from .transport import Transport
+
+
+class SocketTransport(Transport):
+    """Transport using a TCP connection.
+
+    Allows to access an XCom interface connected to a terminal server or any
+    other serial-over-IP gateway (ex. ser2net).
+    """
+
+    DEFAULT_CONNECT_TIMEOUT = 5.0
+
+    def __init__(self, host: str, port: int, connect_timeout: float = DEFAULT_CONNECT_TIMEOUT):
+        """
+        :param host Host name or IP address of the gateway
+        :param port TCP port of the gateway
+        :param connect_timeout Time in seconds to wait for the connection to be established
+        """
+        super(SocketTransport, self).__init__()
+        self._host = host
+        self._port = int(port)
+        self._connect_timeout = connect_timeout
+        self._sock = None       # type: socket.socket or None
+
+    def open(self):
+        try:
+            sock = socket.create_connection((self._host, self._port), self._connect_timeout)
+        except OSError as e:
+            raise TransportException(str(e))
+        self._set_socket(sock)
+
+    def _set_socket(self, sock: socket.socket):
+        # Send SCOM frames immediately
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+
+    def close(self):
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._sock is not None
+
+    def write(self, data: bytes or bytearray):
+        try:
+            self._sock.settimeout(None)
+            self._sock.sendall(data)
+        except OSError as e:
+            raise TransportException(str(e))
+
+    def read(self, size: int, timeout: float or None) -> bytes:
+        try:
+            self._sock.settimeout(timeout)
+            data = self._sock.recv(size)
+        except (socket.timeout, BlockingIOError):
+            return b''
+        except OSError as e:
+            raise TransportException(str(e))
+
+        if not data:
+            raise TransportException('Connection closed by peer')
+        return data
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def __str__(self):
+        return 'socket://%s:%d' % (self._host, self._port)
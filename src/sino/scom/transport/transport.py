@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+
+from abc import ABCMeta, abstractmethod
+
+
+class Transport(object):
+    """Interface to the byte stream on which SCOM frames are sent and received.
+
+    The Scom class uses a Transport to access the XCom interface. Have a look
+    at the SerialTransport, SocketTransport and LoopbackTransport classes to
+    see implementations of this interface.
+
+    Errors are reported by raising a TransportException.
+    """
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def open(self):
+        """Opens the connection.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self):
+        """Closes the connection.
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+        """Returns True if the connection is open.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, data: bytes or bytearray):
+        """Writes all given bytes.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self, size: int, timeout: float or None) -> bytes:
+        """Reads up to 'size' bytes.
+
+        Returns as soon as 'size' bytes are available or the timeout elapsed. May
+        return less bytes than requested.
+
+        :param size Maximum number of bytes to read
+        :type size int
+        :param timeout Time in seconds to wait for the bytes. 0: Do not wait, None: Wait forever
+        :type timeout float
+        :return The bytes read. Empty on timeout
+        """
+        raise NotImplementedError
+
+    def reset_input_buffer(self):
+        """Discards all bytes received but not read yet.
+        """
+        while self.read(4096, 0):
+            pass
+
+    @abstractmethod
+    def fileno(self) -> int:
+        """Returns the file descriptor of the connection (ex. for use with select() or asyncio).
+        """
+        raise NotImplementedError
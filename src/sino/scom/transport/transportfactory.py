@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+#
+
+from .serialtransport import SerialTransport
+from .sockettransport import SocketTransport
+
+
+class TransportFactory(object):
+    """Creates the transport according to the interface name given.
+    """
+
+    @classmethod
+    def create(cls, interface: str, baudrate: str or int = '38400'):
+        """Creates a new transport (not opened).
+
+        Ex.:
+         - '/dev/ttyUSB0', 'COM1': SerialTransport
+         - 'socket://192.168.1.20:4001': SocketTransport (ex. ser2net)
+
+        :param interface Name of the COM port or URL of the gateway
+        :param baudrate Baud rate of the COM port
+        """
+        if interface.startswith(('socket://', 'tcp://')):
+            address = interface.split('://', 1)[1]
+            host, port = address.rsplit(':', 1)
+            return SocketTransport(host, int(port))
+        else:
+            return SerialTransport(interface, baudrate)
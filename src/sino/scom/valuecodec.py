@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# Registry of the codecs used to convert property values from and to bytes.
+#
+# The read and the write path (Property.set_object_write(), decode_read_response(),
+# ScomDevice, simulator, etc.) take the codec of a property format from here.
+# The extension modules decode fixed size formats natively (see decoder.pxd).
+#
+
+import struct
+
+
+class ValueCodec(object):
+    """Converts the values of a SCOM property format from and to bytes.
+    """
+
+    def __init__(self, name: str):
+        super(ValueCodec, self).__init__()
+        self.name = name
+
+    @property
+    def size(self) -> int or None:
+        """Returns the number of bytes written or None if it depends on the value."""
+        raise NotImplementedError
+
+    def value_size(self, value) -> int:
+        """Returns the number of bytes needed to write the given value."""
+        return self.size
+
+    def pack(self, value) -> bytes:
+        """Returns the bytes of the given value."""
+        raise NotImplementedError
+
+    def pack_into(self, buffer, offset: int, value) -> int:
+        """Writes the value into the buffer (ex. a frame) at the given offset.
+
+        :return The number of bytes written
+        """
+        data = self.pack(value)
+        buffer[offset:offset + len(data)] = data
+        return len(data)
+
+    def unpack(self, data):
+        """Returns the value contained in the given bytes.
+
+        :raise ValueError if the number of bytes does not match the format
+        """
+        raise NotImplementedError
+
+    def __str__(self):
+        return self.name
+
+
+class StructValueCodec(ValueCodec):
+    """Codec for values of fixed size. Devices may answer with other sizes than the one written
+    (ex. an 'enum' read as 4 bytes), so each accepted size has its own struct format.
+    """
+
+    def __init__(self, name: str, struct_format: str, read_formats: {int, str} = None):
+        """
+        :param struct_format Format used to write the value (ex. '<f')
+        :param read_formats Formats used to read the value by size. Defaults to 'struct_format'
+        """
+        super(StructValueCodec, self).__init__(name)
+        self._struct = struct.Struct(struct_format)
+        self._read_structs = {size: struct.Struct(value_format)
+                              for size, value_format in (read_formats or {self._struct.size: struct_format}).items()}
+
+    @property
+    def size(self) -> int:
+        return self._struct.size
+
+    @property
+    def read_sizes(self) -> tuple:
+        """Returns the value sizes accepted when reading."""
+        return tuple(sorted(self._read_structs))
+
+    def pack(self, value) -> bytes:
+        return self._struct.pack(value)
+
+    def pack_into(self, buffer, offset: int, value) -> int:
+        self._struct.pack_into(buffer, offset, value)
+        return self._struct.size
+
+    def unpack(self, data):
+        value_struct = self._read_structs.get(len(data))
+        if value_struct is None:
+            raise ValueError('Invalid value size %d for property format \'%s\'' % (len(data), self.name))
+        return value_struct.unpack_from(data)[0]
+
+
+class StringValueCodec(ValueCodec):
+    """Codec for strings. Trailing zero bytes are removed when reading.
+    """
+
+    def __init__(self, name: str, encoding: str = 'iso-8859-1'):
+        super(StringValueCodec, self).__init__(name)
+        self._encoding = encoding
+
+    @property
+    def size(self) -> None:
+        return None
+
+    def value_size(self, value) -> int:
+        return len(self.pack(value))
+
+    def pack(self, value) -> bytes:
+        return value.encode(self._encoding) if isinstance(value, str) else bytes(value)
+
+    def unpack(self, data):
+        return bytes(data).rstrip(b'\x00').decode(self._encoding)
+
+
+_codecs = {}        # type: {str, ValueCodec}
+
+
+def register_value_codec(codec: ValueCodec, *aliases):
+    """Adds a codec to the registry. It is found using its name and the aliases given."""
+    for name in (codec.name, ) + aliases:
+        _codecs[name] = codec
+
+
+def get_value_codec(property_format: str) -> ValueCodec:
+    """Returns the codec of the given property format (ex. 'float').
+
+    :raise ValueError if the property format is unknown
+    """
+    try:
+        return _codecs[property_format]
+    except KeyError:
+        raise ValueError('Unknown property format \'%s\'' % property_format)
+
+
+def value_codecs() -> {str, ValueCodec}:
+    """Returns all codecs registered by name and alias."""
+    return dict(_codecs)
+
+
+# SCOM property formats (all values are little-endian)
+register_value_codec(StructValueCodec('float', '<f'))
+register_value_codec(StructValueCodec('int32', '<I'))
+register_value_codec(StructValueCodec('signed', '<i'), 'int32 signed')
+register_value_codec(StructValueCodec('signal', '<I'))
+register_value_codec(StructValueCodec('enum', '<H', {2: '<H', 4: '<H'}))       # Only lower 16 bits of 4 bytes
+register_value_codec(StructValueCodec('short enum', '<H', {1: '<B', 2: '<H', 4: '<I'}), 'short-enum')
+register_value_codec(StructValueCodec('long enum', '<I'), 'long-enum')
+register_value_codec(StructValueCodec('bool', '<B'))
+register_value_codec(StructValueCodec('byte', '<B'))
+register_value_codec(StringValueCodec('string'))
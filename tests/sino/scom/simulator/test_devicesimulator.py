@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestDeviceSimulator(unittest.TestCase):
+    """Tests the DeviceSimulator using an in-memory transport.
+    """
+
+    def setUp(self) -> None:
+        from sino.scom import Scom
+        from sino.scom.simulator import DeviceSimulator
+
+        self.simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        self.xtender = self.simulator.add_device('xtender', 101)
+        self.simulator.add_device('vario_power', 701)
+        self.simulator.add_device('bsp', 601)
+        self.simulator.start()
+
+        self.scom = Scom()
+        self.scom.initialize(transport)
+
+    def tearDown(self) -> None:
+        self.simulator.stop()
+        self.scom.close()
+
+    def _create_device(self, device_class, device_address):
+        device = device_class(device_address)
+        device.class_initialize(self.scom)
+        return device
+
+    def test_read_write(self):
+        from sino.scom.device.xtender import Xtender
+
+        self.xtender.set_user_info('batteryVoltage', 51.5)
+        self.xtender.set_user_info('operatingMode', lambda: 2)
+
+        xtender = self._create_device(Xtender, 101)
+        self.assertEqual(xtender.get_battery_voltage(), 51.5)
+        self.assertEqual(xtender.get_operating_mode(), 2)
+
+        self.assertTrue(xtender.set_battery_charge_reference_current(12.0))
+        self.assertEqual(self.xtender.get_parameter('batteryChargeReferenceCurrent'), 12.0)
+        self.assertEqual(xtender.get_battery_charge_reference_current(), 12.0)
+
+        self.assertEqual(self.simulator.requests, self.simulator.responses)
+
+    def test_other_devices(self):
+        from sino.scom.device.bsp import Bsp
+        from sino.scom.device.variopower import VarioPower
+
+        self.simulator.devices[601].set_user_info('soc', 87.0)
+        self.simulator.devices[701].set_user_info('batteryVoltage', 49.0)
+
+        self.assertEqual(self._create_device(Bsp, 601).get_soc(), 87.0)
+        self.assertEqual(self._create_device(VarioPower, 701).get_battery_voltage(), 49.0)
+
+    def test_errors(self):
+        from sino.scom.defines import OBJECT_TYPE_READ_USER_INFO
+
+        # Unknown device
+        response_frame = self.scom.write_frame(self._create_request(102, OBJECT_TYPE_READ_USER_INFO, 3000), 1.0)
+        self.assertIsNotNone(response_frame)
+        self.assertFalse(response_frame.is_valid())
+        self.assertTrue(response_frame.is_data_error_flag_set())
+
+        # Unknown user info
+        response_frame = self.scom.write_frame(self._create_request(101, OBJECT_TYPE_READ_USER_INFO, 2999), 1.0)
+        self.assertIsNotNone(response_frame)
+        self.assertTrue(response_frame.is_data_error_flag_set())
+
+        response_frame = self.scom.write_frame(self._create_request(101, OBJECT_TYPE_READ_USER_INFO, 3000), 1.0)
+        self.assertTrue(response_frame.is_valid())
+        self.assertEqual(response_frame.response_value_size(), 4)
+
+    def test_bus_conditions(self):
+        from sino.scom.defines import OBJECT_TYPE_READ_USER_INFO
+
+        request_frame = self._create_request(101, OBJECT_TYPE_READ_USER_INFO, 3000)
+
+        self.simulator.drop_rate = 1.0
+        self.assertIsNone(self.scom.write_frame(request_frame, 0.1))
+        self.assertEqual(self.simulator.dropped, 1)
+
+        self.simulator.drop_rate = 0.0
+        self.simulator.corruption_rate = 1.0
+        self.assertIsNone(self.scom.write_frame(request_frame, 0.1))
+        self.assertEqual(self.simulator.corrupted, 1)
+        self.assertEqual(self.scom.rxErrors, 1)
+
+        self.simulator.corruption_rate = 0.0
+        self.simulator.latency = 0.05
+        self.assertIsNone(self.scom.write_frame(request_frame, 0.01))     # Too late
+        time.sleep(0.1)
+        self.assertIsNotNone(self.scom.write_frame(request_frame, 1.0))
+        self.assertEqual(self.scom.orphanFrames, 1)
+
+    @classmethod
+    def _create_request(cls, device_address, object_type, object_id, property_id=1):
+        from sino.scom.frame import Frame
+        from sino.scom.property import Property
+
+        request_frame = Frame()
+        request_frame.initialize(src_addr=1, dest_addr=device_address)
+        Property(request_frame).set_object_read(object_type, object_id, property_id)
+        return request_frame
+
+
+@unittest.skipUnless(hasattr(os, 'openpty'), 'Needs a pseudo terminal')
+class TestDeviceSimulatorPty(unittest.TestCase):
+    """Tests the DeviceSimulator using a pseudo terminal.
+    """
+
+    def test_pty(self):
+        import serial
+        from sino.scom import Scom
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.simulator import DeviceSimulator
+        from sino.scom.transport import SerialTransport
+
+        simulator = DeviceSimulator.create_pty(latency=0.001)
+        simulator.add_device('xtender', 101).set_user_info('batteryVoltage', 48.0)
+        simulator.start()
+
+        scom = Scom()
+        scom.initialize(SerialTransport(simulator.port_name, parity=serial.PARITY_NONE))
+
+        xtender = Xtender(101)
+        xtender.class_initialize(scom)
+        self.assertEqual(xtender.get_battery_voltage(), 48.0)
+
+        scom.close()
+        simulator.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
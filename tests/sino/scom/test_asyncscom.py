@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import asyncio
+import struct
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+def response_frame_bytes(src_addr, object_type, object_id, property_id, value, service_id=1):
+    from sino.scom.simulator import DeviceSimulator
+
+    service_header = struct.pack('<HIH', object_type, object_id, property_id)
+    return DeviceSimulator.encode_response(src_addr, 1, service_id, service_header, value)
+
+
+@unittest.skipUnless(hasattr(os, 'openpty'), 'Needs a pseudo terminal')
+class TestAsyncScom(unittest.TestCase):
+    """Tests AsyncScom class using a pseudo terminal.
+    """
+
+    def setUp(self) -> None:
+        import serial
+        from sino.scom import AsyncScom
+        from sino.scom.transport import SerialTransport
+
+        self.master, slave = os.openpty()
+        os.set_blocking(self.master, False)
+        self.scom = AsyncScom()
+        # Note: Pseudo terminals do not support parity. Open the port without calling initialize()
+        transport = SerialTransport(os.ttyname(slave))
+        transport._ser = serial.Serial(os.ttyname(slave), timeout=0)
+        self.scom.initialize(transport)
+        os.close(slave)
+
+    def tearDown(self) -> None:
+        self.scom.close()
+        os.close(self.master)
+
+    async def _respond(self, response, delay=0.01):
+        await asyncio.sleep(delay)
+        os.read(self.master, 1024)          # Consume request
+        os.write(self.master, response)
+
+    def test_read_property(self):
+        from sino.scom import OBJECT_TYPE_READ_USER_INFO
+
+        response = response_frame_bytes(101, OBJECT_TYPE_READ_USER_INFO, 3000, 1, struct.pack('<f', 48.5))
+
+        async def run():
+            responder = asyncio.ensure_future(self._respond(response))
+            value = await self.scom.read_property(101, OBJECT_TYPE_READ_USER_INFO, 3000, rx_timeout_in_seconds=1.0)
+            await responder
+            return value
+
+        value = asyncio.run(run())
+        self.assertEqual(struct.unpack('<f', value)[0], 48.5)
+        self.assertEqual(self.scom.rtt_estimate(101).samples, 1)
+
+    def test_timeout(self):
+        from sino.scom import OBJECT_TYPE_READ_USER_INFO
+
+        async def run():
+            return await self.scom.read_property(101, OBJECT_TYPE_READ_USER_INFO, 3000, rx_timeout_in_seconds=0.1)
+
+        self.assertIsNone(asyncio.run(run()))
+        self.assertEqual(self.scom.rtt_estimate(101).timeouts, 1)
+
+    def test_device_coroutines(self):
+        from sino.scom import OBJECT_TYPE_READ_USER_INFO, OBJECT_TYPE_PARAMETER
+        from sino.scom.device.xtender import Xtender
+
+        Xtender.class_initialize(self.scom)
+        xtender = Xtender(101)
+
+        async def run():
+            response = response_frame_bytes(101, OBJECT_TYPE_READ_USER_INFO, 3000, 1, struct.pack('<f', 51.25))
+            responder = asyncio.ensure_future(self._respond(response))
+            voltage = await xtender.read_user_info_async('batteryVoltage', timeout=1.0)
+            await responder
+
+            response = response_frame_bytes(101, OBJECT_TYPE_PARAMETER, 1138, 0x0D, b'', service_id=2)
+            responder = asyncio.ensure_future(self._respond(response))
+            written = await xtender.write_parameter_async('batteryChargeReferenceCurrent', 12.0, timeout=1.0)
+            await responder
+
+            # Read back from parameter mirror (no bus access)
+            current = await xtender.read_parameter_async('batteryChargeReferenceCurrent')
+            return voltage, written, current
+
+        try:
+            voltage, written, current = asyncio.run(run())
+        finally:
+            Xtender.class_initialize(None)
+
+        self.assertEqual(voltage, 51.25)
+        self.assertTrue(written)
+        self.assertEqual(current, 12.0)
+
+    def test_write_frame_blocking(self):
+        """write_frame() keeps the contract of Scom.write_frame() for synchronous callers."""
+        import threading
+        from sino.scom import OBJECT_TYPE_READ_USER_INFO
+        from sino.scom.frame import Frame
+
+        request_frame = Frame()
+        request_frame.initialize(src_addr=1, dest_addr=101)
+        request_frame.get_property().set_object_read(OBJECT_TYPE_READ_USER_INFO, 3000, 1)
+        response = response_frame_bytes(101, OBJECT_TYPE_READ_USER_INFO, 3000, 1, struct.pack('<f', 48.5))
+
+        responder = threading.Thread(target=lambda: asyncio.run(self._respond(response, delay=0.05)))
+        responder.start()
+        response_frame = self.scom.write_frame(request_frame, 1.0)
+        responder.join()
+
+        self.assertIsInstance(response_frame, Frame)
+        self.assertTrue(response_frame.is_valid())
+
+    def test_invalid_request(self):
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.exception import ReadException
+        from sino.scom.frame import Frame
+
+        Xtender.class_initialize(self.scom)
+        xtender = Xtender(101)
+        xtender._create_read_request = lambda *args: Frame()        # Not initialized
+
+        try:
+            with self.assertRaises(ReadException):
+                asyncio.run(xtender._read_property_async(1, 3000, 1, timeout=0.1))
+        finally:
+            Xtender.class_initialize(None)
+
+
+class TestAsyncScomSharedBus(unittest.TestCase):
+    """Tests AsyncScom used by coroutines and synchronous callers at the same time.
+    """
+
+    def test_sync_and_async_reads(self):
+        import threading
+        from sino.scom import AsyncScom, OBJECT_TYPE_READ_USER_INFO
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        simulator.add_device('xtender', 101).set_user_info('batteryVoltage', 51.5)
+        simulator.start()
+        scom = AsyncScom()
+        scom.initialize(transport)
+
+        sync_values = []
+
+        def read_sync():
+            for _ in range(30):
+                response = scom.read_property_value(101, OBJECT_TYPE_READ_USER_INFO, 3000, 1, 'float', 1.0)
+                sync_values.append(response.value if response else None)
+
+        async def read_async():
+            return [await scom.read_property(101, OBJECT_TYPE_READ_USER_INFO, 3000, rx_timeout_in_seconds=1.0)
+                    for _ in range(10)]
+
+        async def run():
+            return await asyncio.gather(*(read_async() for _ in range(3)))
+
+        thread = threading.Thread(target=read_sync)
+        try:
+            thread.start()
+            async_values = [value for values in asyncio.run(run()) for value in values]
+            thread.join()
+        finally:
+            scom.close()
+            simulator.stop()
+
+        self.assertEqual(sync_values, [51.5] * 30)
+        self.assertEqual([struct.unpack('<f', value)[0] for value in async_values], [51.5] * 30)
+        self.assertEqual(scom.orphanFrames, 0)
+        self.assertEqual(simulator.requests, 60)
+
+    def test_waits_for_sync_caller(self):
+        from sino.scom import AsyncScom, OBJECT_TYPE_READ_USER_INFO
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback()
+        simulator.add_device('xtender', 101).set_user_info('batteryVoltage', 51.5)
+        simulator.start()
+        scom = AsyncScom()
+        scom.initialize(transport)
+
+        async def run():
+            scom._mutex.acquire()       # Bus held by a synchronous caller
+            read = asyncio.ensure_future(scom.read_property(101, OBJECT_TYPE_READ_USER_INFO, 3000,
+                                                            rx_timeout_in_seconds=1.0))
+            await asyncio.sleep(0.1)
+            requests = simulator.requests
+            scom._mutex.release()
+            value = await read
+            # Transport is not watched between requests
+            return requests, value, asyncio.get_running_loop().remove_reader(transport.fileno())
+
+        try:
+            requests, value, watched = asyncio.run(run())
+        finally:
+            scom.close()
+            simulator.stop()
+
+        self.assertEqual(requests, 0)
+        self.assertEqual(struct.unpack('<f', value)[0], 51.5)
+        self.assertFalse(watched)
+        self.assertFalse(scom._mutex.locked())
+
+
+if __name__ == '__main__':
+    unittest.main()
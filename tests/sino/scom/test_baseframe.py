@@ -61,3 +61,32 @@ class TestScomBaseFrame(unittest.TestCase):
 
         base_frame.is_valid()
         base_frame.last_error()
+
+    def test_initialize_using_bytearray_bounds(self):
+        from sino.scom.baseframe import BaseFrame
+
+        base_frame = BaseFrame(buffer_size=16)
+
+        with self.assertRaises(ValueError):
+            base_frame.initialize_using_bytearray(bytes(32), 32)      # Buffer too small
+        with self.assertRaises(ValueError):
+            base_frame.initialize_using_bytearray(bytes(4), 8)        # Array too small
+
+        base_frame.initialize_using_bytearray(b'\x01\x02', 2)
+        self.assertEqual(base_frame.copy_buffer()[0:2], b'\x01\x02')
+
+    def test_buffer_protocol(self):
+        from sino.scom.frame import Frame
+        from sino.scom.property import Property
+
+        frame = Frame()
+        frame.initialize(src_addr=1, dest_addr=101)
+        Property(frame).set_object_read(1, 3000, 1)
+
+        view = memoryview(frame)
+        self.assertEqual(len(view), frame.frame_length())
+        self.assertEqual(view.tobytes(), bytes(frame.copy_buffer()))
+        self.assertEqual(view[0], 0xAA)
+        self.assertEqual(bytes(frame), view.tobytes())
+        self.assertEqual(frame.buffer_as_hex_string(), view.hex(' ').upper())
+        view.release()
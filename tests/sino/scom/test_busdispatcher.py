@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import time
+import unittest
+from threading import Event
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class FakeScom(object):
+    """Records the frames written. The first write blocks until 'release' is set.
+    """
+
+    def __init__(self):
+        super(FakeScom, self).__init__()
+        self.written = []
+        self.release = Event()
+
+    def write_frame(self, frame, rx_timeout_in_seconds=None, priority=None):
+        if not self.written:
+            self.release.wait(2)
+        self.written.append(frame)
+        return 'response to %s' % frame
+
+
+class TestBusDispatcher(unittest.TestCase):
+    """Tests BusDispatcher class.
+    """
+
+    def test_priority_order(self):
+        from sino.scom import BusDispatcher
+
+        scom = FakeScom()
+        dispatcher = BusDispatcher(scom)
+        dispatcher.start()
+
+        first = dispatcher.submit('discovery-0', priority=BusDispatcher.PRIORITY_DISCOVERY)
+        time.sleep(0.05)        # Let dispatcher pick the first request
+
+        futures = [dispatcher.submit('telemetry-%d' % index) for index in range(3)]
+        futures.append(dispatcher.submit('discovery-1', priority=BusDispatcher.PRIORITY_DISCOVERY))
+        futures.append(dispatcher.submit('control', priority=BusDispatcher.PRIORITY_CONTROL))
+
+        self.assertEqual(dispatcher.queue_depth(), 5)
+        self.assertEqual(dispatcher.queue_depth(BusDispatcher.PRIORITY_TELEMETRY), 3)
+
+        scom.release.set()
+        self.assertEqual(futures[-1].result(timeout=1), 'response to control')
+        for future in futures:
+            future.result(timeout=1)
+        self.assertEqual(first.result(), 'response to discovery-0')
+
+        self.assertEqual(scom.written, ['discovery-0', 'control', 'telemetry-0', 'telemetry-1',
+                                        'telemetry-2', 'discovery-1'])
+        self.assertEqual(dispatcher.queue_depth(), 0)
+
+        statistics = dispatcher.statistics()
+        self.assertEqual(statistics['telemetry']['completed'], 3)
+        self.assertEqual(statistics['discovery']['completed'], 2)
+        self.assertGreater(statistics['telemetry']['max_wait_time'], 0)
+
+        dispatcher.stop()
+        self.assertFalse(dispatcher.is_running())
+
+    def test_stop_cancels_pending(self):
+        from sino.scom import BusDispatcher
+
+        scom = FakeScom()
+        dispatcher = BusDispatcher(scom)
+        dispatcher.start()
+
+        dispatcher.submit('blocking')
+        time.sleep(0.05)
+        pending = dispatcher.submit('pending')
+        # Queue the stop request before the blocking request returns
+        dispatcher._queue.put((BusDispatcher._STOP_PRIORITY, -1, None, None, None, None))
+        scom.release.set()
+        dispatcher.stop()
+
+        self.assertTrue(pending.cancelled())
+        self.assertEqual(dispatcher.queue_depth(), 0)
+
+        # Requests submitted to a stopped dispatcher are never executed
+        self.assertTrue(dispatcher.submit('late').cancelled())
+        self.assertEqual(dispatcher.queue_depth(), 0)
+
+    def test_stop_timeout(self):
+        """A thread not stopping in time is kept and no second thread gets started."""
+        from sino.scom import BusDispatcher
+
+        scom = FakeScom()
+        dispatcher = BusDispatcher(scom)
+        dispatcher.start()
+        thread = dispatcher._thread
+
+        dispatcher.submit('blocking')
+        time.sleep(0.05)
+        dispatcher.stop(timeout=0.05)
+        self.assertTrue(dispatcher.is_running())
+        self.assertFalse(dispatcher.start())
+        self.assertIs(dispatcher._thread, thread)
+
+        scom.release.set()
+        dispatcher.stop()
+        self.assertFalse(dispatcher.is_running())
+
+        # Started again once the thread ended
+        self.assertTrue(dispatcher.start())
+        self.assertEqual(dispatcher.submit('again').result(timeout=1), 'response to again')
+        dispatcher.stop()
+
+    def test_completed_when_done(self):
+        from sino.scom import BusDispatcher
+
+        scom = FakeScom()
+        dispatcher = BusDispatcher(scom)
+        dispatcher.start()
+
+        future = dispatcher.submit('blocking')
+        time.sleep(0.05)        # Request is running
+        self.assertEqual(dispatcher.queue_depth(), 0)
+        self.assertEqual(dispatcher.statistics()['telemetry']['completed'], 0)
+
+        scom.release.set()
+        future.result(timeout=1)
+        self.assertEqual(dispatcher.statistics()['telemetry']['completed'], 1)
+        dispatcher.stop()
+
+    def test_scom_write_frame(self):
+        from sino.scom import Scom
+        from tests.sino.scom.test_scom import FakeTransport, TestScomClass
+
+        scom = Scom()
+        scom._transport = FakeTransport([TestScomClass.VALID_FAME])
+        dispatcher = scom.start_dispatcher()
+        self.assertIs(scom.dispatcher, dispatcher)
+
+        response_frame = scom.write_frame(TestScomClass.create_request(), 0.5)
+        self.assertTrue(response_frame.is_response())
+        self.assertEqual(dispatcher.statistics()['telemetry']['completed'], 1)
+
+        scom.close()
+        self.assertIsNone(scom.dispatcher)
+
+    def test_scom_write_frame_timeout(self):
+        from sino.scom import Scom, BusDispatcher
+        from tests.sino.scom.test_scom import FakeTransport, TestScomClass
+
+        scom = Scom()
+        scom.MUTEX_TIMEOUT = 0.1
+        scom._transport = FakeTransport()
+        # Dispatcher hanging in its first request
+        fake_scom = FakeScom()
+        scom._dispatcher = BusDispatcher(fake_scom)
+        scom._dispatcher.start()
+        scom._dispatcher.submit('blocking')
+
+        start = time.monotonic()
+        self.assertIsNone(scom.write_frame(TestScomClass.create_request(), 0.1))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+        fake_scom.release.set()
+        scom.stop_dispatcher()
+        self.assertEqual(fake_scom.written, ['blocking'])      # Request timed out never gets written
+
+
+if __name__ == '__main__':
+    unittest.main()
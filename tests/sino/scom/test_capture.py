@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import time
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestCapture(unittest.TestCase):
+    """Tests capture and replay of the SCOM bus traffic.
+    """
+
+    def setUp(self) -> None:
+        handle, self.file_name = tempfile.mkstemp(suffix='.cap')
+        os.close(handle)
+
+    def tearDown(self) -> None:
+        os.remove(self.file_name)
+
+    @classmethod
+    def _create_request(cls, object_id=3000):
+        from sino.scom.frame import Frame
+        from sino.scom.property import Property
+
+        request_frame = Frame()
+        request_frame.initialize(src_addr=1, dest_addr=101)
+        Property(request_frame).set_object_read(1, object_id, 1)
+        return request_frame
+
+    def _record_traffic(self):
+        """Records a response, a timeout and an RX error."""
+        from sino.scom import Scom
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback(latency=0.02, seed=1)
+        simulator.add_device('xtender', 101).set_user_info('batteryVoltage', 50.0)
+        simulator.start()
+
+        scom = Scom()
+        scom.initialize(transport)
+        scom.start_capture(self.file_name)
+
+        self.assertIsNotNone(scom.write_frame(self._create_request(), 1.0))
+        simulator.drop_rate = 1.0
+        self.assertIsNone(scom.write_frame(self._create_request(3005), 0.1))
+        simulator.drop_rate = 0.0
+        simulator.corruption_rate = 1.0
+        self.assertIsNone(scom.write_frame(self._create_request(3010), 0.1))
+
+        scom.close()
+        simulator.stop()
+        return scom
+
+    def test_capture(self):
+        from sino.scom.capture import Capture, CaptureReader
+
+        scom = self._record_traffic()
+        self.assertEqual(scom.rxErrors, 1)
+
+        records = CaptureReader(self.file_name).records()
+        self.assertEqual([(record.direction, record.outcome) for record in records],
+                         [(Capture.DIRECTION_TX, Capture.OUTCOME_OK), (Capture.DIRECTION_RX, Capture.OUTCOME_OK),
+                          (Capture.DIRECTION_TX, Capture.OUTCOME_OK), (Capture.DIRECTION_RX, Capture.OUTCOME_TIMEOUT),
+                          (Capture.DIRECTION_TX, Capture.OUTCOME_OK), (Capture.DIRECTION_RX, Capture.OUTCOME_RX_ERROR)])
+        self.assertEqual(records[0].data, bytes(self._create_request().copy_buffer()))
+        self.assertGreaterEqual(records[1].timestamp - records[0].timestamp, 0.02)
+        self.assertEqual(len(records[1].data), 30)     # Float value
+
+    def test_replay(self):
+        from sino.scom import Scom
+        from sino.scom.transport import ReplayTransport
+
+        self._record_traffic()
+
+        for speed in (1.0, 0):
+            transport = ReplayTransport(self.file_name, speed=speed)
+            scom = Scom()
+            scom.initialize(transport)
+            self.assertEqual(transport.remaining_transactions, 3)
+
+            start = time.monotonic()
+            response_frame = scom.write_frame(self._create_request(), 1.0)
+            self.assertIsNotNone(response_frame)
+            if speed:
+                self.assertGreaterEqual(time.monotonic() - start, 0.015)
+            self.assertIsNone(scom.write_frame(self._create_request(3005), 0.1))
+            self.assertIsNone(scom.write_frame(self._create_request(3010), 0.1))
+            self.assertEqual(scom.rxErrors, 1)
+            self.assertEqual(transport.mismatches, 0)
+            self.assertEqual(transport.remaining_transactions, 0)
+            scom.close()
+
+    def test_append(self):
+        from sino.scom.capture import Capture, CaptureReader, CaptureWriter
+
+        for _ in range(2):
+            writer = CaptureWriter(self.file_name)
+            writer.write_record(Capture.DIRECTION_TX, b'\xaa\x00')
+            writer.close()
+
+        records = CaptureReader(self.file_name).records()
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[1].data, b'\xaa\x00')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import struct
+import subprocess
+import sys
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestCodec(unittest.TestCase):
+    """Tests the pure Python codec (pybaseframe, pyproperty) against the extension modules.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        from sino.scom import codec
+
+        if not codec.extension_modules_present:
+            raise unittest.SkipTest('Extension modules not built')
+
+    @staticmethod
+    def _codecs():
+        from sino.scom import baseframe, property, pybaseframe, pyproperty
+
+        return (baseframe, property), (pybaseframe, pyproperty)
+
+    @staticmethod
+    def _responses():
+        from sino.scom.simulator import DeviceSimulator
+
+        service_header = struct.pack('<HIH', 1, 3000, 1)
+        responses = [DeviceSimulator.encode_response(101, 1, 1, service_header, value)
+                     for value in (struct.pack('<f', -12.25), struct.pack('<I', 70000), struct.pack('<H', 3),
+                                   b'\x01', b'\x01\x02\x03')]
+        responses.append(DeviceSimulator.encode_response(102, 1, 1, service_header, error=0x22))
+        responses.append(DeviceSimulator.encode_response(103, 1, 2, service_header))     # Write response
+
+        corrupt = bytearray(responses[0])
+        corrupt[-1] ^= 0xFF
+        responses.append(bytes(corrupt))
+        return responses
+
+    def test_checksum(self):
+        from sino.scom.pybaseframe import calc_checksum
+
+        # Values calculated with the byte by byte algorithm of scom_data_link.c
+        for data, checksum in ((b'', 0x00FF), (b'\x00', 0xFFFF), (bytes(range(256)), 0x807F), (b'\xff' * 1000, 0x0417)):
+            self.assertEqual(calc_checksum(data), checksum)
+
+    def test_encode_parity(self):
+        requests = [('read', (1, 3000, 1)),
+                    ('read', (2, 1138, 5)),
+                    ('write', (2, 1138, 0x0D, 20.5, 4, 'float')),
+                    ('write', (2, 1107, 5, 70000, 4, 'int32')),
+                    ('write', (2, 1125, 5, 2, 2, 'enum')),
+                    ('write', (2, 1126, 5, 1, 1, 'bool'))]
+
+        frames = []
+        for baseframe, property in self._codecs():
+            buffers = []
+            for service, arguments in requests:
+                frame = baseframe.BaseFrame(32)
+                frame.initialize(src_addr=1, dest_addr=101)
+                if service == 'read':
+                    property.Property(frame).set_object_read(*arguments)
+                else:
+                    property.Property(frame).set_object_write(*arguments[:5], property_format=arguments[5])
+                self.assertTrue(frame.is_valid())
+                buffers.append((frame.copy_buffer(), frame.data_length(), frame.frame_length()))
+
+            # Values not fitting into the frame
+            frame = baseframe.BaseFrame(26)
+            frame.initialize(src_addr=1, dest_addr=101)
+            with self.assertRaises(ValueError):
+                property.Property(frame).set_object_write(2, 1138, 5, 1.0, 4)
+
+            frames.append(buffers)
+
+        self.assertEqual(frames[0], frames[1])
+
+        batches = [property.encode_read_requests([(101, 1, 3000, 1), (102, 2, 1138, 5)], src_addr=2)
+                   for _, property in self._codecs()]
+        self.assertEqual(batches[0], batches[1])
+
+    def test_decode_parity(self):
+        import math
+
+        for data in self._responses():
+            results = []
+            for baseframe, property in self._codecs():
+                frame = baseframe.BaseFrame(len(data))
+                frame.initialize_using_bytearray(data, len(data))
+                header = (frame.is_valid(), frame.src_addr(), frame.dst_addr(), frame.data_length(), frame[:])
+                for property_format in ('float', 'int32', 'enum', 'short enum', 'bool'):
+                    results.append((header, property.decode_read_response(frame, property_format),
+                                    frame.last_error()))
+            self.assertEqual(results[:len(results) // 2], results[len(results) // 2:])
+
+        data = b'\x00' + b''.join(self._responses()) + b'\xaa\x00'
+        records = [[tuple(record) for record in property.decode_read_responses(data, 'float')]
+                   for _, property in self._codecs()]
+        self.assertEqual(len(records[0]), len(self._responses()))
+        for c_record, py_record in zip(*records):
+            self.assertEqual(c_record[:3], py_record[:3])
+            self.assertTrue(c_record[3] == py_record[3] or math.isnan(c_record[3]) and math.isnan(py_record[3]))
+
+    def test_fallback(self):
+        """The pure Python codec is used if the extension modules are missing."""
+        script = '\n'.join(["import sys",
+                            "sys.modules['sino.scom.baseframe'] = None      # Extension not built",
+                            "from sino.scom import codec",
+                            "from sino.scom.frame import Frame",
+                            "frame = Frame()",
+                            "frame.initialize(src_addr=1, dest_addr=101)",
+                            "frame.get_property().set_object_read(1, 3000, 1)",
+                            "print(codec.extension_modules_present, frame.as_hex_string())"])
+        env = dict(os.environ, PYTHONPATH=os.path.abspath('../../../src'))
+        output = subprocess.check_output([sys.executable, '-c', script], env=env).decode().split()
+
+        self.assertEqual(output[0], 'False')
+        self.assertEqual(' '.join(output[1:]), 'AA 00 01 00 00 00 65 00 00 00 0A 00 6F 71 00 01 01 00 B8 0B 00 00 01 00 C5 90')
+
+
+if __name__ == '__main__':
+    unittest.main()
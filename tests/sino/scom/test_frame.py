@@ -91,3 +91,37 @@ class TestScomFrame(unittest.TestCase):
 
         with self.assertRaises(ResponseFrameException):
             tx_frame.response_value_size()
+
+    def test_single_buffer(self):
+        from sino.scom.frame import Frame
+
+        frame = Frame()
+        self.assertEqual(frame.buffer_size(), Frame.DEFAULT_BUFFER_SIZE)
+
+        # Only the frame bytes are taken. Buffer is enlarged if needed
+        rx_bytes = self.VALID_FAME_BYTES + b'\xaa\x00\x01'
+        frame = Frame(buffer_size=16)
+        (result, length) = frame.parse_frame_from_string(rx_bytes)
+        self.assertTrue(result)
+        self.assertEqual(frame.buffer_size(), 28)
+        self.assertEqual(bytes(frame.copy_buffer()), self.VALID_FAME_BYTES)
+
+        # Items are read from the frame buffer
+        self.assertEqual(frame[0], 0xAA)
+        self.assertEqual(frame[-1], self.VALID_FAME_BYTES[-1])
+        self.assertEqual(frame[24:26], self.VALID_FAME_BYTES[24:26])
+        self.assertEqual(frame[::2], self.VALID_FAME_BYTES[::2])
+        with self.assertRaises(IndexError):
+            frame[28]
+
+        self.assertEqual(frame.dataLength, 12)
+        self.assertTrue(frame.is_response())
+        self.assertEqual(frame.response_value_size(), 2)
+
+        # Buffer cannot be resized while exported
+        view = memoryview(frame)
+        with self.assertRaises(BufferError):
+            frame.resize_buffer(64)
+        view.release()
+        frame.resize_buffer(64)
+        self.assertEqual(bytes(frame.copy_buffer()), self.VALID_FAME_BYTES)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestFrameParser(unittest.TestCase):
+    """Tests FrameParser class.
+    """
+
+    VALID_FAME = b'\xaa"e\x00\x00\x00\x01\x00\x00\x00\x0c\x00\x93{\x03\x01\x01\x00\xb8\x0b\x00\x00' \
+                 b'\x05\x00\x02\x00\xceR'
+
+    def test_checksum(self):
+        from sino.scom.pybaseframe import calc_checksum
+
+        self.assertEqual(calc_checksum(self.VALID_FAME[1:12]), 0x7B93)
+        self.assertEqual(calc_checksum(self.VALID_FAME[14:26]), 0x52CE)
+
+    def test_incremental_feed(self):
+        from sino.scom.frameparser import FrameParser
+
+        parser = FrameParser()
+        self.assertEqual(parser.bytes_needed(), 14)
+
+        parser.feed(self.VALID_FAME[0:10])
+        self.assertEqual(parser.bytes_needed(), 4)
+        self.assertIsNone(parser.next_frame())
+
+        parser.feed(self.VALID_FAME[10:20])
+        self.assertEqual(parser.bytes_needed(), 8)
+
+        parser.feed(self.VALID_FAME[20:])
+        self.assertEqual(parser.bytes_needed(), 0)
+        frame = parser.next_frame()
+        self.assertTrue(frame.is_response())
+        self.assertEqual(len(parser), 0)
+        self.assertEqual(parser.errors, 0)
+
+    def test_resynchronization(self):
+        from sino.scom.frameparser import FrameParser
+
+        parser = FrameParser()
+        # Noise, a frame with corrupt header, a frame with corrupt data and two valid frames
+        corrupt_header = bytearray(self.VALID_FAME)
+        corrupt_header[3] ^= 0xFF
+        corrupt_data = bytearray(self.VALID_FAME)
+        corrupt_data[20] ^= 0xFF
+
+        parser.feed(b'\x00\x13\xaa\x55' + corrupt_header + corrupt_data + self.VALID_FAME * 2)
+
+        frames = list(parser.frames())
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[0].as_hex_string(), frames[1].as_hex_string())
+        self.assertEqual(parser.header_errors, 2)
+        self.assertEqual(parser.data_errors, 1)
+        self.assertEqual(len(parser), 0)
+
+    def test_overflow(self):
+        from sino.scom.frameparser import FrameParser
+
+        parser = FrameParser(max_buffer_size=64)
+        parser.feed(b'\xaa' * 100)
+        self.assertEqual(len(parser), 64)
+        self.assertEqual(parser.overflows, 1)
+
+        parser.feed(self.VALID_FAME)
+        frame = parser.next_frame()
+        self.assertIsNotNone(frame)
+        self.assertLessEqual(len(parser), 64)
+
+        parser.clear()
+        self.assertEqual(len(parser), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import struct
+import threading
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestFramePool(unittest.TestCase):
+    """Tests FramePool class.
+    """
+
+    def test_reuse(self):
+        from sino.scom.framepool import FramePool
+
+        pool = FramePool(max_size=2)
+        frame = pool.acquire()
+        prop = frame.get_property()
+        frame.initialize(src_addr=1, dest_addr=101)
+        prop.set_object_read(1, 3000, 1)
+        self.assertTrue(frame.is_valid())
+
+        pool.release(frame)
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(frame.data_length(), 0)
+
+        # Same frame and property are given out again
+        self.assertIs(pool.acquire(), frame)
+        self.assertIs(frame.get_property(), prop)
+        self.assertEqual((pool.created, pool.reused), (1, 1))
+
+        # Buffer gets enlarged if needed
+        pool.release(frame)
+        self.assertGreaterEqual(pool.acquire(buffer_size=100).buffer_size(), 100)
+
+        # Surplus frames are dropped
+        frames = [pool.acquire() for _ in range(3)]
+        for frame in frames:
+            pool.release(frame)
+        self.assertEqual(len(pool), 2)
+
+        pool.release(None)
+
+    def test_empty_pool(self):
+        """Frames are taken from an empty pool too (an empty pool is falsy)."""
+        from sino.scom.frame import Frame
+        from sino.scom.framepool import FramePool
+        from sino.scom.frameparser import FrameParser
+        from sino.scom.simulator import DeviceSimulator
+
+        pool = FramePool()
+        parser = FrameParser(frame_pool=pool)
+        parser.feed(DeviceSimulator.encode_response(101, 1, 2, struct.pack('<HIH', 2, 1124, 13)))     # Write response
+
+        frame = parser.next_frame()
+        self.assertEqual(pool.created, 1)
+        self.assertEqual(frame.buffer_size(), Frame.DEFAULT_BUFFER_SIZE)
+
+    def test_reset(self):
+        from sino.scom.frame import Frame
+        from sino.scom.framepool import FramePool
+
+        pool = FramePool()
+        frame = pool.acquire()
+        frame.set_data_length(100, encode=False)
+        frame.encode_request()          # Buffer too small
+        self.assertFalse(frame.is_valid())
+
+        pool.release(frame)
+        self.assertIs(pool.acquire(), frame)
+        frame.initialize(src_addr=1, dest_addr=101)
+        frame.get_property().set_object_read(1, 3000, 1)
+        self.assertTrue(frame.is_valid())
+
+    def test_polling_allocations(self):
+        from sino.scom import Scom
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback()
+        simulator.add_device('xtender', 101)
+        simulator.start()
+
+        scom = Scom()
+        scom.initialize(transport)
+        xtender = Xtender(101)
+        xtender.class_initialize(scom)
+
+        def poll(user_info_name):
+            for _ in range(50):
+                xtender._read_user_info_ex(xtender.userInfoTable[user_info_name])
+
+        # Different user infos per thread. Identical concurrent reads would share their transaction
+        threads = [threading.Thread(target=poll, args=(name, ))
+                   for name in ('batteryVoltage', 'batteryCurrent', 'soc', 'pvVoltage')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Frames needed at most: A request and a response per thread
+        self.assertLessEqual(scom.frame_pool.created, 2 * len(threads))
+        self.assertGreater(scom.frame_pool.reused, 300)
+
+        scom.close()
+        simulator.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
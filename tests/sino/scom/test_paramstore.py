@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestParamStore(unittest.TestCase):
+    """Tests the persistent store of the parameter mirror.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.directory, 'params.db')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_store(self):
+        from sino.scom.device.common.paramstore import SqliteParamStore
+
+        store = SqliteParamStore(self.file_name)
+        store.save(101, 1138, 12.5)
+        store.save(101, 1124, True)
+        store.save(101, 1138, 14.0)
+        store.save(102, 1138, 2.0)
+        self.assertEqual(store.writes, 4)
+        store.close()
+
+        # Values are still present after reopening
+        store = SqliteParamStore(self.file_name)
+        self.assertEqual(store.load(101), {1138: 14.0, 1124: 1})
+        self.assertEqual(store.load(103), {})
+
+        store.clear(101)
+        self.assertEqual(store.load(101), {})
+        self.assertEqual(store.load(102), {1138: 2.0})
+        store.clear()
+        self.assertEqual(store.load(102), {})
+        store.close()
+
+    def test_device(self):
+        from sino.scom import Scom
+        from sino.scom.defines import PROPERTY_UNSAVED_VALUE_QSP
+        from sino.scom.device.common.paramstore import SqliteParamStore
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        simulator.add_device('xtender', 101)
+        simulator.start()
+        scom = Scom()
+        scom.initialize(transport)
+
+        try:
+            store = SqliteParamStore(self.file_name)
+            xtender = Xtender(101)
+            xtender.class_initialize(scom)
+            self.assertEqual(xtender.attach_param_store(store), 0)
+
+            self.assertTrue(xtender._write_parameter_info('batteryChargeReferenceCurrent', 12.0))
+            self.assertTrue(xtender._write_parameter_info('allowInverter', False))
+            store.close()
+            requests = simulator.requests
+
+            # After a restart: Values in effect are known without reading the device
+            store = SqliteParamStore(self.file_name)
+            xtender = Xtender(101)
+            self.assertEqual(xtender.attach_param_store(store), 2)
+            self.assertEqual(xtender._read_parameter_info('batteryChargeReferenceCurrent'), 12.0)
+            self.assertIs(xtender._read_parameter_info('allowInverter', PROPERTY_UNSAVED_VALUE_QSP), False)
+            self.assertEqual(simulator.requests, requests)
+            store.close()
+        finally:
+            scom.close()
+            simulator.stop()
+
+    def test_reapply(self):
+        from sino.scom import Scom
+        from sino.scom.device.common.paramstore import SqliteParamStore
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        device = simulator.add_device('xtender', 101)
+        simulator.start()
+        scom = Scom()
+        scom.initialize(transport)
+        store = SqliteParamStore(self.file_name)
+
+        try:
+            xtender = Xtender(101)
+            xtender.class_initialize(scom)
+            xtender.attach_param_store(store)
+            self.assertTrue(xtender._write_parameter_info('batteryChargeReferenceCurrent', 12.0))
+
+            # Device restarted using the value in its flash
+            device.set_parameter('batteryChargeReferenceCurrent', 10.0)
+
+            xtender = Xtender(101)
+            self.assertEqual(xtender.attach_param_store(store, reapply=True), 1)
+            self.assertEqual(device.get_parameter('batteryChargeReferenceCurrent'), 12.0)
+            self.assertEqual(xtender._read_parameter_info('batteryChargeReferenceCurrent'), 12.0)
+
+            # Value not written is read from the device again
+            simulator.drop_rate = 1.0
+            xtender = Xtender(101)
+            self.assertEqual(xtender.attach_param_store(store, reapply=True, timeout=0.1), 0)
+            simulator.drop_rate = 0.0
+            device.set_parameter('batteryChargeReferenceCurrent', 10.0)
+            self.assertEqual(xtender._read_parameter_info('batteryChargeReferenceCurrent'), 10.0)
+        finally:
+            store.close()
+            scom.close()
+            simulator.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import struct
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestProperty(unittest.TestCase):
+    """Tests the functions of the property module.
+    """
+
+    @staticmethod
+    def _response_frame(value: bytes = b'', error: int = 0):
+        from sino.scom.frame import Frame
+        from sino.scom.simulator import DeviceSimulator
+
+        service_header = struct.pack('<HIH', 1, 3000, 1)
+        data = DeviceSimulator.encode_response(101, 1, 1, service_header, value, error)
+        frame = Frame(buffer_size=len(data))
+        frame.parse_frame_from_string(data)
+        return frame
+
+    def test_decode_read_response(self):
+        from sino.scom.property import decode_read_response
+
+        response = decode_read_response(self._response_frame(struct.pack('<f', 48.5)), 'float')
+        self.assertEqual(response.error, 0)
+        self.assertEqual((response.object_type, response.object_id, response.property_id), (1, 3000, 1))
+        self.assertEqual(response.value, 48.5)
+
+        self.assertEqual(decode_read_response(self._response_frame(struct.pack('<I', 70000)), 'int32').value, 70000)
+        self.assertEqual(decode_read_response(self._response_frame(struct.pack('<H', 3)), 'enum').value, 3)
+        self.assertEqual(decode_read_response(self._response_frame(b'\x01'), 'bool').value, 1)
+        self.assertEqual(decode_read_response(self._response_frame(b'\x02'), 'short enum').value, 2)
+
+        # Value size not matching the property format
+        frame = self._response_frame(struct.pack('<H', 3))
+        response = decode_read_response(frame, 'float')
+        self.assertEqual(response.error, 0x24)          # SCOM_ERROR_INVALID_DATA_LENGTH
+        self.assertIsNone(response.value)
+        self.assertFalse(frame.is_valid())
+
+        with self.assertRaises(ValueError):
+            decode_read_response(self._response_frame(b'\x01'), 'double')
+
+    def test_decode_read_response_errors(self):
+        from sino.scom.property import decode_read_response
+
+        # Error code sent by the device
+        response = decode_read_response(self._response_frame(error=0x22), 'float')
+        self.assertEqual(response.error, 0x22)          # SCOM_ERROR_OBJECT_ID_NOT_FOUND
+        self.assertEqual(response.object_id, 3000)
+        self.assertIsNone(response.value)
+
+        # Corrupt data checksum
+        frame = self._response_frame(struct.pack('<f', 48.5))
+        data = frame.copy_buffer()
+        data[-1] ^= 0xFF
+        frame.parse_frame_from_string(data)
+        self.assertEqual(decode_read_response(frame, 'float').error, 0x01)     # SCOM_ERROR_INVALID_FRAME
+
+        # Request instead of response
+        from sino.scom.frame import Frame
+        request = Frame()
+        request.initialize(src_addr=1, dest_addr=101)
+        request.get_property().set_object_read(1, 3000, 1)
+        self.assertEqual(decode_read_response(request, 'float').error, 0x01)
+
+    def test_decode_read_response_matches_scomlib(self):
+        """decode_read_response() rejects the same frames as the frame decoding of the scomlib."""
+        from sino.scom.baseframe import decode_frame_data
+        from sino.scom.frame import Frame
+        from sino.scom.property import decode_read_response
+        from sino.scom.simulator import DeviceSimulator
+
+        service_header = struct.pack('<HIH', 1, 3000, 1)
+        responses = [DeviceSimulator.encode_response(101, 1, 1, service_header, struct.pack('<f', 48.5)),
+                     DeviceSimulator.encode_response(101, 1, 1, service_header, error=0x22),
+                     DeviceSimulator.encode_response(101, 1, 2, service_header),       # Write response
+                     DeviceSimulator.encode_response(101, 1, 1, service_header[:2])]   # Too short
+        for index in (1, 12, 14, 20):       # Header, service flags, value
+            corrupt = bytearray(responses[0])
+            corrupt[index] ^= 0x01
+            responses.append(bytes(corrupt))
+
+        for data in responses:
+            reference = Frame(buffer_size=len(data))
+            reference.initialize_using_bytearray(data, len(data))      # Decodes the header
+            decode_frame_data(reference)
+
+            if reference.last_error() != 0 or data[15] != 1 or len(data) < 26:
+                expected = 0x01                                     # SCOM_ERROR_INVALID_FRAME
+            elif data[14] & 0x01:
+                expected = struct.unpack_from('<H', data, 24)[0]    # Error sent by the device
+            else:
+                expected = 0
+
+            frame = Frame(buffer_size=len(data))
+            frame.parse_frame_from_string(data)
+            self.assertEqual(decode_read_response(frame, 'float').error, expected, data.hex())
+
+    def test_encode_read_requests(self):
+        from sino.scom.frame import Frame
+        from sino.scom.property import encode_read_requests, READ_REQUEST_SIZE
+
+        requests = [(101, 1, 3000, 1), (102, 2, 1138, 5)]
+        buffer, offsets = encode_read_requests(requests)
+        self.assertEqual(offsets, [0, READ_REQUEST_SIZE])
+        self.assertEqual(len(buffer), 2 * READ_REQUEST_SIZE)
+
+        for (dst_addr, object_type, object_id, property_id), offset in zip(requests, offsets):
+            frame = Frame()
+            frame.initialize(src_addr=1, dest_addr=dst_addr)
+            frame.get_property().set_object_read(object_type, object_id, property_id)
+            self.assertEqual(buffer[offset:offset + READ_REQUEST_SIZE], frame.copy_buffer())
+
+        self.assertEqual(encode_read_requests([]), (bytearray(), []))
+
+    def test_decode_read_responses(self):
+        import math
+        from sino.scom.simulator import DeviceSimulator
+        from sino.scom.property import decode_read_responses
+
+        service_header = struct.pack('<HIH', 1, 3000, 1)
+        data = DeviceSimulator.encode_response(101, 1, 1, service_header, struct.pack('<f', 1.5)) + \
+            b'\x00\x01' + \
+            DeviceSimulator.encode_response(102, 1, 1, service_header, error=0x22) + \
+            DeviceSimulator.encode_response(103, 1, 1, service_header, struct.pack('<H', 3))
+
+        records = [tuple(record) for record in decode_read_responses(data, ['float', 'float', 'enum'])]
+        self.assertEqual(records[0], (101, 3000, 0, 1.5))
+        self.assertEqual(records[1][:3], (102, 3000, 0x22))
+        self.assertTrue(math.isnan(records[1][3]))
+        self.assertEqual(records[2], (103, 3000, 0, 3))
+
+        # Same format for all frames. Incomplete frame at the end is ignored
+        records = decode_read_responses(memoryview(data)[:-1], 'float')
+        self.assertEqual(len(records), 2)
+
+        with self.assertRaises(ValueError):
+            decode_read_responses(data, ['float'])
+
+    def test_decode_read_responses_short_frames(self):
+        from sino.scom import property, pyproperty
+        from sino.scom.pybaseframe import calc_checksum
+        from sino.scom.simulator import DeviceSimulator
+
+        def short_frame(data):
+            header = struct.pack('<BIIH', 0x02, 101, 1, len(data))
+            return b'\xaa' + header + struct.pack('<H', calc_checksum(header)) + \
+                data + struct.pack('<H', calc_checksum(data))
+
+        # Frames without service flags and id are not decoded
+        service_header = struct.pack('<HIH', 1, 3000, 1)
+        data = (short_frame(b'') + short_frame(b'\x02')) * 1000 + \
+            DeviceSimulator.encode_response(101, 1, 1, service_header, struct.pack('<f', 1.5))
+
+        for module in (property, pyproperty):
+            records = [tuple(record) for record in module.decode_read_responses(data, 'float')]
+            self.assertEqual(records, [(101, 3000, 0, 1.5)])
+
+    def test_decode_read_responses_read_only(self):
+        import mmap
+        import tempfile
+        from sino.scom.simulator import DeviceSimulator
+        from sino.scom.property import decode_read_responses
+
+        service_header = struct.pack('<HIH', 1, 3000, 1)
+        data = DeviceSimulator.encode_response(101, 1, 1, service_header, struct.pack('<f', 1.5)) * 2
+
+        with tempfile.TemporaryFile() as file:
+            file.write(data)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as read_only_data:
+                records = [tuple(record) for record in decode_read_responses(read_only_data, 'float')]
+
+        self.assertEqual(records, [(101, 3000, 0, 1.5)] * 2)
+
+    def test_decode_read_responses_numpy(self):
+        from sino.scom import property
+
+        if property.numpy is None:
+            self.skipTest('NumPy not installed')
+
+        from sino.scom.simulator import DeviceSimulator
+
+        service_header = struct.pack('<HIH', 1, 3000, 1)
+        data = DeviceSimulator.encode_response(101, 1, 1, service_header, struct.pack('<f', 1.5)) * 3
+
+        records = property.decode_read_responses(data)
+        self.assertEqual(records.dtype, property.RESPONSE_DTYPE)
+        self.assertEqual(list(records['src_addr']), [101] * 3)
+        self.assertEqual(list(records['value']), [1.5] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestReadPropertyValues(unittest.TestCase):
+    """Tests reading many properties back-to-back (Scom.read_property_values()) using the DeviceSimulator.
+    """
+
+    def setUp(self) -> None:
+        from sino.scom import Scom
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.simulator import DeviceSimulator
+
+        self.simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        self.device = self.simulator.add_device('xtender', 101)
+        self.device.set_user_info('batteryVoltage', 51.5)
+        self.device.set_user_info('batteryCurrent', 12.5)
+        self.device.set_parameter('batteryChargeReferenceCurrent', 10.0)
+        self.simulator.start()
+
+        self.scom = Scom()
+        self.scom.initialize(transport)
+        # Counts the acquisitions of the bus lock
+        self.scom._mutex = mock.MagicMock(wraps=self.scom._mutex)
+
+        self.xtender = Xtender(101)
+        self.xtender.class_initialize(self.scom)
+        self.xtender.userInfoTable = dict(Xtender.userInfoTable,
+                                          unknown={'name': 'unknown', 'number': 2999, 'propertyFormat': 'float'})
+
+    def tearDown(self) -> None:
+        self.xtender.class_initialize(None)
+        self.scom.close()
+        self.simulator.stop()
+
+    def _read_user_infos(self):
+        from sino.scom.exception import ReadException
+
+        results = self.xtender.read_user_infos(['batteryVoltage', 'unknown', 'batteryCurrent'], timeout=1.0)
+        self.assertEqual(list(results), ['batteryVoltage', 'unknown', 'batteryCurrent'])
+        self.assertEqual(results['batteryVoltage'], (51.5, None))
+        self.assertEqual(results['batteryCurrent'], (12.5, None))
+        self.assertIsNone(results['unknown'].value)
+        self.assertIsInstance(results['unknown'].error, ReadException)
+        self.assertEqual(self.simulator.requests, 3)
+
+    def test_read_many(self):
+        self._read_user_infos()
+        self.assertEqual(self.scom._mutex.acquire.call_count, 1)
+
+        # Values written are taken from the parameter mirror
+        self.assertTrue(self.xtender.set_battery_charge_reference_current(12.0))
+        results = self.xtender.read_parameters(['batteryChargeReferenceCurrent', 'maximumAcInputCurrent'],
+                                               timeout=1.0)
+        self.assertEqual(results['batteryChargeReferenceCurrent'], (12.0, None))
+        self.assertIsNone(results['maximumAcInputCurrent'].error)
+        self.assertEqual(self.simulator.requests, 5)
+
+        with self.assertRaises(KeyError):
+            self.xtender.read_parameters(['noSuchParameter'])
+
+    def test_read_many_dispatched(self):
+        dispatcher = self.scom.start_dispatcher()
+
+        self._read_user_infos()
+        # All reads are executed by one request of the dispatcher
+        self.assertEqual(dispatcher.statistics()['telemetry']['completed'], 1)
+        self.assertEqual(self.scom._mutex.acquire.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestRequestCache(unittest.TestCase):
+    """Tests RequestCache class.
+    """
+
+    def test_read_request(self):
+        from sino.scom.frame import Frame
+        from sino.scom.framepool import FramePool
+        from sino.scom.requestcache import RequestCache
+
+        expected = Frame()
+        expected.initialize(src_addr=1, dest_addr=101)
+        expected.get_property().set_object_read(1, 3000, 1)
+
+        pool = FramePool()
+        cache = RequestCache(pool, max_size=2)
+
+        # Encoded on first use
+        frame = cache.read_request(101, 1, 3000, 1)
+        self.assertEqual(frame.copy_buffer(), expected.copy_buffer())
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        pool.release(frame)
+
+        # Copied out of the cache afterwards
+        frame = cache.read_request(101, 1, 3000, 1)
+        self.assertEqual(frame.copy_buffer(), expected.copy_buffer())
+        self.assertTrue(frame.is_valid())
+        self.assertEqual(frame.dst_addr(), 101)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        pool.release(frame)
+
+        # Least recently used request gets dropped
+        cache.read_request(102, 1, 3000, 1)
+        cache.read_request(101, 1, 3000, 1)
+        cache.read_request(103, 1, 3000, 1)
+        self.assertEqual(len(cache), 2)
+        cache.read_request(101, 1, 3000, 1)
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+        cache.read_request(102, 1, 3000, 1)
+        self.assertEqual(cache.misses, 4)
+
+    def test_device_reads(self):
+        from sino.scom import Scom
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback()
+        simulator.add_device('xtender', 101).set_user_info('batteryVoltage', 48.0)
+        simulator.start()
+
+        scom = Scom()
+        scom.initialize(transport)
+        xtender = Xtender(101)
+        xtender.class_initialize(scom)
+
+        for _ in range(5):
+            self.assertAlmostEqual(xtender.get_battery_voltage(), 48.0, places=3)
+        self.assertEqual((scom.request_cache.hits, scom.request_cache.misses), (4, 1))
+
+        scom.close()
+        simulator.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
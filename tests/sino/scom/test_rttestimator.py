@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestRttEstimator(unittest.TestCase):
+    """Tests RttEstimator class.
+    """
+
+    def test_initial_rto(self):
+        from sino.scom.rttestimator import RttEstimator
+
+        estimator = RttEstimator(initial_rto=3.0)
+        self.assertIsNone(estimator.srtt)
+        self.assertIsNone(estimator.rttvar)
+        self.assertEqual(estimator.rto, 3.0)
+
+    def test_update(self):
+        from sino.scom.rttestimator import RttEstimator
+
+        estimator = RttEstimator(initial_rto=3.0, min_rto=0.01)
+        estimator.update(0.04)
+        self.assertAlmostEqual(estimator.srtt, 0.04)
+        self.assertAlmostEqual(estimator.rttvar, 0.02)
+        self.assertAlmostEqual(estimator.rto, 0.04 + 4 * 0.02)
+
+        for _ in range(50):
+            estimator.update(0.04)
+        self.assertAlmostEqual(estimator.srtt, 0.04)
+        self.assertLess(estimator.rto, 0.05)
+        self.assertEqual(estimator.samples, 51)
+
+        # Minimum RTO is respected
+        estimator = RttEstimator(initial_rto=3.0, min_rto=0.1)
+        estimator.update(0.01)
+        self.assertEqual(estimator.rto, 0.1)
+
+    def test_timeout_backoff(self):
+        from sino.scom.rttestimator import RttEstimator
+
+        estimator = RttEstimator(initial_rto=3.0, min_rto=0.1)
+        estimator.update(0.01)
+
+        estimator.timeout()
+        self.assertAlmostEqual(estimator.rto, 0.2)
+        for _ in range(10):
+            estimator.timeout()
+        self.assertAlmostEqual(estimator.rto, 0.1 * RttEstimator.MAX_BACKOFF)
+        self.assertEqual(estimator.timeouts, 11)
+
+        # Next sample resets backoff
+        estimator.update(0.01)
+        self.assertAlmostEqual(estimator.rto, 0.1)
+
+        # Maximum RTO is respected
+        estimator = RttEstimator(initial_rto=0.15, min_rto=0.1)
+        estimator.update(0.01)
+        estimator.timeout()
+        self.assertEqual(estimator.rto, 0.15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 
 
 import os
+import time
 import logging
 import unittest
 
@@ -10,6 +11,51 @@ from tests.sino.scom.paths import update_working_directory
 
 update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
 
+from sino.scom.transport import Transport
+
+
+class FakeTransport(Transport):
+    """Transport returning the bytes given (in chunks) on read().
+
+    Non-blocking reads (timeout 0) only return the 'stale_chunks' (bytes received
+    before the request was sent).
+    """
+
+    def __init__(self, rx_chunks=(), stale_chunks=()):
+        super(FakeTransport, self).__init__()
+        self.rx_chunks = list(rx_chunks)
+        self.stale_chunks = list(stale_chunks)
+        self.read_sizes = []
+        self.tx_data = bytearray()
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    @property
+    def is_open(self):
+        return True
+
+    def write(self, data):
+        self.tx_data += data
+
+    def read(self, size, timeout):
+        if timeout == 0:
+            return self.stale_chunks.pop(0) if self.stale_chunks else b''
+
+        self.read_sizes.append(size)
+        if not self.rx_chunks:
+            time.sleep(timeout)        # Nothing received within timeout
+            return b''
+        chunk = self.rx_chunks.pop(0)
+        self.rx_chunks[0:0] = [chunk[size:]] if len(chunk) > size else []
+        return chunk[:size]
+
+    def fileno(self):
+        return -1
+
 
 class TestScomClass(unittest.TestCase):
     """Tests Scom class.
@@ -22,6 +68,17 @@ class TestScomClass(unittest.TestCase):
 
     log = logging.getLogger(__name__)
 
+    @classmethod
+    def create_request(cls, object_id=3000, property_id=5):
+        """Returns a request frame matching the response in VALID_FRAME."""
+        from sino.scom.frame import Frame
+        from sino.scom.property import Property
+
+        request_frame = Frame()
+        request_frame.initialize(src_addr=1, dest_addr=101)
+        Property(request_frame).set_object_read(1, object_id, property_id)
+        return request_frame
+
     def setUp(self) -> None:
         self.INTERFACE = os.environ.get('SINO_SCOM_TEST_INTERFACE', self.INTERFACE)
         self.BAUDRATE = os.environ.get('SINO_SCOM_TEST_BAUDRATE', self.BAUDRATE)
@@ -33,19 +90,196 @@ class TestScomClass(unittest.TestCase):
 
     def test_bad_serial_conn(self):
         from sino.scom import Scom
+        from sino.scom.exception import TransportException
         from sino.scom.frame import Frame
 
         scom = Scom()
 
-        with self.assertRaises(SystemExit):
+        with self.assertRaises(TransportException):
             scom.initialize('/dev/ttyUSB99')
 
+        with self.assertRaises(TransportException):
+            scom.initialize('socket://localhost:no-port')        # Invalid name (ValueError)
+
         self.assertFalse(scom.set_rx_timeout(3))
 
         tx_frame = Frame()
 
         self.assertIsNone(scom.write_frame(tx_frame))
 
+    def test_read_frame_length_driven(self):
+        from sino.scom import Scom
+
+        scom = Scom()
+        scom._transport = FakeTransport([self.VALID_FAME[0:5], self.VALID_FAME[5:] + b'\xaa'])
+
+        response_frame = scom._read_frame(wait_time=0.5)
+        self.assertIsNotNone(response_frame)
+        self.assertTrue(response_frame.is_response())
+        # Header is read first, then exactly the rest of the frame
+        self.assertEqual(scom._transport.read_sizes, [14, 9, 14])
+        self.assertEqual(len(scom._parser), 0)
+
+    def test_read_frame_timeout(self):
+        from sino.scom import Scom
+
+        scom = Scom()
+        scom._transport = FakeTransport()
+        self.assertIsNone(scom._read_frame(wait_time=0.01))
+        self.assertEqual(scom.rxErrors, 0)
+
+        # Incomplete frame
+        scom._transport = FakeTransport([self.VALID_FAME[0:20]])
+        self.assertIsNone(scom._read_frame(wait_time=0.01))
+        self.assertEqual(scom.rxErrors, 1)
+
+    def test_read_frame_resynchronizes(self):
+        from sino.scom import Scom
+
+        scom = Scom()
+        scom._transport = FakeTransport([b'\x00\xaa\x13' + self.VALID_FAME[0:20], self.VALID_FAME[20:]])
+
+        response_frame = scom._read_frame(wait_time=0.5)
+        self.assertIsNotNone(response_frame)
+        self.assertTrue(response_frame.is_response())
+        self.assertEqual(len(scom._parser), 0)
+        self.assertEqual(scom.rxErrors, 1)       # Noise detected
+
+    def test_write_frame_sub_second_timeout(self):
+        from sino.scom import Scom
+        from sino.scom.frame import Frame
+
+        scom = Scom()
+        scom._transport = FakeTransport()
+
+        tx_frame = Frame()
+        tx_frame.parse_frame_from_string(self.VALID_FAME)
+
+        start = time.monotonic()
+        self.assertIsNone(scom.write_frame(tx_frame, 0.2))
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(bytes(scom._transport.tx_data), self.VALID_FAME)
+
+        self.assertTrue(scom.set_rx_timeout(0.3))
+        self.assertEqual(scom.rx_timeout, 0.3)
+
+    def test_adaptive_rx_timeout(self):
+        from sino.scom import Scom
+        from sino.scom.frame import Frame
+
+        scom = Scom()
+        scom._transport = FakeTransport([self.VALID_FAME])
+        scom.enable_adaptive_rx_timeout()
+
+        tx_frame = self.create_request()
+        self.assertIsNone(scom.rtt_estimate(tx_frame.dst_addr()))
+
+        self.assertIsNotNone(scom.write_frame(tx_frame))
+        estimator = scom.rtt_estimate(tx_frame.dst_addr())
+        self.assertEqual(estimator.samples, 1)
+        self.assertLess(estimator.rto, Scom.DEFAULT_RX_TIMEOUT)
+        self.assertIn(tx_frame.dst_addr(), scom.rtt_estimates)
+
+        # Silent device: Bus is blocked only for the estimated timeout
+        start = time.monotonic()
+        self.assertIsNone(scom.write_frame(tx_frame))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(estimator.timeouts, 1)
+
+        # Default rx timeout is the upper limit of existing estimators too
+        self.assertTrue(scom.set_rx_timeout(0.05))
+        self.assertLessEqual(estimator.rto, 0.05)
+
+    def test_fixed_rx_timeout(self):
+        """The default rx timeout is used unless the adaptive rx timeout is enabled."""
+        from sino.scom import Scom
+
+        scom = Scom()
+        scom._transport = FakeTransport([self.VALID_FAME])
+        self.assertTrue(scom.set_rx_timeout(0.3))
+        self.assertIsNotNone(scom.write_frame(self.create_request()))
+
+        start = time.monotonic()
+        self.assertIsNone(scom.write_frame(self.create_request()))
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+        self.assertEqual(scom.rtt_estimate(101).timeouts, 1)
+
+    def test_response_correlation(self):
+        from sino.scom import Scom
+
+        scom = Scom()
+        # Late response received before sending the request
+        scom._transport = FakeTransport([self.VALID_FAME], stale_chunks=[self.VALID_FAME])
+
+        response_frame = scom.write_frame(self.create_request(), 0.1)
+        self.assertIsNotNone(response_frame)
+        self.assertEqual(scom.orphanFrames, 1)
+
+        # Response to another request is dropped
+        scom._transport = FakeTransport([self.VALID_FAME])
+        self.assertIsNone(scom.write_frame(self.create_request(object_id=3001), 0.1))
+        self.assertEqual(scom.orphanFrames, 2)
+
+        scom._transport = FakeTransport([self.VALID_FAME])
+        self.assertIsNone(scom.write_frame(self.create_request(property_id=1), 0.1))
+        self.assertEqual(scom.orphanFrames, 3)
+
+    def test_coalesced_reads(self):
+        import threading
+        from sino.scom import Scom
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback(seed=1, latency=0.1)
+        simulator.add_device('xtender', 101).set_user_info('batteryVoltage', 51.5)
+        simulator.start()
+        scom = Scom()
+        scom.initialize(transport)
+
+        barrier = threading.Barrier(5)
+        responses = []
+
+        def read(object_id):
+            barrier.wait()
+            responses.append(scom.read_property_value(101, 1, object_id, 1, 'float', 1.0))
+
+        try:
+            threads = [threading.Thread(target=read, args=(3000, )) for _ in range(4)]
+            threads.append(threading.Thread(target=read, args=(3005, )))
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(simulator.requests, 2)
+            self.assertEqual(scom.coalescedReads, 3)
+            self.assertEqual(sorted(response.object_id for response in responses), [3000] * 4 + [3005])
+            self.assertEqual(scom._in_flight_reads, {})
+
+            # Reads following each other are not coalesced
+            self.assertEqual(scom.read_property_value(101, 1, 3000, 1, 'float', 1.0).value, 51.5)
+            self.assertEqual(simulator.requests, 3)
+        finally:
+            scom.close()
+            simulator.stop()
+
+    def test_coalesced_read_timeout(self):
+        from concurrent.futures import Future
+        from sino.scom import Scom
+
+        scom = Scom()
+        scom.MUTEX_TIMEOUT = 0.1
+        scom._transport = FakeTransport()
+        # Read of another thread never completing
+        request = (101, 1, 3000, 1, 'float')
+        scom._in_flight_reads[request] = Future()
+
+        start = time.monotonic()
+        self.assertIsNone(scom.read_property_value(*request, rx_timeout_in_seconds=0.1))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(scom.coalescedReads, 1)
+
     def test_valid_serial_conn(self):
         from sino.scom import Scom
         from sino.scom.frame import Frame
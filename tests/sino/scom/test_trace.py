@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import os
+import tempfile
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestTrace(unittest.TestCase):
+    """Tests the lazy frame formatting and the flight recorder.
+    """
+
+    @staticmethod
+    def _create_request(object_id=3000):
+        from sino.scom.frame import Frame
+
+        request_frame = Frame()
+        request_frame.initialize(src_addr=1, dest_addr=101)
+        request_frame.get_property().set_object_read(1, object_id, 1)
+        return request_frame
+
+    def test_hex_frame(self):
+        from sino.scom.trace import HexFrame
+
+        request_frame = self._create_request()
+        self.assertEqual(str(HexFrame(request_frame)), request_frame.as_hex_string())
+        self.assertEqual(str(HexFrame(request_frame.copy_buffer())), request_frame.as_hex_string())
+        self.assertEqual(str(HexFrame(b'\xaa\x01')), 'AA 01')
+
+    def test_lazy_formatting(self):
+        """Frames are not formatted if debug logging is disabled."""
+        from sino.scom import Scom
+        from sino.scom.simulator import DeviceSimulator
+
+        formatted = []
+
+        class Frame(object):
+            def buffer_as_hex_string(self):
+                formatted.append(self)
+                return ''
+
+        simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        simulator.add_device('xtender', 101)
+        simulator.start()
+        scom = Scom()
+        scom.initialize(transport)
+
+        try:
+            scom.log.setLevel(logging.INFO)
+            request_frame = self._create_request()
+            self.assertIsNotNone(scom.write_frame(request_frame, 1.0))
+
+            from sino.scom.trace import HexFrame
+            scom.log.debug('TX: %s', HexFrame(Frame()))
+            self.assertEqual(formatted, [])
+
+            with self.assertLogs(scom.log, logging.DEBUG):
+                scom.log.debug('TX: %s', HexFrame(Frame()))
+            self.assertEqual(len(formatted), 1)
+        finally:
+            scom.log.setLevel(logging.NOTSET)
+            scom.close()
+            simulator.stop()
+
+    def test_flight_recorder(self):
+        from sino.scom.capture import Capture, CaptureReader
+        from sino.scom.trace import FlightRecorder
+
+        recorder = FlightRecorder(size=3)
+        self.assertEqual(recorder.size, 3)
+
+        for object_id in range(3000, 3004):
+            recorder.record(Capture.DIRECTION_TX, self._create_request(object_id).copy_buffer())
+        recorder.record(Capture.DIRECTION_RX, outcome=Capture.OUTCOME_TIMEOUT)
+
+        records = recorder.records()
+        self.assertEqual(len(recorder), 3)
+        self.assertEqual(records[0].data, self._create_request(3002).copy_buffer())
+        self.assertEqual(records[-1].outcome, Capture.OUTCOME_TIMEOUT)
+        self.assertTrue(records[0].timestamp <= records[-1].timestamp)
+
+        with self.assertLogs(recorder.log, logging.ERROR) as logs:
+            recorder.dump(reason='Scan failed')
+        self.assertIn('Scan failed. 3 frames recorded:', logs.output[0])
+        self.assertIn(' TX ok ', logs.output[0])
+        self.assertIn(' RX timeout ', logs.output[0])
+
+        handle, file_name = tempfile.mkstemp(suffix='.cap')
+        os.close(handle)
+        try:
+            recorder.save(file_name)
+            saved = CaptureReader(file_name).records()
+        finally:
+            os.remove(file_name)
+        self.assertEqual([(record.direction, record.outcome, record.data) for record in saved],
+                         [(record.direction, record.outcome, record.data) for record in records])
+        self.assertEqual(saved[0].timestamp, 0)
+
+        recorder.clear()
+        self.assertEqual(len(recorder), 0)
+
+    def test_scom(self):
+        from sino.scom import Scom
+        from sino.scom.capture import Capture
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        simulator.add_device('xtender', 101)
+        simulator.start()
+        scom = Scom()
+        scom.initialize(transport)
+
+        try:
+            self.assertIsNotNone(scom.write_frame(self._create_request(), 1.0))
+            simulator.drop_rate = 1.0
+            self.assertIsNone(scom.write_frame(self._create_request(), 0.05))
+
+            records = scom.flight_recorder.records()
+            self.assertEqual([(record.direction, record.outcome) for record in records],
+                             [(Capture.DIRECTION_TX, Capture.OUTCOME_OK), (Capture.DIRECTION_RX, Capture.OUTCOME_OK),
+                              (Capture.DIRECTION_TX, Capture.OUTCOME_OK),
+                              (Capture.DIRECTION_RX, Capture.OUTCOME_TIMEOUT)])
+
+            with self.assertLogs(scom.log, logging.WARNING) as logs:
+                scom.dump_flight_recorder('Scan failed', logging.WARNING)
+            self.assertIn('4 frames recorded', logs.output[0])
+
+            scom.enable_flight_recorder(0)
+            self.assertIsNone(scom.flight_recorder)
+            self.assertIsNone(scom.write_frame(self._create_request(), 0.05))
+            scom.dump_flight_recorder()         # Nothing to dump
+        finally:
+            scom.close()
+            simulator.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
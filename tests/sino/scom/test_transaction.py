@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import socket
+import struct
+import threading
+import unittest
+from unittest import mock
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestTransaction(unittest.TestCase):
+    """Tests the native read transactions of the 'transaction' extension module.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        from sino.scom import scom
+
+        if scom.transaction is None:
+            raise unittest.SkipTest('Extension module \'transaction\' not built')
+
+    def setUp(self) -> None:
+        self.host_socket, self.device_socket = socket.socketpair()
+
+    def tearDown(self) -> None:
+        self.host_socket.close()
+        self.device_socket.close()
+
+    @staticmethod
+    def _response(src_addr=101, object_id=3000, value=struct.pack('<f', 48.5), error=0):
+        from sino.scom.simulator import DeviceSimulator
+
+        return DeviceSimulator.encode_response(src_addr, 1, 1, struct.pack('<HIH', 1, object_id, 1), value, error)
+
+    def _answer(self, data: bytes):
+        """Sends the given bytes once the request is received."""
+        def answer():
+            self.requests.append(self.device_socket.recv(26))
+            self.device_socket.sendall(data)
+
+        self.requests = []
+        thread = threading.Thread(target=answer)
+        thread.start()
+        return thread
+
+    def _read_property(self, timeout=1.0, property_format='float'):
+        from sino.scom import transaction
+
+        return transaction.read_property(self.host_socket.fileno(), 101, 1, 3000, 1, property_format, timeout)
+
+    def test_read_property(self):
+        from sino.scom import transaction
+        from sino.scom.frame import Frame
+
+        thread = self._answer(self._response())
+        result = self._read_property()
+        thread.join()
+
+        self.assertEqual(result.status, transaction.STATUS_OK)
+        self.assertEqual((result.error, result.object_type, result.object_id, result.property_id, result.value),
+                         (0, 1, 3000, 1, 48.5))
+        self.assertEqual(result.response, self._response())
+        self.assertGreater(result.rtt, 0)
+
+        # Request is the same as encoded by the Python classes
+        request = Frame()
+        request.initialize(src_addr=1, dest_addr=101)
+        request.get_property().set_object_read(1, 3000, 1)
+        self.assertEqual(self.requests[0], request.copy_buffer())
+        self.assertEqual(result.request, request.copy_buffer())
+
+        thread = self._answer(self._response(value=struct.pack('<H', 3)))
+        self.assertEqual(self._read_property(property_format='enum').value, 3)
+        thread.join()
+
+        with self.assertRaises(ValueError):
+            self._read_property(property_format='string')
+
+    def test_resynchronization(self):
+        """Garbage, corrupt frames and frames of other devices are skipped."""
+        from sino.scom import transaction
+
+        corrupt = bytearray(self._response())
+        corrupt[-1] ^= 0xFF
+        broken_header = bytearray(self._response())
+        broken_header[12] ^= 0xFF
+
+        thread = self._answer(b'\x00\x55\xaa' + bytes(corrupt) + bytes(broken_header) +
+                              self._response(src_addr=102) + self._response(object_id=3001) +
+                              self._response(value=struct.pack('<f', 1.5)))
+        result = self._read_property()
+        thread.join()
+
+        self.assertEqual(result.status, transaction.STATUS_OK)
+        self.assertEqual(result.value, 1.5)
+        self.assertEqual(result.orphan_frames, 2)
+        self.assertGreaterEqual(result.rx_errors, 2)
+
+    def test_errors(self):
+        from sino.scom import transaction
+
+        # Error code sent by the device
+        thread = self._answer(self._response(error=0x22))
+        result = self._read_property()
+        thread.join()
+        self.assertEqual(result.status, transaction.STATUS_OK)
+        self.assertEqual(result.error, 0x22)
+        self.assertIsNone(result.value)
+
+        # Value size not matching the property format
+        thread = self._answer(self._response(value=b'\x01'))
+        self.assertEqual(self._read_property().error, 0x24)            # SCOM_ERROR_INVALID_DATA_LENGTH
+        thread.join()
+
+        # Incomplete frame
+        thread = self._answer(self._response()[:20])
+        result = self._read_property(timeout=0.1)
+        thread.join()
+        self.assertEqual(result.status, transaction.STATUS_TIMEOUT)
+        self.assertIsNone(result.response)
+        self.assertEqual(result.rx_errors, 1)
+
+        # Connection closed
+        self.device_socket.close()
+        self.assertEqual(self._read_property().status, transaction.STATUS_IO_ERROR)
+
+
+class TestNativeTransactions(unittest.TestCase):
+    """Tests the Scom class using native read transactions.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        from sino.scom import scom
+
+        if scom.transaction is None:
+            raise unittest.SkipTest('Extension module \'transaction\' not built')
+
+    def setUp(self) -> None:
+        from sino.scom import Scom
+        from sino.scom.simulator import DeviceSimulator
+
+        self.simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        self.xtender = self.simulator.add_device('xtender', 101)
+        self.simulator.start()
+
+        self.scom = Scom()
+        self.scom.initialize(transport)
+
+    def tearDown(self) -> None:
+        self.simulator.stop()
+        self.scom.close()
+
+    def test_enable(self):
+        from sino.scom import Scom
+
+        self.assertFalse(Scom().enable_native_transactions())       # No transport
+        self.assertTrue(self.scom.enable_native_transactions())
+        self.assertTrue(self.scom.native_transactions)
+        self.assertFalse(self.scom.enable_native_transactions(False))
+        self.assertFalse(self.scom.native_transactions)
+
+    def test_read(self):
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.exception import ReadException
+
+        self.xtender.set_user_info('batteryVoltage', 51.5)
+        self.assertTrue(self.scom.enable_native_transactions())
+
+        xtender = Xtender(101)
+        xtender.class_initialize(self.scom)
+        self.assertEqual(xtender.get_battery_voltage(), 51.5)
+        self.assertIsNotNone(self.scom.rtt_estimate(101).srtt)
+
+        with self.assertRaises(ReadException):
+            xtender._read_property_value(1, 2999, 1, 'float', timeout=1.0)      # Unknown user info
+
+        # Same results as the Python implementation
+        for native in (True, False):
+            self.scom.enable_native_transactions(native)
+            self.assertEqual(self.scom.read_property_value(101, 1, 3000, 1, 'float', 1.0), (0, 1, 3000, 1, 51.5))
+            self.assertEqual(self.scom.read_property_value(101, 1, 2999, 1, 'float', 1.0).error, 0x22)
+
+    def test_corrupt_response(self):
+        self.simulator.corruption_rate = 1.0
+        self.assertTrue(self.scom.enable_native_transactions())
+
+        rx_errors = self.scom.rxErrors
+        self.assertIsNone(self.scom.read_property_value(101, 1, 3000, 1, 'float', 0.2))
+        self.assertGreater(self.scom.rxErrors, rx_errors)
+
+    def test_dispatcher(self):
+        """Native transactions are not used while the dispatcher is running."""
+        self.xtender.set_user_info('batteryVoltage', 49.0)
+        self.assertTrue(self.scom.enable_native_transactions())
+
+        dispatcher = self.scom.start_dispatcher()
+
+        with mock.patch.object(dispatcher, 'submit_call', wraps=dispatcher.submit_call) as submit_call, \
+                mock.patch.object(self.scom, '_read_property_value_native') as read_property_value_native:
+            self.assertEqual(self.scom.read_property_value(101, 1, 3000, 1, 'float', 1.0).value, 49.0)
+
+        self.assertEqual(submit_call.call_count, 1)
+        read_property_value_native.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import socket
+import threading
+import time
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestTransport(unittest.TestCase):
+    """Tests the transport classes.
+    """
+
+    VALID_FAME = b'\xaa"e\x00\x00\x00\x01\x00\x00\x00\x0c\x00\x93{\x03\x01\x01\x00\xb8\x0b\x00\x00' \
+                 b'\x05\x00\x02\x00\xceR'
+
+    def test_loopback_pair(self):
+        from sino.scom.transport import LoopbackTransport
+
+        end_a, end_b = LoopbackTransport.create_pair()
+        self.assertTrue(end_a.is_open)
+
+        self.assertEqual(end_b.read(10, 0), b'')
+
+        end_a.write(b'\x01\x02\x03')
+        self.assertEqual(end_b.read(10, 0.5), b'\x01\x02\x03')
+
+        # Read times out
+        start = time.monotonic()
+        self.assertEqual(end_a.read(10, 0.1), b'')
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+        end_b.write(b'\x04\x05')
+        end_a.reset_input_buffer()
+        self.assertEqual(end_a.read(10, 0), b'')
+
+        end_a.close()
+        end_b.close()
+        self.assertFalse(end_a.is_open)
+
+    def test_loopback_unpaired(self):
+        from sino.scom.transport import LoopbackTransport
+
+        transport = LoopbackTransport()
+        transport.open()
+        self.assertTrue(transport.is_open)
+
+        # Bytes written are read back
+        transport.write(self.VALID_FAME)
+        self.assertEqual(transport.read(100, 0.5), self.VALID_FAME)
+        self.assertEqual(transport.read(100, 0), b'')
+
+        transport.close()
+        self.assertFalse(transport.is_open)
+
+    def test_closed_by_peer(self):
+        from sino.scom.exception import TransportException
+        from sino.scom.transport import LoopbackTransport
+
+        end_a, end_b = LoopbackTransport.create_pair()
+        end_b.close()
+        with self.assertRaises(TransportException):
+            end_a.read(10, 0.5)
+        end_a.close()
+
+    def test_socket_transport(self):
+        from sino.scom.transport import SocketTransport, TransportFactory
+
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+
+        def echo():
+            connection, _ = server.accept()
+            connection.sendall(connection.recv(100))
+            connection.close()
+
+        thread = threading.Thread(target=echo)
+        thread.start()
+
+        transport = TransportFactory.create('socket://127.0.0.1:%d' % port)
+        self.assertIsInstance(transport, SocketTransport)
+        transport.open()
+        transport.write(self.VALID_FAME)
+        self.assertEqual(transport.read(len(self.VALID_FAME), 1.0), self.VALID_FAME)
+        transport.close()
+
+        thread.join()
+        server.close()
+
+    def test_factory(self):
+        from sino.scom.transport import SerialTransport, SocketTransport, TransportFactory
+
+        self.assertIsInstance(TransportFactory.create('/dev/ttyUSB0'), SerialTransport)
+        self.assertIsInstance(TransportFactory.create('tcp://localhost:4001'), SocketTransport)
+
+    def test_scom_using_loopback(self):
+        from sino.scom import Scom
+        from sino.scom.frame import Frame
+        from sino.scom.property import Property
+        from sino.scom.transport import LoopbackTransport
+
+        scom_end, device_end = LoopbackTransport.create_pair()
+        scom = Scom()
+        scom.initialize(scom_end)
+        self.assertIs(scom.transport, scom_end)
+
+        def respond():
+            request = device_end.read(100, 1.0)
+            if request:
+                device_end.write(self.VALID_FAME)
+
+        thread = threading.Thread(target=respond)
+        thread.start()
+
+        request_frame = Frame()
+        request_frame.initialize(src_addr=1, dest_addr=101)
+        Property(request_frame).set_object_read(1, 3000, 5)
+
+        response_frame = scom.write_frame(request_frame, 1.0)
+        thread.join()
+        self.assertIsNotNone(response_frame)
+        self.assertTrue(response_frame.is_response())
+
+        scom.close()
+        self.assertIsNone(scom.transport)
+        device_end.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
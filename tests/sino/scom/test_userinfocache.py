@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestUserInfoCache(unittest.TestCase):
+    """Tests the read-through cache of the user infos.
+    """
+
+    def test_cache(self):
+        from sino.scom.device.common.userinfocache import UserInfoCache
+
+        # User infos identified by their number
+        cache = UserInfoCache(max_age=0.05, max_ages={3007: 10.0, 3028: 0})
+        self.assertEqual(cache.max_age(3000), 0.05)
+        self.assertEqual(cache.max_age(3007), 10.0)
+
+        self.assertIsNone(cache.get(3000))
+        before = time.time()
+        sample = cache.put(3000, 51.5)
+        self.assertEqual(sample.value, 51.5)
+        self.assertTrue(before <= sample.timestamp <= time.time())
+        self.assertIs(cache.get(3000), sample)
+
+        cache.put(3007, 87.0)
+        cache.put(3028, 2)
+        self.assertIsNone(cache.get(3028))                      # Not cached
+        self.assertEqual(cache.sample(3028).value, 2)
+
+        time.sleep(0.1)
+        self.assertIsNone(cache.get(3000))                      # Too old
+        self.assertEqual(cache.sample(3000), sample)
+        self.assertEqual(cache.get(3007).value, 87.0)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+        cache.set_max_age(3000, 10.0)
+        self.assertIsNotNone(cache.get(3000))
+        cache.invalidate(3000)
+        self.assertIsNone(cache.sample(3000))
+        cache.invalidate()
+        self.assertIsNone(cache.sample(3007))
+
+    def test_device(self):
+        from sino.scom import Scom
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.simulator import DeviceSimulator
+
+        simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        simulator.add_device('xtender', 101).set_user_info('batteryVoltage', 51.5)
+        simulator.start()
+        scom = Scom()
+        scom.initialize(transport)
+
+        try:
+            xtender = Xtender(101)
+            xtender.class_initialize(scom)
+            self.assertIsNone(xtender.user_info_cache)
+
+            cache = xtender.enable_user_info_cache(max_age=10.0)
+            self.assertIs(xtender.user_info_cache, cache)
+
+            for _ in range(3):
+                self.assertEqual(xtender.get_battery_voltage(), 51.5)
+            self.assertEqual(simulator.requests, 1)
+
+            sample = xtender.read_user_info_sample('batteryVoltage')
+            self.assertEqual(sample, cache.sample(Xtender.userInfoTable['batteryVoltage']['number']))
+
+            results = xtender.read_user_infos(['batteryVoltage', 'batteryCurrent'])
+            self.assertEqual(results['batteryVoltage'].value, 51.5)
+            self.assertIsNone(results['batteryCurrent'].error)
+            self.assertEqual(simulator.requests, 2)
+            self.assertIsNotNone(cache.sample(Xtender.userInfoTable['batteryCurrent']['number']))
+
+            cache.set_max_age(Xtender.userInfoTable['batteryVoltage']['number'], 0)
+            xtender.get_battery_voltage()
+            self.assertEqual(simulator.requests, 3)
+
+            self.assertIsNone(xtender.enable_user_info_cache(False))
+            self.assertEqual(xtender.read_user_info_sample('batteryVoltage').value, 51.5)
+            self.assertEqual(simulator.requests, 4)
+        finally:
+            scom.close()
+            simulator.stop()
+
+    def test_same_name(self):
+        """User infos sharing a name in the user info table are cached separately."""
+        from sino.scom import Scom
+        from sino.scom.device.variopower import VarioPower
+        from sino.scom.simulator import DeviceSimulator
+
+        # Both have the name 'batteryCurrent' in the user info table
+        self.assertEqual(VarioPower.userInfoTable['batteryVoltage']['name'],
+                         VarioPower.userInfoTable['batteryCurrent']['name'])
+
+        simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        device = simulator.add_device('vario_power', 701)
+        device.set_user_info('batteryVoltage', 49.0)
+        device.set_user_info('batteryCurrent', 12.5)
+        simulator.start()
+        scom = Scom()
+        scom.initialize(transport)
+
+        try:
+            vario_power = VarioPower(701)
+            vario_power.class_initialize(scom)
+            vario_power.enable_user_info_cache(max_age=10.0, max_ages={'batteryCurrent': 5.0})
+
+            self.assertEqual(vario_power.get_battery_voltage(), 49.0)
+            self.assertEqual(vario_power.get_battery_current(), 12.5)
+            self.assertEqual(simulator.requests, 2)
+            self.assertEqual(vario_power.user_info_cache.max_age(VarioPower.userInfoTable['batteryCurrent']['number']),
+                             5.0)
+
+            results = vario_power.read_user_infos(['batteryVoltage', 'batteryCurrent'])
+            self.assertEqual((results['batteryVoltage'].value, results['batteryCurrent'].value), (49.0, 12.5))
+            self.assertEqual(simulator.requests, 2)
+        finally:
+            VarioPower.class_initialize(None)
+            scom.close()
+            simulator.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
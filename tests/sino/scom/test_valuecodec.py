@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import struct
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestValueCodec(unittest.TestCase):
+    """Tests the registry of property value codecs.
+    """
+
+    def test_registry(self):
+        from sino.scom.valuecodec import get_value_codec, value_codecs
+
+        for name in ('float', 'int32', 'signed', 'signal', 'enum', 'short enum', 'long enum', 'bool', 'byte',
+                     'string'):
+            self.assertEqual(get_value_codec(name).name, name)
+
+        self.assertIs(get_value_codec('short-enum'), get_value_codec('short enum'))
+        self.assertIs(get_value_codec('long-enum'), get_value_codec('long enum'))
+        self.assertIn('short-enum', value_codecs())
+
+        with self.assertRaises(ValueError):
+            get_value_codec('double')
+
+    def test_pack_unpack(self):
+        from sino.scom.valuecodec import get_value_codec
+
+        for name, value, size in (('float', 20.5, 4), ('int32', 70000, 4), ('signed', -2, 4), ('signal', 1, 4),
+                                  ('enum', 3, 2), ('short enum', 2, 2), ('long enum', 70000, 4), ('bool', 1, 1),
+                                  ('byte', 200, 1)):
+            codec = get_value_codec(name)
+            self.assertEqual(codec.size, size)
+            self.assertEqual(len(codec.pack(value)), size)
+            self.assertEqual(codec.unpack(codec.pack(value)), value)
+
+            buffer = bytearray(8)
+            self.assertEqual(codec.pack_into(buffer, 2, value), size)
+            self.assertEqual(buffer[2:2 + size], codec.pack(value))
+
+        # Sizes answered by the devices
+        self.assertEqual(get_value_codec('enum').unpack(struct.pack('<I', 3)), 3)
+        self.assertEqual(get_value_codec('short enum').unpack(b'\x02'), 2)
+        self.assertEqual(get_value_codec('short enum').unpack(struct.pack('<I', 2)), 2)
+
+        with self.assertRaises(ValueError):
+            get_value_codec('float').unpack(b'\x01\x02')
+
+        string = get_value_codec('string')
+        self.assertIsNone(string.size)
+        self.assertEqual(string.value_size('Xtender'), 7)
+        self.assertEqual(string.unpack(b'Xtender\x00\x00'), 'Xtender')
+
+    def test_codecs(self):
+        """Extension modules and pure Python codec use the registry the same way."""
+        from sino.scom import codec, pybaseframe, pyproperty
+        from sino.scom.simulator import DeviceSimulator
+
+        modules = [(pybaseframe, pyproperty)]
+        if codec.extension_modules_present:
+            from sino.scom import baseframe, property
+            modules.append((baseframe, property))
+
+        service_header = struct.pack('<HIH', 2, 1138, 5)
+
+        for baseframe, property in modules:
+            for property_format, value, size in (('signed', -5, 4), ('long enum', 70000, 4), ('string', 'abc', 3)):
+                frame = baseframe.BaseFrame(32)
+                frame.initialize(src_addr=1, dest_addr=101)
+                property.Property(frame).set_object_write(2, 1138, 5, value, size, property_format=property_format)
+                self.assertTrue(frame.is_valid())
+
+                # Answer with the value written
+                data = DeviceSimulator.encode_response(101, 1, 1, service_header, frame[24:24 + size])
+                response_frame = baseframe.BaseFrame(len(data))
+                response_frame.initialize_using_bytearray(data, len(data))
+                response = property.decode_read_response(response_frame, property_format)
+                self.assertEqual((response.error, response.value), (0, value))
+
+            with self.assertRaises(ValueError):
+                property.decode_read_responses(data, 'string')      # No fixed size
+
+    def test_decode_attribute(self):
+        from sino.scom.device.scomdevice import ScomDevice
+
+        param_info = {'propertyFormat': 'enum', 'default': 0}
+        self.assertEqual(ScomDevice._decode_attribute(param_info, struct.pack('<H', 3)), 3)
+        self.assertEqual(ScomDevice._decode_attribute(param_info, struct.pack('<I', 3)), 3)
+        self.assertEqual(ScomDevice._decode_attribute(param_info, b''), 0)
+        self.assertEqual(ScomDevice._property_format_to_value_size('short-enum'), 2)
+        self.assertEqual(ScomDevice._property_format_to_value_size('string', 'abc'), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+import unittest
+
+from tests.sino.scom.paths import update_working_directory
+
+update_working_directory()  # Needed when: 'pipenv run python -m unittest tests/sino/scom/{this_file}.py'
+
+
+class TestWriteCoalescing(unittest.TestCase):
+    """Tests the deadband and the collapsing of parameter writes.
+    """
+
+    def setUp(self) -> None:
+        from sino.scom import Scom
+        from sino.scom.device.xtender import Xtender
+        from sino.scom.simulator import DeviceSimulator
+
+        self.simulator, transport = DeviceSimulator.create_loopback(seed=1)
+        self.device = self.simulator.add_device('xtender', 101)
+        self.simulator.start()
+
+        self.scom = Scom()
+        self.scom.initialize(transport)
+        self.xtender = Xtender(101)
+        self.xtender.class_initialize(self.scom)
+
+    def tearDown(self) -> None:
+        self.simulator.stop()
+        self.scom.close()
+
+    def test_deadband(self):
+        xtender = self.xtender
+
+        # No deadband: All values are written
+        self.assertTrue(xtender.set_battery_charge_reference_current(12.0))
+        self.assertTrue(xtender.set_battery_charge_reference_current(12.0))
+        self.assertEqual((self.simulator.requests, xtender.savedWrites), (2, 0))
+
+        xtender.set_write_deadband('batteryChargeReferenceCurrent', 0.5)
+        self.assertTrue(xtender.set_battery_charge_reference_current(12.3))
+        self.assertEqual((self.simulator.requests, xtender.savedWrites), (2, 1))
+        self.assertEqual(xtender.get_battery_charge_reference_current(), 12.0)
+
+        self.assertTrue(xtender.set_battery_charge_reference_current(13.0))
+        self.assertEqual(self.device.get_parameter('batteryChargeReferenceCurrent'), 13.0)
+        self.assertEqual(self.simulator.requests, 3)
+
+        # Only values held by the parameter mirror are skipped
+        xtender.set_write_deadband('allowInverter', 0)
+        self.assertTrue(xtender._write_parameter_info('allowInverter', True))
+        self.assertTrue(xtender._write_parameter_info('allowInverter', True))
+        self.assertEqual((self.simulator.requests, xtender.savedWrites), (4, 2))
+
+        xtender.set_write_deadband('batteryChargeReferenceCurrent', None)
+        self.assertTrue(xtender.set_battery_charge_reference_current(13.0))
+        self.assertEqual(self.simulator.requests, 5)
+
+    def test_collapse(self):
+        """Writes queued while the parameter is written are collapsed into the newest one."""
+        self.simulator.latency = 0.1
+        results = []
+
+        def write(value):
+            results.append(self.xtender.set_battery_charge_reference_current(value))
+
+        threads = []
+        for value in (1.0, 2.0, 3.0):
+            threads.append(threading.Thread(target=write, args=(value, )))
+            threads[-1].start()
+            time.sleep(0.02)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [True] * 3)
+        self.assertEqual(self.simulator.requests, 2)
+        self.assertEqual(self.xtender.savedWrites, 1)
+        self.assertEqual(self.device.get_parameter('batteryChargeReferenceCurrent'), 3.0)
+        self.assertEqual(self.xtender.get_battery_charge_reference_current(), 3.0)
+        self.assertEqual(self.xtender._pendingWrites, {})
+
+    def test_leader_not_held_up(self):
+        """The first caller returns after its own write, not after the writes queued meanwhile."""
+        self.simulator.latency = 0.3
+        results = {}
+
+        def write(value):
+            start = time.monotonic()
+            success = self.xtender.set_battery_charge_reference_current(value)
+            results[value] = (success, time.monotonic() - start)
+
+        threads = [threading.Thread(target=write, args=(value, )) for value in (1.0, 2.0)]
+        threads[0].start()
+        time.sleep(0.05)
+        threads[1].start()
+        threads[0].join()
+        self.assertTrue(results[1.0][0])
+        self.assertLess(results[1.0][1], 0.5)        # Both writes take 0.6s at least
+
+        threads[1].join()
+        self.assertTrue(results[2.0][0])
+        self.assertEqual(self.simulator.requests, 2)
+        self.assertEqual(self.device.get_parameter('batteryChargeReferenceCurrent'), 2.0)
+        self.assertEqual(self.xtender._pendingWrites, {})
+
+    def test_queued_write_timeout(self):
+        """Writes queued behind a write never completing give up."""
+        from sino.scom.defines import PROPERTY_UNSAVED_VALUE_QSP
+        from sino.scom.device.scomdevice import _PendingWrite
+
+        self.scom.MUTEX_TIMEOUT = 0.1
+        # Write of another thread hanging
+        pending_write = _PendingWrite()
+        pending_write.written_timeout = 0.1
+        self.xtender._pendingWrites[('batteryChargeReferenceCurrent', PROPERTY_UNSAVED_VALUE_QSP)] = pending_write
+
+        start = time.monotonic()
+        self.assertFalse(self.xtender._write_parameter_info('batteryChargeReferenceCurrent', 5.0, timeout=0.1))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(self.simulator.requests, 0)
+
+if __name__ == '__main__':
+    unittest.main()